@@ -0,0 +1,57 @@
+"""Time rebuilding repeated field families as their counts grow
+
+Run with ``python benchmarks/bench_field_families.py``.  The time per repetition should stay roughly
+constant as the count grows; quadratic behavior shows up as a per-repetition time proportional to the count.
+"""
+
+import argparse
+import time
+
+import jbpy.core
+
+
+def time_xbands(count: int) -> float:
+    subheader = jbpy.core.ImageSubheader("subheader")
+    subheader["NBANDS"].value = 0
+    start = time.perf_counter()
+    subheader["XBANDS"].value = count
+    return time.perf_counter() - start
+
+
+def time_numi(count: int) -> float:
+    header = jbpy.core.FileHeader("FileHeader")
+    start = time.perf_counter()
+    header["NUMI"].value = count
+    return time.perf_counter() - start
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--xbands",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 99_999],
+        help="XBANDS values to time",
+    )
+    parser.add_argument(
+        "--numi",
+        type=int,
+        nargs="+",
+        default=[10, 100, 999],
+        help="NUMI values to time",
+    )
+    config = parser.parse_args(args)
+
+    print(f"{'field':<8}{'count':>8}{'total [s]':>12}{'per item [us]':>16}")
+    for name, func, counts in (
+        ("XBANDS", time_xbands, config.xbands),
+        ("NUMI", time_numi, config.numi),
+    ):
+        for count in counts:
+            elapsed = func(count)
+            print(f"{name:<8}{count:>8}{elapsed:>12.3f}{elapsed / count * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
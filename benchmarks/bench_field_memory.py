@@ -0,0 +1,50 @@
+"""Measure the memory used per field by large repeated field families
+
+Run with ``python benchmarks/bench_field_memory.py``.  Fields share their static description so the
+bytes per field should be dominated by the per-instance name and value.
+"""
+
+import argparse
+import tracemalloc
+
+import jbpy.core
+
+
+def measure_xbands(count: int) -> tuple[int, int]:
+    subheader = jbpy.core.ImageSubheader("subheader")
+    subheader["NBANDS"].value = 0
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        subheader["XBANDS"].value = count
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    num_fields = sum(isinstance(item, jbpy.core.Field) for item in subheader.values())
+    return after - before, num_fields
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--xbands",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 99_999],
+        help="XBANDS values to measure",
+    )
+    config = parser.parse_args(args)
+
+    print(
+        f"{'field':<8}{'count':>8}{'fields':>10}{'total [MiB]':>14}{'per field [B]':>16}"
+    )
+    for count in config.xbands:
+        nbytes, num_fields = measure_xbands(count)
+        print(
+            f"{'XBANDS':<8}{count:>8}{num_fields:>10}{nbytes / 2**20:>14.1f}"
+            f"{nbytes / num_fields:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
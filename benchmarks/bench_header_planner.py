@@ -0,0 +1,65 @@
+"""Time loading a many-segment file from simulated high-latency storage
+
+Run with ``python benchmarks/bench_header_planner.py``.  Each read of the simulated storage sleeps for
+``--latency`` seconds, like a request to object storage.  Buffered loading pays the latency once per
+subheader; planned loading fetches all of the subheaders concurrently.
+"""
+
+import argparse
+import io
+import time
+
+import jbpy.core
+
+
+class SlowFile(io.BytesIO):
+    def __init__(self, data: bytes, latency: float):
+        super().__init__(data)
+        self.latency = latency
+
+    def read(self, size=-1):
+        time.sleep(self.latency)
+        return super().read(size)
+
+    def pread(self, size: int, offset: int) -> bytes:
+        time.sleep(self.latency)
+        return self.getbuffer()[offset : offset + size].tobytes()
+
+
+def make_file(num_segments: int, data_size: int) -> bytes:
+    jbp = jbpy.core.Jbp()
+    jbp["FileHeader"]["NUMDES"].value = num_segments
+    for idx in range(1, num_segments + 1):
+        jbp["FileHeader"][f"LD{idx:03d}"].value = data_size
+    jbp.finalize()
+    buf = io.BytesIO()
+    jbp.dump(buf)
+    buf.seek(jbp["FileHeader"]["FL"].value - 1)
+    buf.write(b"\0")
+    return buf.getvalue()
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=999, help="number of DES")
+    parser.add_argument(
+        "--data-size", type=int, default=100_000, help="bytes of data per DES"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.01, help="seconds per storage read"
+    )
+    parser.add_argument("--max-workers", type=int, default=32)
+    config = parser.parse_args(args)
+
+    data = make_file(config.segments, config.data_size)
+    for name, kwargs in (
+        ("buffered", {"buffered": True}),
+        ("planned", {"max_workers": config.max_workers}),
+    ):
+        start = time.perf_counter()
+        jbpy.core.Jbp().load(SlowFile(data, config.latency), **kwargs)
+        print(f"{name:<10}{time.perf_counter() - start:>10.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare the cost of probing a file's header with loading it
+
+Run with ``python benchmarks/bench_probe.py``.  Writes a file with ``--segments`` data extension segments and
+times `jbpy.probe` against a buffered `Jbp.load` of the same file, as when triaging an archive.
+"""
+
+import argparse
+import pathlib
+import tempfile
+import time
+
+import jbpy
+import jbpy.core
+
+
+def make_file(path: pathlib.Path, num_segments: int) -> None:
+    jbp = jbpy.core.Jbp()
+    jbp["FileHeader"]["NUMDES"].value = num_segments
+    for idx in range(1, num_segments + 1):
+        jbp["FileHeader"][f"LD{idx:03d}"].value = 1
+    jbp.finalize()
+    with path.open("wb") as file:
+        jbp.dump(file)
+
+
+def load(path: pathlib.Path) -> jbpy.Jbp:
+    with path.open("rb") as file:
+        return jbpy.Jbp().load(file, buffered=True)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=5, help="number of DES")
+    parser.add_argument("--repeat", type=int, default=200)
+    config = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir) / "probe.ntf"
+        make_file(path, config.segments)
+        timings = {}
+        for name, func in (
+            ("probe", lambda: jbpy.probe(path)),
+            ("load", lambda: load(path)),
+        ):
+            start = time.perf_counter()
+            for _ in range(config.repeat):
+                func()
+            timings[name] = (time.perf_counter() - start) / config.repeat
+            print(f"{name:<10}{timings[name] * 1e6:>10.1f} us")
+        print(f"speedup   {timings['load'] / timings['probe']:>10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
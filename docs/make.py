@@ -23,6 +23,7 @@ def create_api_doc():
         "jbpy",
         "jbpy.core",
         "jbpy.image_data",
+        "jbpy.io",
     ]
     pdoc.pdoc(*modules, output_directory=out)
 
@@ -1,15 +1,29 @@
 from .core import (
     Jbp,
+    StreamWriter,
+    aload,
     available_des_subheaders,
     available_tres,
     des_subheader_factory,
+    probe,
+    register_des_subheader,
+    register_tre,
     tre_factory,
+    unregister_des_subheader,
+    unregister_tre,
 )
 
 __all__ = [
     "Jbp",
+    "StreamWriter",
+    "aload",
     "available_des_subheaders",
     "available_tres",
     "des_subheader_factory",
+    "probe",
+    "register_des_subheader",
+    "register_tre",
     "tre_factory",
+    "unregister_des_subheader",
+    "unregister_tre",
 ]
@@ -1,9 +1,9 @@
 import argparse
 import os
-import shutil
 import sys
 
 import jbpy
+import jbpy.io
 
 try:
     from smart_open import open
@@ -11,6 +11,13 @@ except ImportError:
     pass
 
 
+def _copy(src, dst, bufsize=1024 * 1024):
+    """Copy src to dst through a single preallocated buffer"""
+    with memoryview(bytearray(bufsize)) as buf:
+        while num_read := src.readinto(buf):
+            dst.write(buf[:num_read])
+
+
 def main(args=None):
     parser = argparse.ArgumentParser(
         description="Extract raw byte data from a JBP file"
@@ -27,7 +34,7 @@ def main(args=None):
 
     jbp = jbpy.Jbp()
     with open(config.filename, "rb") as infile:
-        jbp.load(infile)
+        jbp.load(jbpy.io.CachedRangeReader(infile), lazy=True)
 
         if config.image_segment is not None:
             srcfilobj = jbp["ImageSegments"][config.image_segment]["Data"].as_filelike(
@@ -51,7 +58,7 @@ def main(args=None):
             ]["RESDATA"].as_filelike(infile)
 
         try:
-            shutil.copyfileobj(srcfilobj, sys.stdout.buffer)
+            _copy(srcfilobj, sys.stdout.buffer)
         except BrokenPipeError:
             devnull = os.open(os.devnull, os.O_WRONLY)
             os.dup2(devnull, sys.stdout.fileno())
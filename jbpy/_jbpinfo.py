@@ -3,6 +3,7 @@ import os
 import sys
 
 import jbpy
+import jbpy.io
 
 try:
     from smart_open import open
@@ -23,7 +24,7 @@ def main(args=None):
 
     jbp = jbpy.Jbp()
     with open(config.filename, "rb") as file:
-        jbp.load(file)
+        jbp.load(jbpy.io.CachedRangeReader(file), buffered=True)
 
     try:
         if "json" in config.format:
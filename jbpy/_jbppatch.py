@@ -0,0 +1,103 @@
+import argparse
+import concurrent.futures
+import sys
+
+import jbpy
+import jbpy.core
+
+
+def parse_assignment(text):
+    path, sep, value = text.partition("=")
+    if not sep or not path:
+        raise argparse.ArgumentTypeError(f"expected PATH=VALUE, got {text!r}")
+    return path.strip("/").split("/"), value
+
+
+def resolve(component, path):
+    """Yield every field matched by ``path``, where ``*`` matches each child of a list"""
+    if not path:
+        if not isinstance(component, jbpy.core.Field):
+            raise KeyError(f"{component.name} is not a field")
+        yield component
+        return
+    part, rest = path[0], path[1:]
+    if part == "*":
+        for index in range(len(component)):
+            yield from resolve(component[index], rest)
+    else:
+        yield from resolve(component[int(part) if part.isdigit() else part], rest)
+
+
+def convert(field, text):
+    """Decoded value of ``field`` given as ``text`` on the command line"""
+    converter = field.schema.converter
+    if isinstance(converter, jbpy.core.Integer):
+        try:
+            return int(text)
+        except ValueError:
+            raise ValueError(
+                f"{field.name} requires an integer, got {text!r}"
+            ) from None
+    if isinstance(
+        converter,
+        (jbpy.core.StringAscii, jbpy.core.StringISO8859_1, jbpy.core.StringUtf8),
+    ):
+        return text
+    raise ValueError(
+        f"{field.name} holds {type(converter).__name__} values, which cannot be set from the command line"
+    )
+
+
+def patch_file(filename, assignments):
+    with open(filename, "r+b") as file:
+        jbp = jbpy.Jbp().load(file, lazy=True)
+        for path, value in assignments:
+            for field in resolve(jbp, path):
+                field.value = convert(field, value)
+        return jbp.patch_in_place(file)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Modify JBP header fields in place without rewriting the files"
+    )
+    parser.add_argument("filenames", nargs="+", help="Paths to JBP files")
+    parser.add_argument(
+        "--set",
+        dest="assignments",
+        metavar="PATH=VALUE",
+        type=parse_assignment,
+        action="append",
+        required=True,
+        help="Field to modify, e.g. FileHeader/FSCLAS=U or ImageSegments/*/subheader/ISCLAS=U."
+        "  May be repeated",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files to patch concurrently in separate processes",
+    )
+    config = parser.parse_args(args)
+
+    if config.jobs > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(config.jobs)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+    failures = 0
+    with executor:
+        futures = {
+            executor.submit(patch_file, filename, config.assignments): filename
+            for filename in config.filenames
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:
+                failures += 1
+                print(f"{futures[future]}: {exc}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
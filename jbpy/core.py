@@ -13,17 +13,28 @@ types (int, str, etc...) and serializes to the BIIF format behind the scenes.
 """
 
 import abc
+import array
+import asyncio
 import collections.abc
+import concurrent.futures
+import contextlib
+import contextvars
 import copy
+import dataclasses
 import datetime
+import functools
 import importlib.metadata
 import io
+import itertools
 import json
 import logging
+import operator
 import os
 import re
+import threading
+import weakref
 from collections.abc import Callable, Iterable
-from typing import Any, Final, Iterator, Literal, Self
+from typing import Any, AsyncIterator, Final, Iterator, Literal, Self
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +47,8 @@ class BinaryFile_R:
     @abc.abstractmethod
     def seek(self, __offset: int, __whence: int = ...) -> int: ...
     @abc.abstractmethod
+    def tell(self) -> int: ...
+    @abc.abstractmethod
     def read(self, __length: int = ...) -> bytes: ...
 
 
@@ -43,16 +56,250 @@ class BinaryFile_RW(BinaryFile_R):
     """Binary file-like object supporting reading and writing"""
 
     @abc.abstractmethod
-    def write(self, __data: bytes) -> int: ...
+    def write(self, __data: bytes | bytearray | memoryview) -> int: ...
+
+
+class AsyncRangeReader:
+    """Object supporting asynchronous reads of byte ranges, e.g. an HTTP client issuing Range requests
+
+    ``read_range`` returns fewer than `length` bytes only at the end of the file.
+    """
+
+    @abc.abstractmethod
+    async def read_range(self, __offset: int, __length: int) -> bytes: ...
+
+
+class _BufferFile(BinaryFile_R):
+    """Read-only file-like view of a bytes-like object such as `bytes`, `memoryview` or `mmap.mmap`
+
+    Reads return copies of just the requested bytes; `getbuffer` returns the underlying view.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        Object supporting the buffer protocol
+    """
+
+    def __init__(self, buffer: Any):
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
 
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            new_pos = int(offset)
+        elif whence == os.SEEK_CUR:
+            new_pos = self._pos + int(offset)
+        elif whence == os.SEEK_END:
+            new_pos = len(self._view) + int(offset)
+        else:
+            raise ValueError(f"whence value {whence} unsupported")
+        if new_pos < 0:
+            raise OSError("Seek before start of buffer.")
+        self._pos = new_pos
+        return self._pos
 
-class SubFile:
+    def tell(self) -> int:
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        stop = len(self._view) if size is None or size < 0 else self._pos + size
+        data = bytes(self._view[self._pos : stop])
+        self._pos += len(data)
+        return data
+
+    def readinto(self, b) -> int:
+        dest = memoryview(b).cast("B")
+        chunk = self._view[self._pos : self._pos + len(dest)]
+        dest[: len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+    def readline(self, size: int = -1) -> bytes:
+        stop = len(self._view) if size is None or size < 0 else self._pos + size
+        data = bytes(self._view[self._pos : stop])
+        newline = data.find(b"\n")
+        if newline >= 0:
+            data = data[: newline + 1]
+        self._pos += len(data)
+        return data
+
+    def readable(self) -> bool:
+        return True
+
+    def getbuffer(self) -> memoryview:
+        return self._view
+
+    def pread(self, size: int, offset: int) -> bytes:
+        return bytes(self._view[offset : offset + size])
+
+    def span(self, start: int, stop: int) -> bytes:
+        """Copy of the bytes at ``[start, stop)``, which must already be in memory"""
+        return bytes(self._view[start:stop])
+
+    def preadinto(self, b, offset: int) -> int:
+        dest = memoryview(b).cast("B")
+        chunk = self._view[offset : offset + len(dest)]
+        dest[: len(chunk)] = chunk
+        return len(chunk)
+
+
+# serializes the seek, read and restore used where os.pread is unavailable (e.g. Windows)
+_PREAD_FALLBACK_LOCK: Final = threading.Lock()
+
+
+class PositionalReader(BinaryFile_R):
+    """Read-only file-like object which reads an OS-level file with positional reads
+
+    Reads use `os.pread`/`os.preadv` and never move the shared file position, so any number of
+    readers, and `SubFile` objects created from them, can read one open file from concurrent threads.
+    Each reader keeps its own position for ``read``/``seek``/``tell``; `pread` and `preadinto` take
+    an explicit offset and do not use it.
+
+    Parameters
+    ----------
+    file : int or file-like
+        A file descriptor or an object with a ``fileno`` method.  It must stay open while the reader
+        is used.
+    """
+
+    def __init__(self, file: Any):
+        self._fd = file if isinstance(file, int) else file.fileno()
+        self._pos = 0
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            new_pos = int(offset)
+        elif whence == os.SEEK_CUR:
+            new_pos = self._pos + int(offset)
+        elif whence == os.SEEK_END:
+            new_pos = os.fstat(self._fd).st_size + int(offset)
+        else:
+            raise ValueError(f"whence value {whence} unsupported")
+        if new_pos < 0:
+            raise OSError("Seek before start of file.")
+        self._pos = new_pos
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = max(os.fstat(self._fd).st_size - self._pos, 0)
+        data = self.pread(size, self._pos)
+        self._pos += len(data)
+        return data
+
+    def readinto(self, b) -> int:
+        num_read = self.preadinto(b, self._pos)
+        self._pos += num_read
+        return num_read
+
+    def readline(self, size: int = -1) -> bytes:
+        line = _preadline(self, size, self._pos)
+        self._pos += len(line)
+        return line
+
+    def readable(self) -> bool:
+        return True
+
+    def pread(self, size: int, offset: int) -> bytes:
+        """Read up to `size` bytes starting at `offset` without using or changing any file position
+
+        Parameters
+        ----------
+        size : int
+            Number of bytes to read
+        offset : int
+            Absolute offset in the file
+
+        Returns
+        -------
+        bytes
+            Data read; shorter than `size` only at the end of the file
+        """
+        chunks = []
+        while size > 0:
+            if hasattr(os, "pread"):
+                chunk = os.pread(self._fd, size, offset)
+            else:
+                with _PREAD_FALLBACK_LOCK:
+                    previous = os.lseek(self._fd, 0, os.SEEK_CUR)
+                    try:
+                        os.lseek(self._fd, offset, os.SEEK_SET)
+                        chunk = os.read(self._fd, size)
+                    finally:
+                        os.lseek(self._fd, previous, os.SEEK_SET)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+            offset += len(chunk)
+        return b"".join(chunks)
+
+    def preadinto(self, b, offset: int) -> int:
+        """Read into a writable buffer starting at `offset` without using or changing any file position
+
+        Parameters
+        ----------
+        b : bytes-like
+            Writable buffer to fill
+        offset : int
+            Absolute offset in the file
+
+        Returns
+        -------
+        int
+            Number of bytes read; less than the size of `b` only at the end of the file
+        """
+        dest = memoryview(b).cast("B")
+        if not hasattr(os, "preadv"):
+            data = self.pread(len(dest), offset)
+            dest[: len(data)] = data
+            return len(data)
+
+        total = 0
+        while total < len(dest):
+            num_read = os.preadv(self._fd, [dest[total:]], offset + total)
+            if not num_read:
+                break
+            total += num_read
+        return total
+
+
+def _preadline(file: Any, size: int, offset: int, chunk_size: int = 8192) -> bytes:
+    """Read a line from a file supporting ``pread`` starting at `offset`, stopping after `size` bytes"""
+    line = b""
+    while size < 0 or len(line) < size:
+        want = chunk_size if size < 0 else min(chunk_size, size - len(line))
+        chunk = file.pread(want, offset + len(line))
+        newline = chunk.find(b"\n")
+        if newline >= 0:
+            return line + chunk[: newline + 1]
+        line += chunk
+        if len(chunk) < want:
+            break
+    return line
+
+
+class SubFile(io.RawIOBase):
     """File-like object mapping to a contiguous subset of another file-like object
 
+    If `file` supports positional reads (e.g. a `PositionalReader`) the subfile never seeks it, so
+    subfiles of the same file can be read from concurrent threads.  Otherwise each read seeks `file`.
+
+    Being a raw I/O object, a subfile can be wrapped in `io.BufferedReader` for read-ahead.  Closing a
+    subfile does not close `file`.  `fileno` is not supported because the descriptor would expose
+    the entire file; use `offset` with the underlying file instead.
+
     Parameters
     ----------
-    file : file-like
-        An open file object.  Must be binary.
+    file : file-like or bytes-like
+        An open file object.  Must be binary.  Objects supporting the buffer protocol but not ``read``
+        (e.g. `bytes` or `memoryview`) are read in place.
     start : int
         Start byte offset of the subfile
     length : int
@@ -60,11 +307,28 @@ class SubFile:
     """
 
     def __init__(self, file: Any, start: int, length: int):
+        if not hasattr(file, "read"):
+            file = _BufferFile(file)
+        super().__init__()
         self._file = file
         self._start = int(start)
         self._length = int(length)
         self._pos = 0  # position within the subfile
 
+    @property
+    def offset(self) -> int:
+        """Offset of the start of the subfile within the underlying file"""
+        return self._start
+
+    @property
+    def length(self) -> int:
+        """Number of bytes in the subfile"""
+        return self._length
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
     def seek(self, offset: int, whence: int = 0) -> int:
         """
         Seek to a position within the subfile.
@@ -93,13 +357,18 @@ class SubFile:
         if new_pos < 0:
             raise OSError("Seek before start of subfile.")
 
+        self._check_open()
         self._pos = new_pos
         return self._pos
 
     def tell(self) -> int:
         """Return the current position within the subfile."""
+        self._check_open()
         return self._pos
 
+    def seekable(self) -> bool:
+        return True
+
     def read(self, size: int = -1) -> bytes:
         """
         Read data from the subfile.
@@ -109,44 +378,65 @@ class SubFile:
         size : int
             Number of bytes to read, or -1 for all remaining
         """
+        self._check_open()
         if self._pos >= self._length:
             return b""
 
         read_len = (
             self._length - self._pos
-            if size < 0
+            if size is None or size < 0
             else min(size, self._length - self._pos)
         )
-        self._file.seek(self._start + self._pos)
-        data = self._file.read(read_len)
+        if hasattr(self._file, "pread"):
+            data = self._file.pread(read_len, self._start + self._pos)
+        else:
+            self._file.seek(self._start + self._pos)
+            data = self._file.read(read_len)
         self._pos += len(data)
         return data
 
+    def readall(self) -> bytes:
+        return self.read()
+
     def readinto(self, b) -> int | None:
+        self._check_open()
         if self._pos >= self._length:
             return 0
-        self._file.seek(self._start + self._pos)
         bytes_remaining = self._length - self._pos
-        v = memoryview(b)
-        num_read = self._file.readinto(v[:bytes_remaining])
+        v = memoryview(b).cast("B")[:bytes_remaining]
+        if hasattr(self._file, "preadinto"):
+            num_read = self._file.preadinto(v, self._start + self._pos)
+        else:
+            self._file.seek(self._start + self._pos)
+            if hasattr(self._file, "readinto"):
+                num_read = self._file.readinto(v)
+            else:
+                data = self._file.read(len(v))
+                num_read = len(data)
+                v[:num_read] = data
         if num_read is not None:
             self._pos += num_read
         return num_read
 
     def readline(self, size=-1) -> bytes:
+        self._check_open()
         if self._pos >= self._length:
             return b""
-        self._file.seek(self._start + self._pos)
         bytes_remaining = self._length - self._pos
-        _sz = bytes_remaining if size == -1 else min(bytes_remaining, size)
-        data = self._file.readline(_sz)
+        _sz = (
+            bytes_remaining if size is None or size < 0 else min(bytes_remaining, size)
+        )
+        if hasattr(self._file, "pread"):
+            data = _preadline(self._file, _sz, self._start + self._pos)
+        else:
+            self._file.seek(self._start + self._pos)
+            data = self._file.readline(_sz)
         self._pos += len(data)
         return data
 
     def readlines(self, hint=-1) -> list[bytes]:
         if self._pos >= self._length:
             return []
-        self._file.seek(self._start + self._pos)
         line = self.readline()
         n = len(line)
         lines = [line]
@@ -161,9 +451,526 @@ class SubFile:
     def readable(self) -> bool:
         return self._file.readable()
 
+    def getbuffer(self) -> memoryview:
+        """Return a view of the subfile's bytes without copying them
+
+        Requires a file which exposes its contents as a buffer, such as `io.BytesIO`, `mmap.mmap`
+        or a bytes-like object.
+
+        Returns
+        -------
+        memoryview
+            View of the bytes from the start to the end of the subfile
+        """
+        getbuffer = getattr(self._file, "getbuffer", None)
+        view = getbuffer() if getbuffer is not None else memoryview(self._file)
+        return view[self._start : self._start + self._length]
+
+
+class AsyncSubFile:
+    """Asynchronous file-like object mapping to a contiguous subset of an `AsyncRangeReader`
+
+    Each ``read`` awaits a single ``read_range`` call.
+
+    Parameters
+    ----------
+    reader : AsyncRangeReader
+        Object with an ``async read_range(offset, length)`` method
+    start : int
+        Start byte offset of the subfile
+    length : int
+        Number of bytes to expose from the start
+    """
+
+    def __init__(self, reader: AsyncRangeReader, start: int, length: int):
+        self._reader = reader
+        self._start = int(start)
+        self._length = int(length)
+        self._pos = 0  # position within the subfile
+
+    @property
+    def offset(self) -> int:
+        """Offset of the start of the subfile within the underlying file"""
+        return self._start
+
+    @property
+    def length(self) -> int:
+        """Number of bytes in the subfile"""
+        return self._length
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """
+        Seek to a position within the subfile.
+
+        Parameters
+        ----------
+        offset : int
+            Offset to seek
+        whence : int
+            0 (start), 1 (current), or 2 (end of subfile)
+
+        Returns
+        -------
+        int
+            Current offset in the AsyncSubFile
+        """
+        if whence == 0:
+            new_pos = int(offset)
+        elif whence == 1:
+            new_pos = self._pos + int(offset)
+        elif whence == 2:
+            new_pos = self._length + int(offset)
+        else:
+            raise ValueError(f"whence value {whence} unsupported")
+
+        if new_pos < 0:
+            raise OSError("Seek before start of subfile.")
+        self._pos = new_pos
+        return self._pos
+
+    def tell(self) -> int:
+        """Return the current position within the subfile."""
+        return self._pos
+
+    async def read(self, size: int = -1) -> bytes:
+        """
+        Read data from the subfile.
+
+        Parameters
+        ----------
+        size : int
+            Number of bytes to read, or -1 for all remaining
+        """
+        if self._pos >= self._length:
+            return b""
+        read_len = (
+            self._length - self._pos
+            if size is None or size < 0
+            else min(size, self._length - self._pos)
+        )
+        data = await self._reader.read_range(self._start + self._pos, read_len)
+        self._pos += len(data)
+        return data
+
+    async def iter_chunks(self, chunk_size: int = 1 << 20) -> AsyncIterator[bytes]:
+        """Read the rest of the subfile in chunks
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Maximum number of bytes in each chunk
+
+        Yields
+        ------
+        bytes
+            Consecutive chunks of the subfile
+        """
+        while chunk := await self.read(chunk_size):
+            yield chunk
+
+
+# ranges separated by at most this many bytes are read together
+_COALESCE_GAP: Final = 64 * 1024
+
+
+def _coalesce_ranges(
+    ranges: Iterable[tuple[int, int]], max_gap: int
+) -> list[tuple[int, int]]:
+    """Merge sorted (offset, length) ranges separated by no more than `max_gap` bytes"""
+    merged: list[tuple[int, int]] = []
+    for offset, length in ranges:
+        if merged and offset - sum(merged[-1]) <= max_gap:
+            merged[-1] = (
+                merged[-1][0],
+                max(sum(merged[-1]), offset + length) - merged[-1][0],
+            )
+        else:
+            merged.append((offset, length))
+    return merged
+
+
+def _copy_fds(src_fd: int, offset: int, dst_fd: int, dst_offset: int, size: int) -> int:
+    """Copy between file descriptors in the kernel, returning the number of bytes copied"""
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                count = os.copy_file_range(
+                    src_fd, dst_fd, size - copied, offset + copied, dst_offset + copied
+                )
+                if not count:
+                    return copied
+                copied += count
+            return copied
+        except OSError:
+            pass  # e.g. unsupported by the filesystems; try sendfile
+    if hasattr(os, "sendfile"):
+        try:
+            os.lseek(dst_fd, dst_offset + copied, os.SEEK_SET)
+            while copied < size:
+                count = os.sendfile(dst_fd, src_fd, offset + copied, size - copied)
+                if not count:
+                    break
+                copied += count
+        except OSError:
+            pass
+    return copied
+
+
+def _copy_range(
+    src: Any, offset: int, dst: Any, size: int, bufsize: int = 1024 * 1024
+) -> None:
+    """Copy `size` bytes at `offset` of `src` to the current position of `dst`
+
+    Regular files are copied by the kernel when possible, otherwise through a single preallocated
+    buffer.  If `src` ends early the rest of the range is sought past.
+    """
+    dst_start = dst.tell()
+    copied = 0
+    try:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+    except (AttributeError, OSError):  # io.UnsupportedOperation is an OSError
+        pass
+    else:
+        dst.flush()
+        copied = _copy_fds(src_fd, offset, dst_fd, dst_start, size)
+    dst.seek(dst_start + copied)
+
+    with memoryview(bytearray(min(bufsize, size - copied))) as buf:
+        while copied < size:
+            chunk = buf[: size - copied]
+            if hasattr(src, "preadinto"):
+                num_read = src.preadinto(chunk, offset + copied)
+            else:
+                src.seek(offset + copied)
+                num_read = src.readinto(chunk)
+            if not num_read:
+                break
+            dst.write(chunk[:num_read])
+            copied += num_read
+    dst.seek(dst_start + size)
+
+
+class _PrefetchedFile:
+    """Read-only file-like view of ``file`` with the bytes at ``[start, start + len(data))`` already in memory
+
+    Positions are absolute offsets in ``file``.  Reads that fall outside of the prefetched bytes are
+    forwarded to ``file`` so that parsing still succeeds when a declared length is wrong.
+
+    Parameters
+    ----------
+    file : file-like
+        Binary file-like object the data was read from
+    start : int
+        Offset of ``data`` within ``file``
+    data : bytes-like
+        Prefetched contents of ``file`` starting at ``start``
+    """
+
+    def __init__(self, file: Any, start: int, data: bytes):
+        self._file = file
+        self._start = start
+        self._data = data
+        self._pos = start
+        self._file_pos: int | None = None  # position of ``file``, if known
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            self._pos = int(offset)
+        elif whence == os.SEEK_CUR:
+            self._pos += int(offset)
+        elif whence == os.SEEK_END:
+            self._pos = self._file_pos = self._file.seek(offset, os.SEEK_END)
+        else:
+            raise ValueError(f"whence value {whence} unsupported")
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        rel_pos = self._pos - self._start
+        chunk = b""
+        if 0 <= rel_pos < len(self._data):
+            stop = len(self._data) if size < 0 else rel_pos + size
+            chunk = self._data[rel_pos:stop]
+            self._pos += len(chunk)
+
+        if size < 0 or len(chunk) < size:
+            if self._file_pos != self._pos:
+                self._file.seek(self._pos)
+            rest = self._file.read(size if size < 0 else size - len(chunk))
+            self._pos += len(rest)
+            self._file_pos = self._pos
+            chunk += rest
+        return chunk
+
+    def peek(self, size: int) -> bytes:
+        """Return the next `size` bytes without advancing the position"""
+        pos = self._pos
+        data = self.read(size)
+        self._pos = pos
+        return data
+
+    def sync(self) -> None:
+        """Seek ``file`` to the current position unless it is already there"""
+        if self._file_pos != self._pos:
+            self._file.seek(self._pos)
+            self._file_pos = self._pos
+
+    def span(self, start: int, stop: int) -> bytes | None:
+        """Copy of the bytes at ``[start, stop)`` if they are all in memory, otherwise None"""
+        if self._start <= start <= stop <= self._start + len(self._data):
+            return bytes(self._data[start - self._start : stop - self._start])
+        file_span = getattr(self._file, "span", None)
+        return None if file_span is None else file_span(start, stop)
+
+
+def _peek(fd: BinaryFile_R, size: int) -> tuple[bytes, _PrefetchedFile]:
+    """Look ahead at the next `size` bytes of `fd` without consuming them
+
+    Returns the bytes and a cursor, at the current position of `fd`, to continue parsing from.  The
+    cursor serves the bytes from memory so they are never read twice or sought back to.  If the
+    cursor is not `fd`, call its ``sync`` method when done to move `fd` to the cursor's position.
+    """
+    if isinstance(fd, _PrefetchedFile):
+        return fd.peek(size), fd
+    start = fd.tell()
+    data = fd.read(size)
+    cursor = _PrefetchedFile(fd, start, data)
+    cursor._file_pos = start + len(data)
+    return data, cursor
+
+
+class _MissingRange(Exception):
+    """Raised by `_FetchedRanges` when a read needs bytes which have not been fetched"""
+
+    def __init__(self, offset: int, size: int):
+        super().__init__(f"{size} bytes at offset {offset} have not been fetched")
+        self.offset = offset
+        self.size = size
+
 
-class PythonConverter(abc.ABC):
-    """Abstract base class for converting between JBP field bytes and python types"""
+class _FetchedRanges(BinaryFile_R):
+    """Read-only file-like object over the byte ranges of a file which have been fetched so far
+
+    Allows the synchronous parsers to run on data fetched asynchronously: a read which is not covered
+    by a single fetched range raises `_MissingRange` so the caller can fetch it and parse again.
+    """
+
+    def __init__(self) -> None:
+        self._ranges: list[tuple[int, bytes]] = []
+        self._size: int | None = None  # known once a fetch comes up short
+        self._pos = 0
+
+    def add(self, offset: int, data: bytes, requested: int) -> None:
+        """Add `data` fetched from `offset`, which ends the file if shorter than `requested`"""
+        self._ranges.append((offset, data))
+        if len(data) < requested:
+            self._size = offset + len(data)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            self._pos = int(offset)
+        elif whence == os.SEEK_CUR:
+            self._pos += int(offset)
+        else:
+            raise ValueError(f"whence value {whence} unsupported")
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def pread(self, size: int, offset: int) -> bytes:
+        if size < 0:
+            raise io.UnsupportedOperation("reads must have a size")
+        end = offset + size
+        if self._size is not None:
+            end = min(end, self._size)
+        if end <= offset:
+            return b""
+        for start, data in self._ranges:
+            if start <= offset and end <= start + len(data):
+                return data[offset - start : end - start]
+        raise _MissingRange(offset, end - offset)
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.pread(size, self._pos)
+        self._pos += len(data)
+        return data
+
+
+class _ForwardReader(BinaryFile_R):
+    """Forward-only file-like view of a non-seekable stream such as a pipe, socket or stdin
+
+    Bytes read from the stream are kept until `release` so they can be read again; seeking anywhere
+    at or after the start of the kept bytes is allowed.  Positions are relative to the point where the
+    stream was wrapped.
+    """
+
+    def __init__(self, stream: Any):
+        self._stream = stream
+        self._buffer = bytearray()
+        self._buffer_start = 0  # stream offset of the first kept byte
+        self._pos = 0
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            new_pos = int(offset)
+        elif whence == os.SEEK_CUR:
+            new_pos = self._pos + int(offset)
+        else:
+            raise ValueError(f"whence value {whence} unsupported")
+        if new_pos < self._buffer_start:
+            raise io.UnsupportedOperation(
+                f"cannot seek to released offset {new_pos} of a non-seekable stream"
+            )
+        self._pos = new_pos
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def _fill(self, end: int) -> None:
+        """Read from the stream until the kept bytes reach `end` or the stream ends"""
+        while self._buffer_start + len(self._buffer) < end:
+            chunk = self._stream.read(end - self._buffer_start - len(self._buffer))
+            if not chunk:
+                break
+            self._buffer += chunk
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            raise io.UnsupportedOperation(
+                "reads of a non-seekable stream must have a size"
+            )
+        self._fill(self._pos + size)
+        rel_pos = self._pos - self._buffer_start
+        data = bytes(self._buffer[rel_pos : rel_pos + size])
+        self._pos += len(data)
+        return data
+
+    def release(self, offset: int) -> None:
+        """Discard the kept bytes before `offset`; seeking before it is no longer possible"""
+        drop = min(offset - self._buffer_start, len(self._buffer))
+        if drop > 0:
+            del self._buffer[:drop]
+            self._buffer_start += drop
+
+    def iter_range(
+        self, offset: int, length: int, chunk_size: int
+    ) -> Iterator[tuple[int, bytes]]:
+        """Yield the offset and bytes of consecutive chunks of ``[offset, offset + length)``
+
+        Bytes before each chunk are released.  Stops early if the stream ends.
+        """
+        end = offset + length
+        while offset < end:
+            self.release(offset)
+            self.seek(offset)
+            chunk = self.read(min(chunk_size, end - offset))
+            if not chunk:
+                break
+            yield offset, chunk
+            offset += len(chunk)
+        self.release(offset)
+
+
+_MUTABLE: Final = frozenset({list, set, dict})
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable equivalent of a constructor argument, e.g. a tuple in place of a list"""
+    if isinstance(value, (list, tuple)):
+        if _MUTABLE.isdisjoint(map(type, value)):
+            return tuple(value)
+        return tuple(map(_freeze, value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(_freeze, value))
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+_UNFROZEN: Final = object()  # key of a _ValueObject whose __init__ has not finished
+
+
+class _ValueMeta(abc.ABCMeta):
+    """Metaclass which records the arguments each instance was constructed with, then freezes it"""
+
+    def __call__(cls, *args, **kwargs):
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "_key", _UNFROZEN)
+        instance.__init__(*args, **kwargs)
+        if kwargs:
+            key: Any = _freeze((cls, args, kwargs))
+        elif args:
+            key = (cls, args if _MUTABLE.isdisjoint(map(type, args)) else _freeze(args))
+        else:
+            key = cls
+        instance._freeze_key(key)
+        return instance
+
+
+class _ValueObject(metaclass=_ValueMeta):
+    """Immutable object which compares equal to others of its class constructed with equal arguments
+
+    Objects whose arguments cannot be hashed are only equal to themselves.
+    """
+
+    __slots__ = ("_key", "_hash")
+    _key: Any
+    _hash: int
+
+    def _freeze_key(self, key: Any) -> None:
+        try:
+            key_hash = hash(key)
+        except TypeError:
+            key = None
+        if key is None:
+            key_hash = object.__hash__(self)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", key_hash)
+
+    def __setattr__(self, name, value):
+        if self._key is not _UNFROZEN:
+            raise AttributeError(f"{type(self).__name__} objects are immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, _ValueObject):
+            return NotImplemented
+        return self._key is not None and self._key == other._key
+
+    def __hash__(self):
+        return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __setstate__(self, state):
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        for name, value in {**(dict_state or {}), **(slot_state or {})}.items():
+            object.__setattr__(self, name, value)
+        # hashes of strings differ between processes
+        self._freeze_key(self._key)
+
+
+class PythonConverter(_ValueObject, abc.ABC):
+    """Abstract base class for converting between JBP field bytes and python types
+
+    Converters are immutable and compare equal when constructed with equal arguments.
+    """
+
+    __slots__ = ()
 
     def to_bytes(self, decoded_value: Any, size: int) -> bytes:
         """Convert python type to bytes
@@ -198,6 +1005,8 @@ class PythonConverter(abc.ABC):
 class StringUtf8(PythonConverter):
     """Convert to/from UTF-8 str"""
 
+    __slots__ = ()
+
     def to_bytes_impl(self, decoded_value: str, size: int) -> bytes:
         return decoded_value.encode().ljust(size)
 
@@ -208,6 +1017,8 @@ class StringUtf8(PythonConverter):
 class StringAscii(PythonConverter):
     """Convert to/from ASCII str"""
 
+    __slots__ = ()
+
     def to_bytes_impl(self, decoded_value: str, size: int) -> bytes:
         return decoded_value.encode("ascii").ljust(size)
 
@@ -224,6 +1035,8 @@ class StringISO8859_1(PythonConverter):  # noqa: N801
     happens to match ISO 8859 part 1.
     """
 
+    __slots__ = ()
+
     def to_bytes_impl(self, decoded_value: str, size: int) -> bytes:
         return decoded_value.encode("iso8859_1").ljust(size)
 
@@ -234,6 +1047,8 @@ class StringISO8859_1(PythonConverter):  # noqa: N801
 class IntPair(PythonConverter):
     """convert to/from two int tuple"""
 
+    __slots__ = ()
+
     def to_bytes_impl(self, decoded_value: tuple[int, int], size: int) -> bytes:
         if (size < 2) or (size % 2):
             raise ValueError(f"invalid {size=}; must be positive and even")
@@ -248,6 +1063,8 @@ class IntPair(PythonConverter):
 class Bytes(PythonConverter):
     """Convert to/from bytes"""
 
+    __slots__ = ()
+
     def to_bytes_impl(self, decoded_value: bytes, size: int) -> bytes:
         if len(decoded_value) < size:
             raise ValueError(f"{len(decoded_value)=} must be at least {size=}")
@@ -271,6 +1088,8 @@ class Integer(PythonConverter):
         * space: a leading space should be used for positive and a minus sign on negative numbers
     """
 
+    __slots__ = ("sign",)
+
     def __init__(self, sign: Literal["+", "-", " "] = "-"):
         self.sign = sign
 
@@ -285,6 +1104,8 @@ class Integer(PythonConverter):
 class RGB(PythonConverter):
     """convert to/from three int tuple"""
 
+    __slots__ = ()
+
     def to_bytes_impl(self, decoded_value: tuple[int, int, int], size: int) -> bytes:
         assert size == 3
         return (
@@ -319,8 +1140,13 @@ U8 = "\x00-\xff"
 BCSA_SPACE = ECSA_SPACE = "\x20"
 
 
-class RangeCheck(abc.ABC):
-    """Base Class for checking the range of a JBP field"""
+class RangeCheck(_ValueObject, abc.ABC):
+    """Base Class for checking the range of a JBP field
+
+    Range checks are immutable and compare equal when constructed with equal arguments.
+    """
+
+    __slots__ = ()
 
     @abc.abstractmethod
     def isvalid(self, value: Any) -> bool:
@@ -330,6 +1156,8 @@ class RangeCheck(abc.ABC):
 class AnyRange(RangeCheck):
     """Field has no range restrictions"""
 
+    __slots__ = ()
+
     def isvalid(self, value: Any) -> bool:
         return True
 
@@ -345,6 +1173,8 @@ class MinMax(RangeCheck):
         Maximum value.  A value of 'None' indicates no maximum.
     """
 
+    __slots__ = ("minimum", "maximum")
+
     def __init__(self, minimum: int | float | None, maximum: int | float | None):
         self.minimum = minimum
         self.maximum = maximum
@@ -361,16 +1191,21 @@ class MinMax(RangeCheck):
 class Regex(RangeCheck):
     """Field value is restricted by a regex"""
 
+    __slots__ = ("pattern", "_regex")
+
     def __init__(self, pattern: str):
         self.pattern = pattern
+        self._regex = re.compile(pattern)
 
     def isvalid(self, value: str) -> bool:
-        return bool(re.fullmatch(self.pattern, value))
+        return bool(self._regex.fullmatch(value))
 
 
 class Constant(RangeCheck):
     """Field value must be a constant"""
 
+    __slots__ = ("const",)
+
     def __init__(self, const: Any):
         self.const = const
 
@@ -381,8 +1216,10 @@ class Constant(RangeCheck):
 class Enum(RangeCheck):
     """Field value must match one value of an Enumeration"""
 
+    __slots__ = ("enumeration",)
+
     def __init__(self, enumeration: Iterable):
-        self.enumeration = set(enumeration)
+        self.enumeration = frozenset(enumeration)
 
     def isvalid(self, value: Any) -> bool:
         return value in self.enumeration
@@ -397,6 +1234,8 @@ class AnyOf(RangeCheck):
         RangeCheck objects to check against
     """
 
+    __slots__ = ("ranges",)
+
     def __init__(self, *ranges: RangeCheck):
         self.ranges = ranges
 
@@ -414,6 +1253,8 @@ class AllOf(RangeCheck):
         RangeCheck objects to check against
     """
 
+    __slots__ = ("ranges",)
+
     def __init__(self, *ranges: RangeCheck):
         self.ranges = ranges
 
@@ -425,6 +1266,8 @@ class AllOf(RangeCheck):
 class Not(RangeCheck):
     """Negate a range check"""
 
+    __slots__ = ("range_check",)
+
     def __init__(self, range_check: RangeCheck):
         self.range_check = range_check
 
@@ -452,33 +1295,108 @@ DATETIME_REGEX = Regex(
 DATE_REGEX = Regex(PATTERN_CC + PATTERN_YY + PATTERN_MM + PATTERN_DD)
 
 
+ValidationPolicy = Literal["eager", "deferred", "off"]
+
+# how field values are validated when they are set; see JbpIOComponent.load
+_validation_policy: contextvars.ContextVar[ValidationPolicy] = contextvars.ContextVar(
+    "_validation_policy", default="eager"
+)
+
+
+# whether a load is in progress, so that only the outermost JbpIOComponent.load keeps the loaded bytes
+_loading: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_loading", default=False
+)
+
+
+# file which BinaryPlaceholder data is copied from while dumping; see JbpIOComponent.dump
+_dump_data_source: contextvars.ContextVar[Any] = contextvars.ContextVar(
+    "_dump_data_source", default=None
+)
+
+
+@contextlib.contextmanager
+def _validation(policy: ValidationPolicy) -> Iterator[None]:
+    if policy not in ("eager", "deferred", "off"):
+        raise ValueError(f"invalid validation policy: {policy!r}")
+    token = _validation_policy.set(policy)
+    try:
+        yield
+    finally:
+        _validation_policy.reset(token)
+
+
 class JbpIOComponent:
     """Base Class for read/writable JBP components"""
 
+    __slots__ = ("_name", "_parent", "_layout_index")
+
     def __init__(self, name: str):
-        self.name = name
         self._parent: ComponentCollection | None = None
+        self._layout_index = -1  # position within the parent's cached layout
+        self.name = name
 
-    def load(self, fd: BinaryFile_R) -> Self:
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        if self._parent is not None:
+            self._parent._children_changed()
+
+    def load(
+        self, fd: BinaryFile_R, *, validation: ValidationPolicy | None = None
+    ) -> Self:
         """Read from a file descriptor
 
         Parameters
         ----------
         fd : file-like
             Binary file-like object to read from
+        validation : {'eager', 'deferred', 'off'}, optional
+            When to validate the fields that are read.  'eager' (the default) validates each field
+            as it is read, 'deferred' validates all of them in a single `validate` pass after
+            reading and 'off' skips validation.
 
         Returns
         -------
         A reference to self
         """
+        outermost = not _loading.get()
+        token = _loading.set(True)
+        loaded = False
         try:
-            self._load_impl(fd)
-            return self
+            self._begin_load(fd)
+            if validation is None:
+                self._load_impl(fd)
+            else:
+                with _validation(validation):
+                    self._load_impl(fd)
+            self._loaded_from(fd)
+            loaded = True
+        except _MissingRange:
+            raise  # not an error; aload fetches the range and parses again
         except Exception:
             logger.error(f"Failed to read {self.name}")
             raise
-
-    def dump(self, fd: BinaryFile_RW, seek_first: bool = False) -> int:
+        finally:
+            _loading.reset(token)
+            if outermost:
+                self._keep_loaded_bytes(loaded)
+        if validation == "deferred":
+            self.validate()
+        return self
+
+    def dump(
+        self,
+        fd: BinaryFile_RW,
+        seek_first: bool = False,
+        *,
+        validation: ValidationPolicy = "off",
+        data_source: BinaryFile_R | None = None,
+    ) -> int:
         """Write to a file descriptor
 
         Parameters
@@ -487,20 +1405,79 @@ class JbpIOComponent:
             Binary file-like object to write to
         seek_first : bool
             Seek to the components offset before writing
+        validation : {'eager', 'deferred', 'off'}, optional
+            Whether to `validate` the fields before ('eager') or after ('deferred') writing them
+        data_source : file-like, optional
+            The file this component was loaded from.  Segment data (``Data``, ``DESDATA``, ``RESDATA``)
+            is copied from where it was loaded, instead of being sought past, so that the output is
+            complete even if the headers have changed size.  Regular files are copied by the kernel
+            with ``os.copy_file_range`` or ``os.sendfile`` when available.
 
         Returns
         -------
         int
             Number of bytes written
         """
+        if validation not in ("eager", "deferred", "off"):
+            raise ValueError(f"invalid validation policy: {validation!r}")
+        if validation == "eager":
+            self.validate()
+
         if seek_first:
             fd.seek(self.get_offset(), os.SEEK_SET)
 
         try:
-            return self._dump_impl(fd)
+            if data_source is None:
+                nbytes = self._dump_impl(fd)
+            else:
+                token = _dump_data_source.set(data_source)
+                try:
+                    nbytes = self._dump_impl(fd)
+                finally:
+                    _dump_data_source.reset(token)
         except Exception:
             logger.error(f"Failed to write {self.name}")
             raise
+        if validation == "deferred":
+            self.validate()
+        return nbytes
+
+    def dump_into(self, buffer: Any, offset: int = 0) -> int:
+        """Encode into a preallocated buffer
+
+        The bytes of `BinaryPlaceholder` data are not known and are left as they are in `buffer`, just
+        as `dump` seeks past them.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            Writable object supporting the buffer protocol, e.g. `bytearray` or `mmap.mmap`
+        offset : int, optional
+            Position in `buffer` at which to start
+
+        Returns
+        -------
+        int
+            Number of bytes encoded
+        """
+        with memoryview(buffer) as view, view.cast("B") as byte_view:
+            try:
+                return self._dump_into_impl(byte_view, offset)
+            except Exception:
+                logger.error(f"Failed to write {self.name}")
+                raise
+
+    def to_bytes(self) -> bytes:
+        """Encode into a new bytes object
+
+        Returns
+        -------
+        bytes
+            The component as it would be written by `dump`.  See `dump_into`.
+        """
+        buffer = bytearray(self.get_size())
+        self.dump_into(buffer)
+        return bytes(buffer)
 
     def _load_impl(self, fd: BinaryFile_R) -> None:
         raise NotImplementedError()
@@ -508,6 +1485,34 @@ class JbpIOComponent:
     def _dump_impl(self, fd: BinaryFile_RW) -> int:
         raise NotImplementedError()
 
+    def _dump_into_impl(self, buffer: memoryview, offset: int) -> int:
+        # components without a direct encoding go through their file-based dump
+        file: Any = io.BytesIO()
+        nbytes = self._dump_impl(file)
+        buffer[offset : offset + nbytes] = file.getbuffer()[:nbytes]
+        return nbytes
+
+    def _in_memory(self) -> bool:
+        """Whether all of this component's bytes are held in memory, so `dump_into` encodes them all"""
+        return True
+
+    def _begin_load(self, fd: BinaryFile_R) -> None:
+        """Called before this component is loaded from `fd`, which is positioned at its start"""
+
+    def _loaded_from(self, fd: BinaryFile_R) -> None:
+        """Called after this component is loaded from `fd`, which is positioned at its end"""
+
+    def _keep_loaded_bytes(self, loaded: bool) -> None:
+        """Called once the outermost `load` call finishes, successfully if `loaded`"""
+
+    def _discard_ancestor_spans(self) -> None:
+        """Forget the loaded bytes of every ancestor, which no longer match their contents"""
+        node = self._parent
+        while node is not None:
+            node._raw = None
+            node._raw_source = None
+            node = node._parent
+
     def get_offset(self) -> int:
         """Return the offset from the start of the file to this component"""
         offset = 0
@@ -515,6 +1520,18 @@ class JbpIOComponent:
             offset = self._parent.get_offset_of(self)
         return offset
 
+    def _invalidate_layout(self) -> None:
+        """Discard cached sizes and offsets that depend on this component's size"""
+        if self._parent is not None:
+            self._parent._invalidate_layout()
+
+    def _deferring_ancestor(self) -> "ComponentCollection | None":
+        """Nearest ancestor which is deferring setter callbacks, if any"""
+        node = self._parent
+        while node is not None and node._deferred_callbacks is None:
+            node = node._parent
+        return node
+
     def get_size(self) -> int:
         """Size of this component in bytes"""
         raise NotImplementedError()
@@ -542,13 +1559,25 @@ class JbpIOComponent:
     def finalize(self):
         """Perform any necessary final updates"""
 
+    def validate(self) -> list["Field"]:
+        """Check every field, logging a warning for each one that is invalid
+
+        Components which have not been parsed yet are not checked.
+
+        Returns
+        -------
+        list of Field
+            The invalid fields
+        """
+        return []
+
     def as_filelike(self, file: Any) -> SubFile:
         """Create file object containing just this component
 
         Parameters
         ----------
-        file : file-like
-            File object for entire file
+        file : file-like or bytes-like
+            File object or buffer for entire file
 
         Returns
         -------
@@ -557,6 +1586,121 @@ class JbpIOComponent:
         """
         return SubFile(file, self.get_offset(), self.get_size())
 
+    def as_async_filelike(self, reader: AsyncRangeReader) -> AsyncSubFile:
+        """Create asynchronous file object containing just this component
+
+        Parameters
+        ----------
+        reader : AsyncRangeReader
+            Object with an ``async read_range(offset, length)`` method reading the entire file
+
+        Returns
+        -------
+        AsyncSubFile
+            Asynchronous file like object for this component
+        """
+        return AsyncSubFile(reader, self.get_offset(), self.get_size())
+
+
+@dataclasses.dataclass(frozen=True, slots=True, weakref_slot=True)
+class FieldSchema:
+    """Static description of a field, shared by all fields with the same definition
+
+    Use `FieldSchema.get` to obtain the shared instance.  See `Field` for a description of the attributes.
+    """
+
+    description: str
+    charset: str | None
+    encoded_range: "RangeCheck | None"
+    decoded_range: "RangeCheck | None"
+    converter: PythonConverter
+    nullable: bool
+    charset_regex: re.Pattern | None = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        regex = None if self.charset is None else re.compile(f"[{self.charset}]*")
+        object.__setattr__(self, "charset_regex", regex)
+
+    @classmethod
+    def get(
+        cls,
+        description: str,
+        charset: str | None,
+        encoded_range: "RangeCheck | None",
+        decoded_range: "RangeCheck | None",
+        converter: PythonConverter,
+        nullable: bool,
+    ) -> "FieldSchema":
+        """Return the shared schema with the given attributes, creating it if necessary
+
+        Parameters
+        ----------
+        description : str
+            Text description of the field
+        charset : str or None
+            regex expression matching a single character
+        encoded_range : RangeCheck or None
+            Checker for the encoded value
+        decoded_range : RangeCheck or None
+            Checker for the decoded value
+        converter : PythonConverter
+            Object to use for converting to/from python data types
+        nullable : bool
+            ``True`` if BCS-A spaces are allowed for entire field
+
+        Returns
+        -------
+        FieldSchema
+        """
+        # compare checks and converters by their keys, which is faster than calling their __eq__
+        key = (
+            description,
+            charset,
+            getattr(encoded_range, "_key", None) or encoded_range,
+            getattr(decoded_range, "_key", None) or decoded_range,
+            converter._key or converter,
+            nullable,
+        )
+        schema = _FIELD_SCHEMAS.get(key)
+        if schema is None:
+            schema = cls(
+                description, charset, encoded_range, decoded_range, converter, nullable
+            )
+            _FIELD_SCHEMAS[key] = schema
+        return schema
+
+    def replace(self, **changes) -> "FieldSchema":
+        """Return the shared schema with some attributes changed
+
+        Parameters
+        ----------
+        **changes
+            Attributes to change
+
+        Returns
+        -------
+        FieldSchema
+        """
+        attributes = {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.init
+        }
+        return self.get(**(attributes | changes))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+_FIELD_SCHEMAS: weakref.WeakValueDictionary[tuple, FieldSchema] = (
+    weakref.WeakValueDictionary()
+)
+
 
 class Field(JbpIOComponent):
     """JBP Field containing a single value.
@@ -598,8 +1742,12 @@ class Field(JbpIOComponent):
         Field value as bytes
     value
         Field value as python type
+    schema: FieldSchema
+        Static description of the field shared with other fields having the same definition
     """
 
+    __slots__ = ("_schema", "_size", "_encoded_value", "_setter_callback", "_dirty")
+
     def __init__(
         self,
         name: str,
@@ -615,13 +1763,10 @@ class Field(JbpIOComponent):
         nullable: bool = False,
     ):
         super().__init__(name)
-        self.description = description
-        self.nullable = nullable
+        self._schema = FieldSchema.get(
+            description, charset, encoded_range, decoded_range, converter, nullable
+        )
         self._size = size
-        self._charset = charset
-        self._encoded_range_check = encoded_range
-        self._decoded_range_check = decoded_range
-        self._converter = converter
         self._setter_callback = setter_callback
 
         encoded_default = self._encode(default)
@@ -630,6 +1775,8 @@ class Field(JbpIOComponent):
                 f"Field {name} {default=} does not encode to the proper {size=}"
             )
         self._encoded_value = encoded_default
+        # None until loaded, then whether modified since loading
+        self._dirty: bool | None = None
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
@@ -638,19 +1785,40 @@ class Field(JbpIOComponent):
         return (
             self.name == other.name
             and self.description == other.description
-            and self._charset == other._charset
+            and self._schema.charset == other._schema.charset
             and self.encoded_value == other.encoded_value
         )
 
+    @property
+    def schema(self) -> FieldSchema:
+        return self._schema
+
+    @property
+    def description(self) -> str:
+        return self._schema.description
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._schema = self._schema.replace(description=value)
+
+    @property
+    def nullable(self) -> bool:
+        return self._schema.nullable
+
+    @nullable.setter
+    def nullable(self, value: bool) -> None:
+        self._schema = self._schema.replace(nullable=value)
+
     def _encode(self, val: Any) -> bytes:
-        if self.nullable and val is None:
+        if self._schema.nullable and val is None:
             return BCSA_SPACE.encode() * self.size
-        return self._converter.to_bytes(val, self.size)
+        return self._schema.converter.to_bytes(val, self.size)
 
     def isnull(self) -> bool:
         """Return True if Field is nullable and all bytes are BCS spaces"""
-        return self.nullable and self.encoded_value == BCSA_SPACE.encode() * len(
-            self.encoded_value
+        return (
+            self._schema.nullable
+            and self.encoded_value == BCSA_SPACE.encode() * len(self.encoded_value)
         )
 
     def isvalid(self) -> bool:
@@ -658,20 +1826,20 @@ class Field(JbpIOComponent):
         if self.isnull():
             return True
 
-        if self._charset is not None:
+        if self._schema.charset_regex is not None:
             valid_charset = bool(
-                re.fullmatch(f"[{self._charset}]*", self.encoded_value.decode())
+                self._schema.charset_regex.fullmatch(self.encoded_value.decode())
             )
             if not valid_charset:
                 return False
 
-        if self._encoded_range_check is not None:
-            valid_encoding = self._encoded_range_check.isvalid(self.encoded_value)
+        if self._schema.encoded_range is not None:
+            valid_encoding = self._schema.encoded_range.isvalid(self.encoded_value)
             if not valid_encoding:
                 return False
 
-        if self._decoded_range_check is not None:
-            valid_decoding = self._decoded_range_check.isvalid(self.value)
+        if self._schema.decoded_range is not None:
+            valid_decoding = self._schema.decoded_range.isvalid(self.value)
             if not valid_decoding:
                 return False
 
@@ -690,17 +1858,30 @@ class Field(JbpIOComponent):
                 f"    old: {value!r}"
                 f"    new: {truncated!r}"
             )
+        if truncated != self._encoded_value and self._dirty is False:
+            self._dirty = True
+            self._discard_ancestor_spans()
         self._encoded_value = truncated
 
+        if _validation_policy.get() == "eager":
+            self._check()
+
+    def _check(self) -> bool:
+        """Log a warning and return False if the field is invalid"""
         try:
-            if not self.isvalid():
-                logger.warning(
-                    f"{self.name}: Invalid field value: {self.encoded_value!r}"
-                )
+            if self.isvalid():
+                return True
+            logger.warning("%s: Invalid field value: %r", self.name, self.encoded_value)
         except Exception:
             logger.exception(
-                f"An exception occurred when trying to validate {self.name}:"
+                "An exception occurred when trying to validate %s:", self.name
             )
+        return False
+
+    def validate(self) -> list["Field"]:
+        if self._check():
+            return []
+        return [self]
 
     @property
     def size(self) -> int:
@@ -711,14 +1892,16 @@ class Field(JbpIOComponent):
         old_value = self._size
         self._size = value
 
-        if (old_value != self._size) and self._setter_callback:
-            self._setter_callback(self)
+        if old_value != self._size:
+            self._invalidate_layout()
+            if self._setter_callback:
+                self._run_callback(self._setter_callback)
 
     @property
     def value(self) -> Any:
         if self.isnull():
             return None
-        return self._converter.from_bytes(self.encoded_value)
+        return self._schema.converter.from_bytes(self.encoded_value)
 
     @value.setter
     def value(self, val: Any):
@@ -728,10 +1911,18 @@ class Field(JbpIOComponent):
         self.encoded_value = self._encode(val)
 
         if callback:
+            self._run_callback(callback)
+
+    def _run_callback(self, callback: Callable) -> None:
+        deferring = self._deferring_ancestor()
+        if deferring is None:
             callback(self)
+        else:
+            deferring._defer_callback(self, callback)
 
     def _load_impl(self, fd: BinaryFile_R) -> None:
         self.encoded_value = fd.read(self.size)
+        self._dirty = False
 
         if self._setter_callback:
             self._setter_callback(self)
@@ -739,6 +1930,11 @@ class Field(JbpIOComponent):
     def _dump_impl(self, fd: BinaryFile_RW) -> int:
         return fd.write(self.encoded_value)
 
+    def _dump_into_impl(self, buffer: memoryview, offset: int) -> int:
+        encoded_value = self.encoded_value
+        buffer[offset : offset + len(encoded_value)] = encoded_value
+        return len(encoded_value)
+
     def get_size(self) -> int:
         return self.size
 
@@ -752,12 +1948,14 @@ class Field(JbpIOComponent):
 class BinaryPlaceholder(JbpIOComponent):
     """Represents a block of large binary data.
 
-    This class does not actually read, write or store data, only seek past it.
+    This class does not actually read, write or store data, only seek past it.  It remembers where it
+    was loaded from so that `dump` can copy the data from a ``data_source``.
     """
 
     def __init__(self, name: str, size: int):
         super().__init__(name)
         self._size = size
+        self._origin: int | None = None  # offset in the file the data was loaded from
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
@@ -769,33 +1967,129 @@ class BinaryPlaceholder(JbpIOComponent):
     def size(self) -> int:
         return self._size
 
-    @size.setter
-    def size(self, value: int):
-        self._size = value
+    @size.setter
+    def size(self, value: int):
+        if value != self._size:
+            self._size = value
+            self._origin = None  # the loaded data no longer fits
+            self._invalidate_layout()
+
+    def _begin_load(self, fd: BinaryFile_R) -> None:
+        self._origin = fd.tell()
+
+    def _load_impl(self, fd: BinaryFile_R):
+        fd.seek(self.size, os.SEEK_CUR)
+
+    def _dump_impl(self, fd: BinaryFile_RW) -> int:
+        data_source = _dump_data_source.get()
+        if data_source is not None and self._origin is not None:
+            _copy_range(data_source, self._origin, fd, self.size)
+        elif self.size:
+            fd.seek(self.size, os.SEEK_CUR)
+        return self.size
+
+    def _dump_into_impl(self, buffer: memoryview, offset: int) -> int:
+        return self.size
+
+    def _in_memory(self) -> bool:
+        return False
+
+    def get_size(self) -> int:
+        return self.size
+
+    def print(self, *, file=None) -> None:
+        print(
+            f"{self.name:15}{self.size:11} @ {self.get_offset():11} <Binary>", file=file
+        )
+
+
+class _ChildList(list["JbpIOComponent"]):
+    """List of a collection's children which notifies the collection when it is modified"""
+
+    def __init__(self, owner: "ComponentCollection", iterable: Iterable = ()):
+        super().__init__(iterable)
+        self._owner = owner
+
+    def __reduce__(self):
+        return (type(self), (self._owner, list(self)))
+
+    def _changed(self) -> None:
+        self._owner._children_changed()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __iadd__(self, other: Iterable["JbpIOComponent"]) -> Self:  # type: ignore[misc, override]
+        super().__iadd__(other)
+        self._changed()
+        return self
+
+    def append(self, item):
+        super().append(item)
+        self._owner._child_appended(item)
+
+    def extend(self, iterable):
+        super().extend(iterable)
+        self._changed()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._changed()
 
-    def _load_impl(self, fd: BinaryFile_R):
-        fd.seek(self.size, os.SEEK_CUR)
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._changed()
+        return item
 
-    def _dump_impl(self, fd: BinaryFile_RW) -> int:
-        if self.size:
-            fd.seek(self.size, os.SEEK_CUR)
-        return self.size
+    def remove(self, item):
+        super().remove(item)
+        self._changed()
 
-    def get_size(self) -> int:
-        return self.size
+    def clear(self):
+        super().clear()
+        self._changed()
 
-    def print(self, *, file=None) -> None:
-        print(
-            f"{self.name:15}{self.size:11} @ {self.get_offset():11} <Binary>", file=file
-        )
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
 
 
 class ComponentCollection(JbpIOComponent):
-    """Base class for components with child sub-components"""
+    """Base class for components with child sub-components
+
+    Child offsets relative to the collection and the collection's size are cached.  The cache is discarded
+    whenever the list of children or the size of any descendant changes.
+
+    A collection loaded from bytes which were read into memory keeps them, in one copy shared with the
+    collections loaded along with it.  Until any descendant is modified, it is dumped by writing those bytes
+    verbatim and `finalize` skips it.
+    """
 
     def __init__(self, name: str):
         super().__init__(name)
-        self._children: Final[list[JbpIOComponent]] = []
+        self._layout: list[int] | None = None
+        # (buffer, start, stop) of the bytes loaded, while they still match the children.  Collections
+        # loaded together share one buffer.
+        self._raw: tuple[bytes, int, int] | None = None
+        # file to take `_raw` from when the outermost load finishes
+        self._raw_source: BinaryFile_R | None = None
+        self._origin: int | None = (
+            None  # offset in the file this collection was loaded from
+        )
+        # layout when loaded; the same object as `_layout` until the layout is invalidated
+        self._loaded_layout: list[int] | None = None
+        self._children: Final[list[JbpIOComponent]] = _ChildList(self)
+        # field callbacks waiting for the end of a defer_callbacks block, keyed by id(field)
+        self._deferred_callbacks: dict[int, tuple[Field, Callable]] | None = None
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
@@ -814,22 +2108,101 @@ class ComponentCollection(JbpIOComponent):
         assert in_children == is_parent_set
         return in_children
 
+    def _invalidate_layout(self) -> None:
+        self._layout = None
+        self._raw = None
+        self._raw_source = None
+        super()._invalidate_layout()
+
+    def _children_changed(self) -> None:
+        """Called after the list of children, or the name of a child, changes"""
+        self._invalidate_layout()
+
+    def _child_appended(self, child: JbpIOComponent) -> None:
+        """Called after a single child is appended to the list of children"""
+        self._children_changed()
+
+    def _get_layout(self) -> list[int]:
+        """Offsets of each child relative to this collection followed by the size of the collection"""
+        if self._layout is None:
+            layout = [0] * (len(self._children) + 1)
+            offset = 0
+            for idx, child in enumerate(self._children):
+                layout[idx] = offset
+                child._layout_index = idx
+                offset += child.get_size()
+            layout[-1] = offset
+            self._layout = layout
+        return self._layout
+
     def get_size(self) -> int:
-        size = 0
-        for child in self._children:
-            size += child.get_size()
-        return size
+        return self._get_layout()[-1]
 
     def _load_impl(self, fd: BinaryFile_R) -> None:
         for child in self._children:
             child.load(fd)
 
+    def _begin_load(self, fd: BinaryFile_R) -> None:
+        self._origin = fd.tell()
+
+    def _loaded_from(self, fd: BinaryFile_R) -> None:
+        self._loaded_layout = self._get_layout()
+        self._raw = None
+        if (
+            hasattr(fd, "span")
+            and self._origin is not None
+            and fd.tell() - self._origin == self.get_size()
+            and self._in_memory()
+        ):
+            # copied once, by the outermost collection, when the outermost load finishes
+            self._raw_source = fd
+
+    def _keep_loaded_bytes(self, loaded: bool) -> None:
+        source, self._raw_source = self._raw_source, None
+        if loaded and source is not None:
+            assert self._origin is not None
+            buffer = source.span(self._origin, self._origin + self.get_size())  # type: ignore[attr-defined]
+            if buffer is not None:
+                self._share_loaded_bytes(buffer, 0)
+                return
+        for child in self._children:
+            child._keep_loaded_bytes(loaded)
+
+    def _share_loaded_bytes(self, buffer: bytes, start: int) -> None:
+        """Keep ``buffer[start:]`` as the bytes of this collection and its descendants"""
+        self._raw_source = None
+        self._raw = (buffer, start, start + self.get_size())
+        for child, offset in zip(self._children, self._get_layout()):
+            if isinstance(child, ComponentCollection):
+                child._share_loaded_bytes(buffer, start + offset)
+
     def _dump_impl(self, fd: BinaryFile_RW) -> int:
+        if self._raw is not None:
+            raw, start, stop = self._raw
+            return fd.write(memoryview(raw)[start:stop])
+        if self._in_memory():
+            # encode headers into one buffer so that they are written with a single call
+            buffer = bytearray(self.get_size())
+            self._dump_into_impl(memoryview(buffer), 0)
+            return fd.write(buffer)
         written = 0
         for child in self._children:
             written += child.dump(fd)
         return written
 
+    def _dump_into_impl(self, buffer: memoryview, offset: int) -> int:
+        if self._raw is not None:
+            raw, start, stop = self._raw
+            buffer[offset : offset + stop - start] = memoryview(raw)[start:stop]
+            return stop - start
+        start = offset
+        for child in self._children:
+            offset += child._dump_into_impl(buffer, offset)
+        return offset - start
+
+    def _in_memory(self) -> bool:
+        return all(child._in_memory() for child in self._children)
+
     def _append(self, field: JbpIOComponent) -> None:
         field._parent = self
         self._children.append(field)
@@ -846,16 +2219,74 @@ class ComponentCollection(JbpIOComponent):
         self._children[self._children.index(old_field)] = new_field
         new_field._parent = self
 
-    def get_offset_of(self, child_obj: JbpIOComponent) -> int:
-        offset = self.get_offset()
+    def _has_child(self, child_obj: JbpIOComponent) -> bool:
+        return any(child is child_obj for child in self._children)
 
-        for child in self._children:
-            if child is child_obj:
-                return offset
-            else:
-                offset += child.get_size()
-        else:
-            raise ValueError(f"Could not find {child_obj.name}")
+    def _is_descendant(self, component: JbpIOComponent) -> bool:
+        """Check that `component` is still reachable from this collection"""
+        node = component
+        while node._parent is not None and node._parent._has_child(node):
+            if node._parent is self:
+                return True
+            node = node._parent
+        return False
+
+    def _defer_callback(self, field: "Field", callback: Callable) -> None:
+        assert self._deferred_callbacks is not None
+        self._deferred_callbacks.setdefault(id(field), (field, callback))
+
+    @contextlib.contextmanager
+    def defer_callbacks(self) -> Iterator[Self]:
+        """Context manager which postpones field setter callbacks until the end of the block
+
+        Setting a field which changes the structure of the collection (e.g. NUMI or NBANDS) normally rebuilds the
+        dependent fields immediately.  Inside this block each field's callback runs at most once, when the block
+        exits, in the order the fields were first modified.
+
+        Fields created by a deferred callback do not exist until the block exits.  Fields removed by a deferred
+        callback are skipped, discarding any values assigned to them inside the block.  Loading always runs
+        callbacks immediately.  A block entered while this collection or one of its ancestors is deferring has no
+        effect.  A block entered on an ancestor of a deferring collection does take effect, but callbacks of fields
+        inside that collection still run when the innermost deferring collection's block exits.
+
+        Yields
+        ------
+        A reference to self
+        """
+        if (
+            self._deferred_callbacks is not None
+            or self._deferring_ancestor() is not None
+        ):
+            yield self
+            return
+
+        self._deferred_callbacks = {}
+        try:
+            yield self
+        finally:
+            pending = self._deferred_callbacks
+            self._deferred_callbacks = None
+            for field, callback in pending.values():
+                if self._is_descendant(field):
+                    callback(field)
+
+    def _layout_index_of(self, child_obj: JbpIOComponent) -> int:
+        self._get_layout()
+        idx = child_obj._layout_index
+        if not (0 <= idx < len(self._children) and self._children[idx] is child_obj):
+            # index was assigned by a different collection; refresh ours
+            self._invalidate_layout()
+            self._get_layout()
+            idx = child_obj._layout_index
+            if not (
+                0 <= idx < len(self._children) and self._children[idx] is child_obj
+            ):
+                raise ValueError(f"Could not find {child_obj.name}")
+        return idx
+
+    def get_offset_of(self, child_obj: JbpIOComponent) -> int:
+        idx = self._layout_index_of(child_obj)
+        return self.get_offset() + self._get_layout()[idx]
 
     def print(self, *, file=None) -> None:
         for child in self._children:
@@ -863,7 +2294,54 @@ class ComponentCollection(JbpIOComponent):
 
     def finalize(self):
         for child in self._children:
-            child.finalize()
+            # derived values of components unmodified since loading are already consistent
+            if getattr(child, "_raw", None) is None:
+                child.finalize()
+
+    def validate(self) -> list[Field]:
+        return [field for child in self._children for field in child.validate()]
+
+
+_DIGIT: Final = re.compile(r"\d")
+
+
+def _family_of(name: str) -> str:
+    """Leading non-digit portion of a name, shared by repeated fields such as ICOM1, ICOM2, ..."""
+    return _DIGIT.split(name, maxsplit=1)[0]
+
+
+_REGEX_SPECIAL: Final = frozenset(".^$*+?{}[]\\|()")
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Literal string which every full match of a regex pattern must start with"""
+    # a top-level alternation means there is no common prefix
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return ""
+
+    end = 0
+    while end < len(pattern) and pattern[end] not in _REGEX_SPECIAL:
+        end += 1
+    if end < len(pattern) and pattern[end] in "*?{":
+        # last literal character is optional
+        end -= 1
+    return pattern[: max(end, 0)]
 
 
 class Group(ComponentCollection, collections.abc.Mapping):
@@ -878,9 +2356,13 @@ class Group(ComponentCollection, collections.abc.Mapping):
 
     def __init__(self, name):
         super().__init__(name)
+        # position of the first child with each name
+        self._name_index: dict[str, int] | None = None
+        # positions of children grouped by the non-digit prefix of their names, e.g. "ICOM" for ICOM1..ICOMn
+        self._family_index: dict[str, list[int]] | None = None
 
     def _child_names(self) -> list[str]:
-        return [child.name for child in self._children]
+        return [child._name for child in self._children]
 
     def __iter__(self):
         return iter(self._child_names())
@@ -893,14 +2375,91 @@ class Group(ComponentCollection, collections.abc.Mapping):
 
         return self._children[index]
 
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and key in self._get_name_index()
+
+    def _children_changed(self) -> None:
+        self._name_index = None
+        self._family_index = None
+        super()._children_changed()
+
+    def _child_appended(self, child: JbpIOComponent) -> None:
+        position = len(self._children) - 1
+        if self._name_index is not None:
+            self._name_index.setdefault(child.name, position)
+        if self._family_index is not None:
+            self._family_index.setdefault(_family_of(child.name), []).append(position)
+        self._invalidate_layout()
+
+    def _get_name_index(self) -> dict[str, int]:
+        if self._name_index is None:
+            # later duplicates are overwritten by earlier names
+            names = self._child_names()
+            self._name_index = dict(zip(reversed(names), range(len(names) - 1, -1, -1)))
+        return self._name_index
+
+    def _get_family_index(self) -> dict[str, list[int]]:
+        if self._family_index is None:
+            index: dict[str, list[int]] = {}
+            for position, name in enumerate(self._child_names()):
+                index.setdefault(_family_of(name), []).append(position)
+            self._family_index = index
+        return self._family_index
+
+    def _has_child(self, child_obj: JbpIOComponent) -> bool:
+        position = self._get_name_index().get(child_obj.name, -1)
+        if position >= 0 and self._children[position] is child_obj:
+            return True
+        return super()._has_child(child_obj)
+
+    def _position_of(self, child: JbpIOComponent) -> int:
+        position = self._get_name_index().get(child.name, -1)
+        if position >= 0 and self._children[position] is child:
+            return position
+        # a later child with a duplicate name
+        return self._children.index(child)
+
     def _insert_after(
         self, existing: JbpIOComponent, *field: JbpIOComponent
     ) -> JbpIOComponent:
-        insert_pos = self._children.index(existing) + 1
+        insert_pos = self._position_of(existing) + 1
         self._children[insert_pos:insert_pos] = field
         for f in field:
             f._parent = self
-        return f
+        return field[-1] if field else existing
+
+    def _find_positions(self, pattern: str) -> list[int]:
+        """Positions of children with names fully matching `pattern`, in order"""
+        prefix = _literal_prefix(pattern)
+        if not prefix:
+            regex = re.compile(pattern)
+            return [
+                position
+                for position, child in enumerate(self._children)
+                if regex.fullmatch(child.name)
+            ]
+
+        families = self._get_family_index()
+        prefix_family = _family_of(prefix)
+        if len(prefix_family) < len(prefix):
+            # prefix contains a digit so all matching names are in exactly one family
+            candidates = families.get(prefix_family, [])
+        else:
+            candidates = sorted(
+                itertools.chain.from_iterable(
+                    positions
+                    for family, positions in families.items()
+                    if family.startswith(prefix)
+                )
+            )
+        if not candidates:
+            return []
+        regex = re.compile(pattern)
+        return [
+            position
+            for position in candidates
+            if regex.fullmatch(self._children[position].name)
+        ]
 
     def find_all(self, pattern: str) -> Iterator[JbpIOComponent]:
         """Find child components with names matching a regex pattern
@@ -914,20 +2473,117 @@ class Group(ComponentCollection, collections.abc.Mapping):
         ------
         child with name matching `pattern`
         """
-        for child in self._children[:]:
-            if re.fullmatch(pattern, child.name):
-                yield child
+        matches = [
+            self._children[position] for position in self._find_positions(pattern)
+        ]
+        yield from matches
+
+    def _family(self, family: str) -> list[JbpIOComponent]:
+        """Children named `family` followed by a number (e.g. LI001, LI002, ...), in order"""
+        return [
+            self._children[position]
+            for position in self._get_family_index().get(family, [])
+        ]
+
+    def _has_count(self, pattern: str, count: int) -> bool:
+        """True if exactly `count` children have names fully matching `pattern`
+
+        Count fields (e.g. NUMI) use this to keep their dependent fields when set to their current value.
+        """
+        return len(self._find_positions(pattern)) == count
 
-    def _remove_all(self, pattern: str) -> None:
-        for child in self.find_all(pattern):
-            self._children.remove(child)
+    def _remove_all(self, *patterns: str) -> None:
+        positions = sorted(
+            set(
+                itertools.chain.from_iterable(
+                    self._find_positions(pattern) for pattern in patterns
+                )
+            )
+        )
+        # delete contiguous runs, last first, so earlier positions remain valid
+        while positions:
+            stop = positions.pop() + 1
+            start = stop - 1
+            while positions and positions[-1] == start - 1:
+                start = positions.pop()
+            del self._children[start:stop]
 
     def _index(self, name: str) -> int:
-        return self._child_names().index(name)
+        try:
+            return self._get_name_index()[name]
+        except KeyError:
+            raise ValueError(f"{name} is not in {self.name}")
+
+
+class _UnparsedComponent(JbpIOComponent):
+    """Stand-in for a component which has not been parsed yet
+
+    The component is parsed and replaces this placeholder in its parent the first time it is needed.
+
+    Parameters
+    ----------
+    name : str
+        Name of the component
+    size : int
+        Size in bytes of the component
+    parser : callable
+        Called with this placeholder to parse the component and put it in the placeholder's place.
+        Returns the component.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        parser: Callable[["_UnparsedComponent"], JbpIOComponent],
+    ):
+        super().__init__(name)
+        self._size = size
+        self._parser = parser
+        self._parsed: JbpIOComponent | None = None
+        self._origin: int | None = None  # offset of the component in the file
+        # (subheader, data) lengths when the component is a lazily loaded segment
+        self._segment_lengths: tuple[int, int] | None = None
+
+    def parse(self) -> JbpIOComponent:
+        if self._parsed is None:
+            self._parsed = self._parser(self)
+        return self._parsed
+
+    def __eq__(self, other):
+        return self.parse() == other
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.parse(), memo)
+
+    def _load_impl(self, fd: BinaryFile_R) -> None:
+        self.parse().load(fd)
+
+    def _dump_impl(self, fd: BinaryFile_RW) -> int:
+        return self.parse().dump(fd)
+
+    def _dump_into_impl(self, buffer: memoryview, offset: int) -> int:
+        return self.parse()._dump_into_impl(buffer, offset)
+
+    def _in_memory(self) -> bool:
+        return self.parse()._in_memory()
+
+    def get_size(self) -> int:
+        return self._size
+
+    def print(self, *, file=None) -> None:
+        self.parse().print(file=file)
+
+    def finalize(self) -> None:
+        # nothing to update until parsed
+        pass
 
 
 class SegmentList(ComponentCollection, collections.abc.Sequence):
-    """A sequence of JBP segments"""
+    """A sequence of JBP segments
+
+    Segments of a lazily loaded `Jbp` are parsed the first time they are accessed.
+    """
 
     def __init__(
         self,
@@ -943,7 +2599,12 @@ class SegmentList(ComponentCollection, collections.abc.Sequence):
         self.set_count(self.minimum)
 
     def __getitem__(self, idx):
-        return self._children[idx]
+        if isinstance(idx, slice):
+            return [self[pos] for pos in range(len(self))[idx]]
+        child = self._children[idx]
+        if isinstance(child, _UnparsedComponent):
+            child = child.parse()
+        return child
 
     def set_count(self, size: int) -> None:
         if not self.minimum <= size <= self.maximum:
@@ -1157,6 +2818,29 @@ class SecurityFields(Group):
         )
 
 
+@dataclasses.dataclass(frozen=True)
+class SegmentTable:
+    """Lengths and offsets of one kind of segment, as returned by `FileHeader.segment_table`
+
+    Attributes
+    ----------
+    subheader_lengths : array.array
+        Length of each segment's subheader (e.g. LISHnnn)
+    data_lengths : array.array
+        Length of each segment's data (e.g. LInnn)
+    offsets : array.array
+        Offset of each segment from the start of the file, assuming the segments immediately follow
+        the file header
+    """
+
+    subheader_lengths: "array.array[int]"
+    data_lengths: "array.array[int]"
+    offsets: "array.array[int]"
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+
 class FileHeader(Group):
     """
     JBP File Header
@@ -1477,35 +3161,34 @@ class FileHeader(Group):
 
     def _numi_handler(self, field: Field) -> None:
         """Handle NUMI value change"""
-        self._remove_all("LISH\\d+")
-        self._remove_all("LI\\d+")
-        after: JbpIOComponent = field
-        for idx in range(1, field.value + 1):
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LISH{idx:03}",
-                    "Length of nth Image Subheader",
-                    6,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(439, 999_999),
-                    converter=Integer(),
-                    default=439,
-                ),
-            )
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LI{idx:03}",
-                    "Length of nth Image Segment",
-                    10,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(1, 10**10 - 1),
-                    converter=Integer(),
-                    setter_callback=self._lin_handler,
-                    default=1,
-                ),
-            )
+        if not self._has_count("LI\\d+", field.value):
+            self._remove_all("LISH\\d+", "LI\\d+")
+            fields: list[JbpIOComponent] = []
+            for idx in range(1, field.value + 1):
+                fields.append(
+                    Field(
+                        f"LISH{idx:03}",
+                        "Length of nth Image Subheader",
+                        6,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(439, 999_999),
+                        converter=Integer(),
+                        default=439,
+                    ),
+                )
+                fields.append(
+                    Field(
+                        f"LI{idx:03}",
+                        "Length of nth Image Segment",
+                        10,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(1, 10**10 - 1),
+                        converter=Integer(),
+                        setter_callback=self._lin_handler,
+                        default=1,
+                    ),
+                )
+            self._insert_after(field, *fields)
         if self.numi_callback:
             self.numi_callback(field)
 
@@ -1515,35 +3198,34 @@ class FileHeader(Group):
             self.lin_callback(field)
 
     def _nums_handler(self, field: Field) -> None:
-        self._remove_all("LSSH\\d+")
-        self._remove_all("LS\\d+")
-        after: JbpIOComponent = field
-        for idx in range(1, field.value + 1):
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LSSH{idx:03}",
-                    "Length of nth Graphic Subheader",
-                    4,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(258, 999_999),
-                    converter=Integer(),
-                    default=258,
-                ),
-            )
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LS{idx:03}",
-                    "Length of nth Graphic Segment",
-                    6,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(1, 10**10 - 1),
-                    converter=Integer(),
-                    setter_callback=self._lsn_handler,
-                    default=1,
-                ),
-            )
+        if not self._has_count("LS\\d+", field.value):
+            self._remove_all("LSSH\\d+", "LS\\d+")
+            fields: list[JbpIOComponent] = []
+            for idx in range(1, field.value + 1):
+                fields.append(
+                    Field(
+                        f"LSSH{idx:03}",
+                        "Length of nth Graphic Subheader",
+                        4,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(258, 999_999),
+                        converter=Integer(),
+                        default=258,
+                    ),
+                )
+                fields.append(
+                    Field(
+                        f"LS{idx:03}",
+                        "Length of nth Graphic Segment",
+                        6,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(1, 10**10 - 1),
+                        converter=Integer(),
+                        setter_callback=self._lsn_handler,
+                        default=1,
+                    ),
+                )
+            self._insert_after(field, *fields)
 
         if self.nums_callback:
             self.nums_callback(field)
@@ -1553,35 +3235,34 @@ class FileHeader(Group):
             self.lsn_callback(field)
 
     def _numt_handler(self, field: Field) -> None:
-        self._remove_all("LTSH\\d+")
-        self._remove_all("LT\\d+")
-        after: JbpIOComponent = field
-        for idx in range(1, field.value + 1):
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LTSH{idx:03}",
-                    "Length of nth Text Subheader",
-                    4,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(282, 999_999),
-                    converter=Integer(),
-                    default=282,
-                ),
-            )
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LT{idx:03}",
-                    "Length of nth Text Segment",
-                    5,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(1, 99_999),
-                    converter=Integer(),
-                    setter_callback=self._ltn_handler,
-                    default=1,
-                ),
-            )
+        if not self._has_count("LT\\d+", field.value):
+            self._remove_all("LTSH\\d+", "LT\\d+")
+            fields: list[JbpIOComponent] = []
+            for idx in range(1, field.value + 1):
+                fields.append(
+                    Field(
+                        f"LTSH{idx:03}",
+                        "Length of nth Text Subheader",
+                        4,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(282, 999_999),
+                        converter=Integer(),
+                        default=282,
+                    ),
+                )
+                fields.append(
+                    Field(
+                        f"LT{idx:03}",
+                        "Length of nth Text Segment",
+                        5,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(1, 99_999),
+                        converter=Integer(),
+                        setter_callback=self._ltn_handler,
+                        default=1,
+                    ),
+                )
+            self._insert_after(field, *fields)
 
         if self.numt_callback:
             self.numt_callback(field)
@@ -1591,35 +3272,34 @@ class FileHeader(Group):
             self.ltn_callback(field)
 
     def _numdes_handler(self, field: Field) -> None:
-        self._remove_all("LDSH\\d+")
-        self._remove_all("LD\\d+")
-        after: JbpIOComponent = field
-        for idx in range(1, field.value + 1):
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LDSH{idx:03}",
-                    "Length of nth Data Extension Segment Subheader",
-                    4,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(200, 999_999),
-                    converter=Integer(),
-                    default=200,
-                ),
-            )
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LD{idx:03}",
-                    "Length of nth Data Extension Segment",
-                    9,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(1, 10**9 - 1),
-                    converter=Integer(),
-                    setter_callback=self._ldn_handler,
-                    default=1,
-                ),
-            )
+        if not self._has_count("LD\\d+", field.value):
+            self._remove_all("LDSH\\d+", "LD\\d+")
+            fields: list[JbpIOComponent] = []
+            for idx in range(1, field.value + 1):
+                fields.append(
+                    Field(
+                        f"LDSH{idx:03}",
+                        "Length of nth Data Extension Segment Subheader",
+                        4,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(200, 999_999),
+                        converter=Integer(),
+                        default=200,
+                    ),
+                )
+                fields.append(
+                    Field(
+                        f"LD{idx:03}",
+                        "Length of nth Data Extension Segment",
+                        9,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(1, 10**9 - 1),
+                        converter=Integer(),
+                        setter_callback=self._ldn_handler,
+                        default=1,
+                    ),
+                )
+            self._insert_after(field, *fields)
 
         if self.numdes_callback:
             self.numdes_callback(field)
@@ -1629,36 +3309,35 @@ class FileHeader(Group):
             self.ldn_callback(field)
 
     def _numres_handler(self, field: Field) -> None:
-        self._remove_all("LRESH\\d+")
-        self._remove_all("LRE\\d+")
-        after: JbpIOComponent = field
-        for idx in range(1, field.value + 1):
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LRESH{idx:03}",
-                    "Length of nth Reserved Extension Segment Subheader",
-                    4,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(LRESH_MIN, 999_999),
-                    converter=Integer(),
-                    default=LRESH_MIN,
-                    setter_callback=self._lreshn_handler,
-                ),
-            )
-            after = self._insert_after(
-                after,
-                Field(
-                    f"LRE{idx:03}",
-                    "Length of nth Reserved Extension Segment",
-                    7,
-                    charset=BCSN_PI,
-                    decoded_range=MinMax(1, 10**7 - 1),
-                    converter=Integer(),
-                    default=1,
-                    setter_callback=self._lren_handler,
-                ),
-            )
+        if not self._has_count("LRE\\d+", field.value):
+            self._remove_all("LRESH\\d+", "LRE\\d+")
+            fields: list[JbpIOComponent] = []
+            for idx in range(1, field.value + 1):
+                fields.append(
+                    Field(
+                        f"LRESH{idx:03}",
+                        "Length of nth Reserved Extension Segment Subheader",
+                        4,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(LRESH_MIN, 999_999),
+                        converter=Integer(),
+                        default=LRESH_MIN,
+                        setter_callback=self._lreshn_handler,
+                    ),
+                )
+                fields.append(
+                    Field(
+                        f"LRE{idx:03}",
+                        "Length of nth Reserved Extension Segment",
+                        7,
+                        charset=BCSN_PI,
+                        decoded_range=MinMax(1, 10**7 - 1),
+                        converter=Integer(),
+                        default=1,
+                        setter_callback=self._lren_handler,
+                    ),
+                )
+            self._insert_after(field, *fields)
 
         if self.numres_callback:
             self.numres_callback(field)
@@ -1672,8 +3351,7 @@ class FileHeader(Group):
             self.lren_callback(field)
 
     def _udhdl_handler(self, field: Field) -> None:
-        self._remove_all("UDHOFL")
-        self._remove_all("UDHD")
+        self._remove_all("UDHOFL", "UDHD")
         after: JbpIOComponent = field
         if field.value:
             after = self._insert_after(
@@ -1691,8 +3369,7 @@ class FileHeader(Group):
             after = self._insert_after(after, TreSequence("UDHD", field.value - 3))
 
     def _xhdl_handler(self, field: Field) -> None:
-        self._remove_all("XHDLOFL")
-        self._remove_all("XHD")
+        self._remove_all("XHDLOFL", "XHD")
         after: JbpIOComponent = field
         if field.value:
             after = self._insert_after(
@@ -1709,6 +3386,48 @@ class FileHeader(Group):
         if field.value > 3:
             after = self._insert_after(after, TreSequence("XHD", field.value - 3))
 
+    # Segment kind -> (subheader length field prefix, data length field prefix), in file order
+    _SEGMENT_TABLES: Final = {
+        "image": ("LISH", "LI"),
+        "graphic": ("LSSH", "LS"),
+        "text": ("LTSH", "LT"),
+        "des": ("LDSH", "LD"),
+        "res": ("LRESH", "LRE"),
+    }
+
+    def _length_table(self, prefix: str) -> "array.array[int]":
+        return array.array(
+            "q", [fld.value for fld in self._family(prefix) if isinstance(fld, Field)]
+        )
+
+    def segment_table(self, kind: str) -> SegmentTable:
+        """Return the lengths and offsets of one kind of segment as integer arrays
+
+        The length fields remain the storage for these values; the arrays are a snapshot assembled from them on
+        each call and are not updated when the fields change.
+
+        Parameters
+        ----------
+        kind : {'image', 'graphic', 'text', 'des', 'res'}
+            Kind of segment
+
+        Returns
+        -------
+        SegmentTable
+            Subheader lengths, data lengths and offsets of each segment of `kind`
+        """
+        if kind not in self._SEGMENT_TABLES:
+            raise ValueError(f"unknown segment kind: {kind!r}")
+        start = self.get_size()
+        for other_kind, prefixes in self._SEGMENT_TABLES.items():
+            subheader_lengths, data_lengths = map(self._length_table, prefixes)
+            if other_kind == kind:
+                break
+            start += sum(subheader_lengths) + sum(data_lengths)
+        segment_lengths = map(operator.add, subheader_lengths, data_lengths)
+        offsets = array.array("q", itertools.accumulate(segment_lengths, initial=start))
+        return SegmentTable(subheader_lengths, data_lengths, offsets[:-1])
+
     def finalize(self) -> None:
         super().finalize()
         _update_tre_lengths(self, "UDHDL", "UDHOFL", "UDHD")
@@ -2137,18 +3856,20 @@ class ImageSubheader(Group):
             )
 
     def _nicom_handler(self, field: Field) -> None:
-        self._remove_all("ICOM\\d+")
-        after = self["NICOM"]
-        for idx in range(1, field.value + 1):
-            after = self._insert_after(
-                after,
-                Field(
-                    f"ICOM{idx}",
-                    "Image Comment {n}",
-                    80,
-                    charset=ECSA,
-                    converter=StringISO8859_1(),
-                    default="",
+        if not self._has_count("ICOM\\d+", field.value):
+            self._remove_all("ICOM\\d+")
+            self._insert_after(
+                field,
+                *(
+                    Field(
+                        f"ICOM{idx}",
+                        "Image Comment {n}",
+                        80,
+                        charset=ECSA,
+                        converter=StringISO8859_1(),
+                        default="",
+                    )
+                    for idx in range(1, field.value + 1)
                 ),
             )
 
@@ -2168,6 +3889,9 @@ class ImageSubheader(Group):
             )
 
     def _nbands_handler(self, field: Field) -> None:
+        if field.value == 0 and "XBANDS" in self:
+            # XBANDS, and the band groups it counts, are unchanged
+            return
         self._remove_all("XBANDS")
         if field.value == 0:
             self._insert_after(
@@ -2189,18 +3913,21 @@ class ImageSubheader(Group):
         self._set_num_band_groups(field.value)
 
     def _set_num_band_groups(self, count: int) -> None:
-        self._remove_all("IREPBAND\\d+")
-        self._remove_all("ISUBCAT\\d+")
-        self._remove_all("IFC\\d+")
-        self._remove_all("IMFLT\\d+")
-        self._remove_all("NLUTS\\d+")
-        self._remove_all("NELUT\\d+")
-        self._remove_all("LUTD\\d+")
-
-        after = self.get("XBANDS", self["NBANDS"])
+        if self._has_count("IREPBAND\\d+", count):
+            return
+        self._remove_all(
+            "IREPBAND\\d+",
+            "ISUBCAT\\d+",
+            "IFC\\d+",
+            "IMFLT\\d+",
+            "NLUTS\\d+",
+            "NELUT\\d+",
+            "LUTD\\d+",
+        )
+
+        fields: list[JbpIOComponent] = []
         for idx in range(1, count + 1):
-            after = self._insert_after(
-                after,
+            fields.append(
                 Field(
                     f"IREPBAND{idx:05d}",
                     "nth Band Representation",
@@ -2210,9 +3937,8 @@ class ImageSubheader(Group):
                     default=None,
                     nullable=True,
                 ),
-            )
-            after = self._insert_after(
-                after,
+            )
+            fields.append(
                 Field(
                     f"ISUBCAT{idx:05d}",
                     "nth Band Subcategory",
@@ -2223,8 +3949,7 @@ class ImageSubheader(Group):
                     nullable=True,
                 ),
             )
-            after = self._insert_after(
-                after,
+            fields.append(
                 Field(
                     f"IFC{idx:05d}",
                     "nth Band Image Filter Condition",
@@ -2234,8 +3959,7 @@ class ImageSubheader(Group):
                     default="N",
                 ),
             )
-            after = self._insert_after(
-                after,
+            fields.append(
                 Field(
                     f"IMFLT{idx:05d}",
                     "nth Band Standard Image Filter Code",
@@ -2246,8 +3970,7 @@ class ImageSubheader(Group):
                     nullable=True,
                 ),
             )
-            after = self._insert_after(
-                after,
+            fields.append(
                 Field(
                     f"NLUTS{idx:05d}",
                     "Number of LUTS for the nth Image Band",
@@ -2259,10 +3982,10 @@ class ImageSubheader(Group):
                     setter_callback=self._nluts_handler,
                 ),
             )
+        self._insert_after(self.get("XBANDS", self["NBANDS"]), *fields)
 
     def _udidl_handler(self, field: Field) -> None:
-        self._remove_all("UDOFL")
-        self._remove_all("UDID")
+        self._remove_all("UDOFL", "UDID")
         if field.value > 0:
             after = self._insert_after(
                 field,
@@ -2279,8 +4002,7 @@ class ImageSubheader(Group):
             after = self._insert_after(after, TreSequence("UDID", field.value - 3))
 
     def _ixshdl_handler(self, field: Field) -> None:
-        self._remove_all("IXSOFL")
-        self._remove_all("IXSHD")
+        self._remove_all("IXSOFL", "IXSHD")
         if field.value > 0:
             after = self._insert_after(
                 field,
@@ -2298,11 +4020,11 @@ class ImageSubheader(Group):
 
     def _nluts_handler(self, field: Field) -> None:
         idx = int(field.name.removeprefix("NLUTS"))
-        self._remove_all(f"NELUT{idx:05d}\\d+")
-        self._remove_all(f"LUTD{idx:05d}\\d+")
+        if self._has_count(f"LUTD{idx:05d}\\d+", field.value):
+            return
+        self._remove_all(f"NELUT{idx:05d}\\d+", f"LUTD{idx:05d}\\d+")
         if field.value > 0:
-            after = self._insert_after(
-                field,
+            fields: list[JbpIOComponent] = [
                 Field(
                     f"NELUT{idx:05d}",
                     "Number of LUT Entries for the nth Image Band",
@@ -2312,11 +4034,10 @@ class ImageSubheader(Group):
                     converter=Integer(),
                     default=1,
                     setter_callback=self._nelut_handler,
-                ),
-            )
+                )
+            ]
             for lutidx in range(1, field.value + 1):
-                after = self._insert_after(
-                    after,
+                fields.append(
                     Field(
                         f"LUTD{idx:05d}{lutidx}",
                         "nth Image Band, mth LUT",
@@ -2325,6 +4046,7 @@ class ImageSubheader(Group):
                         default=b"\x00",
                     ),
                 )
+            self._insert_after(field, *fields)
 
     def _nelut_handler(self, field: Field) -> None:
         idx = int(field.name.removeprefix("NELUT"))
@@ -2523,8 +4245,7 @@ class GraphicSubheader(Group):
         )
 
     def _sxshdl_handler(self, field: Field) -> None:
-        self._remove_all("SXSOFL")
-        self._remove_all("SXSHD")
+        self._remove_all("SXSOFL", "SXSHD")
         if field.value > 0:
             after = self._insert_after(
                 field,
@@ -2667,8 +4388,7 @@ class TextSubheader(Group):
         )
 
     def _txshdl_handler(self, field: Field) -> None:
-        self._remove_all("TXSOFL")
-        self._remove_all("TXSHD")
+        self._remove_all("TXSOFL", "TXSHD")
         if field.value > 0:
             after = self._insert_after(
                 field,
@@ -2860,6 +4580,88 @@ class TreOverflowDesSubheader(DataExtensionSubheader):
 DesSubheaderDefs = dict[tuple[str, int], Callable[[str], DataExtensionSubheader]]
 
 
+class _PluginRegistry:
+    """Process-wide mapping of plugin keys to constructors
+
+    Entry points are discovered on first use and each plugin is only imported the first time its key is requested.
+
+    Parameters
+    ----------
+    group : str
+        Entry point group to discover plugins from
+    parse_name : callable
+        Function converting an entry point name to a registry key.
+        Raises ``ValueError`` if the name cannot be parsed.
+    """
+
+    def __init__(self, group: str, parse_name: Callable[[str], Any]):
+        self.group = group
+        self._parse_name = parse_name
+        self._plugins: dict[Any, importlib.metadata.EntryPoint | Callable] | None = None
+        self._lock = threading.RLock()
+
+    def _discovered(self) -> dict[Any, importlib.metadata.EntryPoint | Callable]:
+        if self._plugins is None:
+            with self._lock:
+                if self._plugins is None:
+                    plugins: dict[Any, importlib.metadata.EntryPoint | Callable] = {}
+                    for plugin in importlib.metadata.entry_points(group=self.group):
+                        try:
+                            plugins[self._parse_name(plugin.name)] = plugin
+                        except ValueError:
+                            logger.warning(f"Skipping {plugin=}; unable to parse")
+                    self._plugins = plugins
+        return self._plugins
+
+    def get(self, key: Any) -> Callable | None:
+        """Return the constructor registered under ``key`` or ``None``, importing it if necessary"""
+        plugins = self._discovered()
+        creator = plugins.get(key)
+        if isinstance(creator, importlib.metadata.EntryPoint):
+            with self._lock:
+                creator = plugins.get(key)
+                if isinstance(creator, importlib.metadata.EntryPoint):
+                    creator = plugins[key] = creator.load()
+        return creator
+
+    def load_all(self) -> dict[Any, Callable]:
+        """Import every registered plugin and return a mapping of key to constructor"""
+        loaded = {}
+        for key in list(self._discovered()):
+            creator = self.get(key)
+            if creator is not None:
+                loaded[key] = creator
+        return loaded
+
+    def register(self, key: Any, creator: Callable) -> None:
+        """Register ``creator`` under ``key``, replacing any existing plugin"""
+        if not callable(creator):
+            raise TypeError(f"{creator=} is not callable")
+        with self._lock:
+            self._discovered()[key] = creator
+
+    def unregister(self, key: Any) -> None:
+        """Remove the plugin registered under ``key``"""
+        with self._lock:
+            del self._discovered()[key]
+
+    def reset(self) -> None:
+        """Forget all registrations; entry points are rediscovered on next use"""
+        with self._lock:
+            self._plugins = None
+
+
+def _parse_des_plugin_name(name: str) -> tuple[str, int]:
+    if len(name) != 27:
+        raise ValueError(f"{name=} must be 27 characters")
+    return name[:25].rstrip(), int(name[-2:])
+
+
+_DES_SUBHEADER_REGISTRY = _PluginRegistry(
+    "jbpy.extensions.des_subheader", _parse_des_plugin_name
+)
+
+
 def available_des_subheaders() -> DesSubheaderDefs:
     """All discovered and available Data Extension Segment (DES) subheaders
 
@@ -2869,18 +4671,41 @@ def available_des_subheaders() -> DesSubheaderDefs:
         Mapping of (desid, desver) pairs to a function that accepts a string-valued name and
         instantiates the appropriate DES subheader
     """
-    d: DesSubheaderDefs = {}
-    for plugin in importlib.metadata.entry_points(
-        group="jbpy.extensions.des_subheader"
-    ):
-        try:
-            assert len(plugin.name) == 27
-            desid = plugin.name[:25].rstrip()
-            desver = int(plugin.name[-2:])
-            d[(desid, desver)] = plugin.load()
-        except (AssertionError, ValueError):
-            logger.warning(f"Skipping {plugin=}; unable to parse")
-    return d
+    return _DES_SUBHEADER_REGISTRY.load_all()
+
+
+def register_des_subheader(
+    desid: str, desver: int, creator: Callable[[str], DataExtensionSubheader]
+) -> None:
+    """Register a Data Extension Segment (DES) subheader without declaring an entry point
+
+    Replaces any DES subheader already registered for the same (desid, desver) pair.
+
+    Parameters
+    ----------
+    desid : str
+        Unique DES type identifier
+    desver : int
+        Version of the data definition
+    creator : callable
+        Function that accepts a string-valued name and instantiates the DES subheader
+    """
+    if len(desid) > 25:
+        raise ValueError(f"DESID '{desid}' must be at most 25 characters")
+    _DES_SUBHEADER_REGISTRY.register((desid.rstrip(), int(desver)), creator)
+
+
+def unregister_des_subheader(desid: str, desver: int) -> None:
+    """Remove a Data Extension Segment (DES) subheader from the registry
+
+    Parameters
+    ----------
+    desid : str
+        Unique DES type identifier
+    desver : int
+        Version of the data definition
+    """
+    _DES_SUBHEADER_REGISTRY.unregister((desid.rstrip(), int(desver)))
 
 
 def des_subheader_factory(
@@ -2903,8 +4728,8 @@ def des_subheader_factory(
         If the DES data definition is available, an object of the appropriate DataExtensionSubheader subclass.
         Otherwise, a DataExtensionSubheader object with generic DES subheader.
     """
-    des_subheaders = available_des_subheaders()
-    subheader = des_subheaders.get((desid, desver), DataExtensionSubheader)(name)
+    creator = _DES_SUBHEADER_REGISTRY.get((desid, desver)) or DataExtensionSubheader
+    subheader = creator(name)
     subheader["DESID"].value = desid
     subheader["DESVER"].value = desver
     return subheader
@@ -2934,16 +4759,22 @@ class DataExtensionSegment(Group):
             )
 
     def _load_impl(self, fd):
-        for fld in ("DE", "DESID", "DESVER"):
-            self["subheader"][fld].load(fd)
+        # DE, DESID and DESVER select the subheader; peek at them so that they are read only once.
+        # They are validated when the selected subheader loads them.
+        dispatch_fields = [self["subheader"][fld] for fld in ("DE", "DESID", "DESVER")]
+        prefix, cursor = _peek(fd, sum(fld.size for fld in dispatch_fields))
+        prefix_file = io.BytesIO(prefix)
+        for fld in dispatch_fields:
+            fld.load(prefix_file, validation="off")
         assert self["subheader"]["DE"].value == "DE"
         self.set_subheader(
             des_subheader_factory(
                 self["subheader"]["DESID"].value, self["subheader"]["DESVER"].value
             )
         )
-        fd.seek(self.get_offset())
-        super()._load_impl(fd)
+        super()._load_impl(cursor)
+        if cursor is not fd:
+            cursor.sync()
 
     def print(self, *, file=None) -> None:
         print(f"# DESegment {self.name}", file=file)
@@ -2959,6 +4790,159 @@ def _update_tre_lengths(header, hdl, ofl, hd):
     header[hdl]._set_value(length)
 
 
+def _modified_fields(
+    component: JbpIOComponent, offset: int
+) -> Iterator[tuple[Field, int]]:
+    """Yield the fields modified since loading under `component`, which starts at `offset`, with their offsets
+
+    Raises ValueError if any field was not loaded, or any collection had children added, removed or
+    resized since loading.  Unparsed segments and undecoded TREs cannot have been modified.
+    """
+    if isinstance(component, Field):
+        if component._dirty is None:
+            raise ValueError(
+                f"{component.name} was replaced since loading; the file must be rewritten"
+            )
+        if component._dirty:
+            yield component, offset
+    elif isinstance(component, ComponentCollection):
+        layout = component._get_layout()
+        loaded_layout = component._loaded_layout
+        if loaded_layout is not layout and loaded_layout != layout:
+            raise ValueError(
+                f"{component.name} was added or resized since loading; the file must be rewritten"
+            )
+        for child, child_offset in zip(component._children, layout):
+            yield from _modified_fields(child, offset + child_offset)
+
+
+def _adjacent_runs(
+    fields: Iterable[tuple[Field, int]],
+) -> Iterator[tuple[int, list[Field]]]:
+    """Group (field, offset) pairs, in file order, into runs of adjacent fields and their offsets"""
+    run: list[Field] = []
+    run_offset = end = 0
+    for fld, offset in fields:
+        if run and offset != end:
+            yield run_offset, run
+            run = []
+        if not run:
+            run_offset = offset
+        run.append(fld)
+        end = offset + fld.size
+    if run:
+        yield run_offset, run
+
+
+# offset and size of the fixed-position FileHeader fields reported by `probe`
+_PROBE_FIELDS: Final = {
+    "FHDR": (0, 4),
+    "FVER": (4, 5),
+    "CLEVEL": (9, 2),
+    "FSCLAS": (119, 1),
+    "FL": (342, 12),
+    "HL": (354, 6),
+}
+# the segment count fields start at this offset; each count is followed by this many bytes of
+# length fields per segment
+_PROBE_COUNTS_OFFSET: Final = 360
+_PROBE_COUNTS: Final = {
+    "NUMI": 6 + 10,
+    "NUMS": 4 + 6,
+    "NUMX": 0,
+    "NUMT": 4 + 5,
+    "NUMDES": 4 + 9,
+    "NUMRES": 4 + 7,
+}
+_PROBE_SIZE: Final = 1024
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ProbeResult:
+    """Key FileHeader values returned by `probe`.  Attributes are named after the fields."""
+
+    FHDR: str
+    FVER: str
+    CLEVEL: int
+    FSCLAS: str
+    FL: int
+    HL: int
+    NUMI: int
+    NUMS: int
+    NUMT: int
+    NUMDES: int
+    NUMRES: int
+
+
+def probe(file: str | os.PathLike | BinaryFile_R) -> ProbeResult:
+    """Read key FileHeader values without parsing the file
+
+    Reads a single small prefix of the file (two reads if there are many segments) and decodes the
+    fields at their fixed offsets.  No `Jbp` or `Field` objects are created and no validation is
+    performed, making this much cheaper than `Jbp.load` for triaging many files.
+
+    Parameters
+    ----------
+    file : path-like or file-like
+        Path of the file, or binary file-like object positioned at the start of the file header
+
+    Returns
+    -------
+    ProbeResult
+        The file's version, CLEVEL, classification, file and header lengths and segment counts
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb", buffering=0) as fd:
+            return _probe(fd)
+    return _probe(file)
+
+
+def _probe(fd: Any) -> ProbeResult:
+    data = fd.read(_PROBE_SIZE)
+    if len(data) < _PROBE_COUNTS_OFFSET:
+        raise ValueError(f"{len(data)} bytes is too short for a file header")
+    values: dict[str, Any] = {
+        name: data[offset : offset + size].decode("ascii").rstrip()
+        for name, (offset, size) in _PROBE_FIELDS.items()
+    }
+    for name in ("CLEVEL", "FL", "HL"):
+        values[name] = int(values[name])
+    if values["HL"] > len(data):
+        data += fd.read(values["HL"] - len(data))
+
+    pos = _PROBE_COUNTS_OFFSET
+    for name, entry_size in _PROBE_COUNTS.items():
+        if pos + 3 > len(data):
+            raise ValueError(f"file header ends before {name}")
+        values[name] = int(data[pos : pos + 3])
+        pos += 3 + values[name] * entry_size
+    del values["NUMX"]
+    return ProbeResult(**values)
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadEvent:
+    """Event yielded by `Jbp.iter_load`
+
+    Attributes
+    ----------
+    kind : {'file_header', 'subheader', 'data'}
+        What was read
+    component : JbpIOComponent
+        The file header, the segment's subheader, or the segment's data component (e.g. ``Data`` or
+        ``DESDATA``)
+    offset : int
+        Offset of the component, or for 'data' events of the chunk, from the start of the file
+    data : bytes
+        A chunk of the segment's data for 'data' events; empty otherwise
+    """
+
+    kind: Literal["file_header", "subheader", "data"]
+    component: JbpIOComponent
+    offset: int
+    data: bytes = b""
+
+
 class Jbp(Group):
     """Class representing an entire NITF/NSIF
 
@@ -3025,6 +5009,364 @@ class Jbp(Group):
             )
         )
 
+    # Segment list name -> (subheader length field prefix, data length field prefix) in the FileHeader
+    _SEGMENT_LENGTH_FIELDS: Final = {
+        "ImageSegments": ("LISH", "LI"),
+        "GraphicSegments": ("LSSH", "LS"),
+        "TextSegments": ("LTSH", "LT"),
+        "DataExtensionSegments": ("LDSH", "LD"),
+        "ReservedExtensionSegments": ("LRESH", "LRE"),
+    }
+
+    # FileHeader attributes holding the callbacks which create and size segments
+    _SEGMENT_CALLBACKS: Final = (
+        "numi_callback",
+        "lin_callback",
+        "nums_callback",
+        "lsn_callback",
+        "numt_callback",
+        "ltn_callback",
+        "numdes_callback",
+        "ldn_callback",
+        "numres_callback",
+        "lreshn_callback",
+        "lren_callback",
+    )
+
+    def load(
+        self,
+        fd: BinaryFile_R,
+        *,
+        buffered: bool = False,
+        lazy: bool = False,
+        max_workers: int | None = None,
+        validation: ValidationPolicy | None = None,
+    ) -> Self:
+        """Read from a file descriptor
+
+        Parameters
+        ----------
+        fd : file-like
+            Binary file-like object to read from
+        buffered : bool, optional
+            Read the file header and each subheader with a single ``read`` call and parse their
+            fields from memory.  Greatly reduces the number of I/O calls, which is beneficial
+            for remote and network files.
+        lazy : bool, optional
+            Only parse the file header.  Each segment is located using the header's length fields
+            and is parsed, using a single ``read`` call, the first time it is accessed.  `fd` must
+            remain open until all needed segments have been accessed.  Implies `buffered`.
+        max_workers : int, optional
+            Fetch every subheader before parsing any of them, using up to this many threads.  The
+            subheaders are located using the header's length fields and nearby ranges are coalesced
+            into one read.  Reads are concurrent only if `fd` supports positional reads (``pread``,
+            e.g. `PositionalReader`); otherwise the coalesced ranges are read one after another.
+            Ignored if `lazy`.  Implies `buffered`.
+        validation : {'eager', 'deferred', 'off'}, optional
+            When to validate the fields that are read.  'eager' (the default) validates each field
+            as it is read, 'deferred' validates all of them in a single `validate` pass after
+            reading and 'off' skips validation.  Lazily loaded segments are validated according to
+            this policy when they are parsed.
+
+        Returns
+        -------
+        A reference to self
+        """
+        if not (buffered or lazy or max_workers):
+            super().load(fd, validation=validation)
+            self._record_loaded_layout()
+            return self
+
+        try:
+            with _validation(validation or _validation_policy.get()):
+                # lazily parsed segments use the policy in effect now
+                if lazy:
+                    self._load_lazy(fd)
+                elif max_workers:
+                    self._load_planned(fd, max_workers)
+                else:
+                    self._load_buffered(fd)
+        except Exception:
+            logger.error(f"Failed to read {self.name}")
+            raise
+        self._record_loaded_layout()
+        if validation == "deferred":
+            self.validate()
+        return self
+
+    def load_buffer(
+        self, buffer: Any, *, validation: ValidationPolicy | None = None
+    ) -> Self:
+        """Read from an in-memory buffer
+
+        Each field's value is copied directly out of `buffer`; the data of segments is not copied.
+        Use ``component.as_filelike(buffer).getbuffer()`` to view a segment's data in place.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            Object supporting the buffer protocol, e.g. `bytes`, `memoryview` or `mmap.mmap`
+        validation : {'eager', 'deferred', 'off'}, optional
+            When to validate the fields that are read.  See `load`.
+
+        Returns
+        -------
+        A reference to self
+        """
+        reader = _BufferFile(buffer)
+        try:
+            return self.load(reader, validation=validation)
+        finally:
+            # release the export so that e.g. an mmap can be closed
+            reader.getbuffer().release()
+
+    def iter_load(
+        self,
+        fd: Any,
+        *,
+        chunk_size: int = 1 << 20,
+        validation: ValidationPolicy | None = None,
+    ) -> Iterator[LoadEvent]:
+        """Read from a non-seekable stream in a single pass, yielding events as components are read
+
+        Yields a 'file_header' event, then for each segment in file order a 'subheader' event followed
+        by 'data' events with consecutive chunks of its data.  Segment data is streamed, one chunk
+        at a time, but the file header and every subheader are parsed into this object and kept.
+        Segments are located using the file header's length fields.
+
+        Parameters
+        ----------
+        fd : file-like
+            Binary file-like object to read from, e.g. a pipe, socket file or ``sys.stdin.buffer``.
+            Only ``read`` is used.
+        chunk_size : int, optional
+            Maximum number of bytes in each 'data' event
+        validation : {'eager', 'deferred', 'off'}, optional
+            When to validate the fields that are read.  See `load`.  With 'deferred', `validate` is
+            called after the last event.
+
+        Yields
+        ------
+        LoadEvent
+            The components read, in file order
+        """
+        reader = _ForwardReader(fd)
+        policy = validation or _validation_policy.get()
+        header = self["FileHeader"]
+        with _validation(policy):
+            # segments are parsed from `reader` by their placeholders, in order, below
+            self._load_lazy(reader)
+        self._record_loaded_layout()
+        reader.release(header.get_size())
+        yield LoadEvent("file_header", header, 0)
+
+        layout, _ = self._segment_layout(header.get_size())
+        for seglist_name, idx, pos, length_fields in layout:
+            segment = self[seglist_name][idx - 1]
+            yield LoadEvent("subheader", segment["subheader"], pos)
+
+            data_component = segment._children[-1]
+            start = pos + length_fields[0].value
+            for offset, chunk in reader.iter_range(
+                start, length_fields[1].value, chunk_size
+            ):
+                yield LoadEvent("data", data_component, offset, chunk)
+
+        if validation == "deferred":
+            self.validate()
+
+    def _record_loaded_layout(self) -> None:
+        """Remember the layout of this object and its segment lists, which are not loaded themselves"""
+        for collection in (self, *(self[name] for name in self._SEGMENT_LENGTH_FIELDS)):
+            collection._loaded_layout = collection._get_layout()
+
+    def patch_in_place(self, fd: BinaryFile_RW) -> int:
+        """Write the fields modified since loading back to the file they were loaded from
+
+        Only the bytes of the modified fields are written, adjacent fields with a single call.  Edits
+        which keep every size the same (e.g. reclassification, ``FDT`` or same-length TRE values) can
+        be applied without rewriting the file.
+
+        Parameters
+        ----------
+        fd : file-like
+            The file this object was loaded from, opened for reading and writing (e.g. ``"r+b"``)
+
+        Returns
+        -------
+        int
+            Number of bytes written
+
+        Raises
+        ------
+        ValueError
+            If this object was not loaded, or if any component was added, removed, replaced or resized
+            since loading, in which case the file must be rewritten with `dump`
+        """
+        if self._loaded_layout is None:
+            raise ValueError("only loaded files can be patched in place")
+        loaded_size = self._loaded_layout[-1]
+        if self.get_size() != loaded_size:
+            raise ValueError(
+                f"size changed from {loaded_size} to {self.get_size()} bytes since loading"
+            )
+
+        modified = list(_modified_fields(self, self["FileHeader"]._origin or 0))
+
+        written = 0
+        for offset, run in _adjacent_runs(modified):
+            fd.seek(offset)
+            written += fd.write(b"".join(fld.encoded_value for fld in run))
+        for fld, _ in modified:
+            fld._dirty = False
+        return written
+
+    def _load_file_header(self, fd: BinaryFile_R) -> int:
+        """Read the file header with one or two ``read`` calls and return its offset"""
+        header = self["FileHeader"]
+        start = fd.tell()
+
+        # All fields up to and including HL have fixed sizes
+        hl_field = header["HL"]
+        data = fd.read(hl_field.get_offset() + hl_field.size)
+        try:
+            header_length = int(data[-hl_field.size :])
+        except ValueError:
+            header_length = len(data)
+        if header_length > len(data):
+            data += fd.read(header_length - len(data))
+        header.load(_PrefetchedFile(fd, start, data))
+        return start
+
+    def _load_buffered(self, fd: BinaryFile_R) -> None:
+        header = self["FileHeader"]
+        start = self._load_file_header(fd)
+
+        pos = start + header.get_size()
+        for seglist_name, (subheader_prefix, _) in self._SEGMENT_LENGTH_FIELDS.items():
+            for segment, subheader_length in zip(
+                self[seglist_name], header._family(subheader_prefix), strict=True
+            ):
+                fd.seek(pos)
+                data = fd.read(subheader_length.value)
+                segment.load(_PrefetchedFile(fd, pos, data))
+                pos += segment.get_size()
+        fd.seek(pos)
+
+    def _segment_layout(
+        self, pos: int
+    ) -> tuple[list[tuple[str, int, int, tuple[Field, Field]]], int]:
+        """Locate each segment, starting at `pos`, using the file header's length fields
+
+        Returns the segment list name, one-based index, offset and (subheader, data) length fields of
+        each segment, in file order, and the offset of the end of the last segment.
+        """
+        header = self["FileHeader"]
+        layout = []
+        for seglist_name, prefixes in self._SEGMENT_LENGTH_FIELDS.items():
+            families = [header._family(prefix) for prefix in prefixes]
+            for idx, length_fields in enumerate(zip(*families, strict=True), start=1):
+                layout.append((seglist_name, idx, pos, length_fields))
+                pos += length_fields[0].value + length_fields[1].value
+        return layout, pos
+
+    def _load_lazy(self, fd: BinaryFile_R) -> None:
+        header = self["FileHeader"]
+        callbacks = {name: getattr(header, name) for name in self._SEGMENT_CALLBACKS}
+        try:
+            # segments are created below, without parsing or constructing their subheaders
+            for name in callbacks:
+                setattr(header, name, None)
+            start = self._load_file_header(fd)
+        finally:
+            for name, callback in callbacks.items():
+                setattr(header, name, callback)
+
+        for seglist_name in self._SEGMENT_LENGTH_FIELDS:
+            self[seglist_name].set_count(0)
+        layout, end = self._segment_layout(start + header.get_size())
+        for seglist_name, idx, pos, length_fields in layout:
+            subheader_length = length_fields[0].value
+            parser = functools.partial(
+                self._parse_segment,
+                fd,
+                pos,
+                subheader_length,
+                seglist_name,
+                idx,
+                length_fields,
+                _validation_policy.get(),
+            )
+            size = subheader_length + length_fields[1].value
+            placeholder = _UnparsedComponent(str(idx), size, parser)
+            placeholder._origin = pos
+            placeholder._segment_lengths = (subheader_length, length_fields[1].value)
+            self[seglist_name]._append(placeholder)
+        fd.seek(end)
+
+    def _load_planned(self, fd: BinaryFile_R, max_workers: int) -> None:
+        header = self["FileHeader"]
+        start = self._load_file_header(fd)
+
+        layout, end = self._segment_layout(start + header.get_size())
+        ranges = [(pos, length_fields[0].value) for _, _, pos, length_fields in layout]
+        groups = _coalesce_ranges(ranges, _COALESCE_GAP)
+        if hasattr(fd, "pread") and max_workers > 1 and len(groups) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+                buffers = list(executor.map(lambda g: fd.pread(g[1], g[0]), groups))
+        else:
+            buffers = []
+            for offset, length in groups:
+                fd.seek(offset)
+                buffers.append(fd.read(length))
+
+        group_idx = 0
+        for (seglist_name, idx, pos, _), (_, length) in zip(layout, ranges):
+            # compare the end of the range so that empty ranges stay in the group they border
+            while pos + length > groups[group_idx][0] + groups[group_idx][1]:
+                group_idx += 1
+            rel_pos = pos - groups[group_idx][0]
+            data = buffers[group_idx][rel_pos : rel_pos + length]
+            self[seglist_name][idx - 1].load(_PrefetchedFile(fd, pos, data))
+        fd.seek(end)
+
+    def _parse_segment(
+        self,
+        fd: BinaryFile_R,
+        offset: int,
+        subheader_length: int,
+        seglist_name: str,
+        idx: int,
+        length_fields: tuple[Field, Field],
+        validation: ValidationPolicy,
+        placeholder: _UnparsedComponent,
+    ) -> JbpIOComponent:
+        """Parse a lazily loaded segment and replace its placeholder"""
+        seglist = self[seglist_name]
+        segment = seglist.field_creator(str(idx))
+        index = seglist._layout_index_of(placeholder)
+        seglist._children[index] = segment
+        segment._parent = seglist
+
+        try:
+            # replay the length callbacks skipped while loading the file header.  The fields captured
+            # during load keep their values even if the header has since rebuilt its length fields.
+            for length_field in length_fields:
+                if length_field._setter_callback:
+                    length_field._setter_callback(length_field)
+
+            if hasattr(fd, "pread"):
+                data = fd.pread(subheader_length, offset)
+            else:
+                fd.seek(offset)
+                data = fd.read(subheader_length)
+            segment.load(_PrefetchedFile(fd, offset, data), validation=validation)
+        except Exception:
+            # put the placeholder back so that parsing can be retried
+            seglist._children[index] = placeholder
+            raise
+        return segment
+
     def _numi_handler(self, field: Field) -> None:
         self["ImageSegments"].set_count(field.value)
 
@@ -3066,41 +5408,30 @@ class Jbp(Group):
         self["ReservedExtensionSegments"][idx]["RESDATA"].size = field.value
 
     def update_lengths(self) -> None:
-        """Compute and set the segment lengths"""
+        """Compute and set the segment lengths
+
+        Lazily loaded segments which have not been parsed are not parsed; their lengths are set to the
+        values they were loaded with.
+        """
         self["FileHeader"]["FL"]._set_value(self.get_size())
         self["FileHeader"]["HL"]._set_value(self["FileHeader"].get_size())
 
-        for idx, seg in enumerate(self["ImageSegments"]):
-            self["FileHeader"][f"LISH{idx + 1:03d}"]._set_value(
-                seg["subheader"].get_size()
-            )
-            self["FileHeader"][f"LI{idx + 1:03d}"]._set_value(seg["Data"].get_size())
-
-        for idx, seg in enumerate(self["GraphicSegments"]):
-            self["FileHeader"][f"LSSH{idx + 1:03d}"]._set_value(
-                seg["subheader"].get_size()
-            )
-            self["FileHeader"][f"LS{idx + 1:03d}"]._set_value(seg["Data"].get_size())
-
-        for idx, seg in enumerate(self["TextSegments"]):
-            self["FileHeader"][f"LTSH{idx + 1:03d}"]._set_value(
-                seg["subheader"].get_size()
-            )
-            self["FileHeader"][f"LT{idx + 1:03d}"]._set_value(seg["Data"].get_size())
-
-        for idx, seg in enumerate(self["DataExtensionSegments"]):
-            self["FileHeader"][f"LDSH{idx + 1:03d}"]._set_value(
-                seg["subheader"].get_size()
-            )
-            self["FileHeader"][f"LD{idx + 1:03d}"]._set_value(seg["DESDATA"].get_size())
-
-        for idx, seg in enumerate(self["ReservedExtensionSegments"]):
-            self["FileHeader"][f"LRESH{idx + 1:03d}"]._set_value(
-                seg["subheader"].get_size()
-            )
-            self["FileHeader"][f"LRE{idx + 1:03d}"]._set_value(
-                seg["RESDATA"].get_size()
-            )
+        header = self["FileHeader"]
+        for seglist_name, prefixes in self._SEGMENT_LENGTH_FIELDS.items():
+            families = [header._family(prefix) for prefix in prefixes]
+            for seg, subheader_length, data_length in zip(
+                self[seglist_name]._children, *families, strict=True
+            ):
+                if isinstance(seg, _UnparsedComponent):
+                    # the length fields may have been recreated with defaults by a count change
+                    assert seg._segment_lengths is not None
+                    subheader_size, data_size = seg._segment_lengths
+                else:
+                    assert isinstance(seg, Group)
+                    subheader_size = seg["subheader"].get_size()
+                    data_size = seg._children[-1].get_size()
+                subheader_length._set_value(subheader_size)
+                data_length._set_value(data_size)
 
     def update_fdt(self) -> None:
         """Set the FDT field to the current time"""
@@ -3358,7 +5689,11 @@ class Jbp(Group):
         return 0
 
     def update_clevel(self) -> None:
-        """Compute and update the CLEVEL field.  See JBP-2025.1 Table G-1"""
+        """Compute and update the CLEVEL field.  See JBP-2025.1 Table G-1
+
+        Lazily loaded image segments are parsed, since CLEVEL depends on their subheaders.  Other
+        segments are not.
+        """
         clevel = 3
         helpers = [attrib for attrib in dir(self) if attrib.startswith("_clevel_")]
         for helper in helpers:
@@ -3367,11 +5702,297 @@ class Jbp(Group):
         self["FileHeader"]["CLEVEL"].value = clevel
 
 
+async def aload(
+    reader: AsyncRangeReader,
+    *,
+    max_concurrency: int = 8,
+    validation: ValidationPolicy | None = None,
+) -> Jbp:
+    """Asynchronously read a JBP's file header and subheaders
+
+    The file header is fetched first and used to locate the subheaders, which are then fetched
+    concurrently, coalescing nearby ranges, and parsed with the same logic as `Jbp.load`.  Segment
+    data is not read; use `JbpIOComponent.as_async_filelike` to stream it.
+
+    Parameters
+    ----------
+    reader : AsyncRangeReader
+        Object with an ``async read_range(offset, length)`` method reading the file
+    max_concurrency : int, optional
+        Maximum number of ``read_range`` calls awaited at once
+    validation : {'eager', 'deferred', 'off'}, optional
+        When to validate the fields that are read.  See `Jbp.load`.
+
+    Returns
+    -------
+    Jbp
+        The parsed file
+    """
+    jbp = Jbp()
+    fetched = _FetchedRanges()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(offset: int, length: int) -> None:
+        async with semaphore:
+            fetched.add(offset, await reader.read_range(offset, length), length)
+
+    async def parse(parser: Callable[[], Any]) -> None:
+        while True:
+            try:
+                parser()
+                return
+            except _MissingRange as missing:
+                await fetch(missing.offset, missing.size)
+
+    def load_file_header() -> None:
+        fetched.seek(0)
+        jbp._load_lazy(fetched)
+
+    try:
+        with _validation(validation or _validation_policy.get()):
+            await parse(load_file_header)
+            layout, _ = jbp._segment_layout(jbp["FileHeader"].get_size())
+            ranges = [
+                (pos, length_fields[0].value) for _, _, pos, length_fields in layout
+            ]
+            await asyncio.gather(
+                *(fetch(*group) for group in _coalesce_ranges(ranges, _COALESCE_GAP))
+            )
+            for seglist_name, idx, _, _ in layout:
+                # indexing a segment list parses the segment's placeholder
+                await parse(functools.partial(jbp[seglist_name].__getitem__, idx - 1))
+    except Exception:
+        logger.error(f"Failed to read {jbp.name}")
+        raise
+    jbp._record_loaded_layout()
+    if validation == "deferred":
+        jbp.validate()
+    return jbp
+
+
+class StreamWriter:
+    """Write a JBP one segment at a time, with segment data of sizes not known in advance
+
+    The file header is written when the writer is created and each subheader when its segment is
+    written, with whatever length fields they hold.  Closing the writer sets the length fields,
+    ``FL``, ``HL`` and ``CLEVEL`` and writes the file header again in place.  Only one chunk of segment
+    data is held in memory at a time.
+
+    Parameters
+    ----------
+    fd : file-like
+        Seekable binary file-like object to write to, starting at its current position
+    jbp : Jbp
+        The file to write.  The number of each kind of segment (``NUMI``, ``NUMDES``, ...) must already
+        be set and every field which affects the size of the file header must not change afterwards.
+    chunk_size : int, optional
+        Size of the reads made from file-like segment data
+
+    Examples
+    --------
+    >>> import io
+    >>> jbp = Jbp()
+    >>> jbp["FileHeader"]["NUMDES"].value = 1
+    >>> file = io.BytesIO()
+    >>> with StreamWriter(file, jbp) as writer:
+    ...     writer.write_segment(jbp["DataExtensionSegments"][0], [b"abc", b"de"])
+    5
+    >>> jbp["FileHeader"]["LD001"].value
+    5
+    """
+
+    def __init__(self, fd: BinaryFile_RW, jbp: Jbp, *, chunk_size: int = 1 << 20):
+        self._fd = fd
+        self._jbp = jbp
+        self._chunk_size = chunk_size
+        self._start = fd.tell()
+        self._pending = [
+            segment
+            for seglist_name in Jbp._SEGMENT_LENGTH_FIELDS
+            for segment in jbp[seglist_name]
+        ]
+        self._next = 0
+        self._closed = False
+
+        header = jbp["FileHeader"]
+        header.finalize()
+        self._header_size = header.get_size()
+        header.dump(fd)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # leave the file as it is; its lengths are not known
+            self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write_segment(self, segment: Group, data: Any = None) -> int:
+        """Write a segment's subheader followed by its data
+
+        Segments must be written in the order they appear in the file: image, graphic, text, data
+        extension then reserved extension segments, each in index order.
+
+        Parameters
+        ----------
+        segment : Group
+            The next segment of the `Jbp` being written
+        data : bytes-like, file-like or iterable of bytes-like, optional
+            The segment's data.  File-like objects are read until exhausted.  If omitted the segment's
+            data component, e.g. the TREs of a TRE_OVERFLOW DES, is written from memory.
+
+        Returns
+        -------
+        int
+            Number of bytes of data written
+        """
+        if self._closed:
+            raise ValueError("write to closed StreamWriter")
+        if self._next >= len(self._pending) or segment is not self._pending[self._next]:
+            raise ValueError(
+                f"segment {segment.name} is not the next segment in the file"
+            )
+
+        subheader = segment["subheader"]
+        subheader.finalize()
+        subheader.dump(self._fd)
+
+        data_component = segment._children[-1]
+        if data is None:
+            if not data_component._in_memory():
+                raise ValueError(
+                    f"{data_component.name} of {segment.name} requires data"
+                )
+            written = data_component.dump(self._fd)
+        elif not isinstance(data_component, BinaryPlaceholder):
+            raise ValueError(
+                f"{data_component.name} of {segment.name} is written from memory"
+            )
+        else:
+            written = self._write_data(data)
+            data_component.size = written
+        self._next += 1
+        return written
+
+    def _write_data(self, data: Any) -> int:
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return self._fd.write(data)
+        written = 0
+        if hasattr(data, "readinto"):
+            buffer = bytearray(self._chunk_size)
+            view = memoryview(buffer)
+            while nbytes := data.readinto(buffer):
+                written += self._fd.write(view[:nbytes])
+        elif hasattr(data, "read"):
+            while chunk := data.read(self._chunk_size):
+                written += self._fd.write(chunk)
+        else:
+            for chunk in data:
+                written += self._fd.write(chunk)
+        return written
+
+    def close(self) -> None:
+        """Set the length fields and ``CLEVEL`` and rewrite the file header
+
+        The file is left positioned at its end.
+
+        Raises
+        ------
+        ValueError
+            If any segment was not written or the file header or a subheader changed size after
+            being written
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._next < len(self._pending):
+            raise ValueError(
+                f"segment {self._pending[self._next].name} was not written"
+            )
+
+        end = self._fd.tell()
+        jbp = self._jbp
+        header = jbp["FileHeader"]
+        if (
+            header.get_size() != self._header_size
+            or jbp.get_size() != end - self._start
+        ):
+            raise ValueError("components changed size after being written")
+        jbp.update_lengths()
+        jbp.update_clevel()
+        self._fd.seek(self._start)
+        header.dump(self._fd)
+        self._fd.seek(end)
+
+
+class _UndecodedTre(_UnparsedComponent):
+    """TRE kept as its raw bytes until it is first accessed
+
+    Parameters
+    ----------
+    tretag : str
+        TRE tag
+    data : bytes
+        The entire TRE including the tag and length
+    parser : callable
+        Called with this placeholder to decode the TRE and put it in the placeholder's place.
+        Returns the TRE.
+    """
+
+    def __init__(
+        self,
+        tretag: str,
+        data: bytes,
+        parser: Callable[[_UnparsedComponent], JbpIOComponent],
+    ):
+        super().__init__(tretag.rstrip(" "), len(data), parser)
+        self.data = data
+
+    def __eq__(self, other):
+        if isinstance(other, _UndecodedTre) and other._parsed is None:
+            return self.name == other.name and self.data == other.data
+        return super().__eq__(other)
+
+    def __deepcopy__(self, memo):
+        if self._parsed is not None:
+            return copy.deepcopy(self._parsed, memo)
+        duplicate = copy.copy(self)
+        memo[id(self)] = duplicate
+        duplicate._parent = copy.deepcopy(self._parent, memo)
+        if duplicate._parent is not None:
+            duplicate._parser = duplicate._parent._decode
+        return duplicate
+
+    def _load_impl(self, fd: BinaryFile_R) -> None:
+        self.data = fd.read(self._size)
+
+    def _dump_impl(self, fd: BinaryFile_RW) -> int:
+        return fd.write(self.data)
+
+    def _dump_into_impl(self, buffer: memoryview, offset: int) -> int:
+        buffer[offset : offset + len(self.data)] = self.data
+        return len(self.data)
+
+    def _in_memory(self) -> bool:
+        return True
+
+    def finalize(self) -> None:
+        # nothing to update until decoded
+        pass
+
+
 class TreSequence(ComponentCollection, collections.abc.MutableSequence):
     """
     TREs which appear one after the other with no intervening bytes
 
     Intended for use as the user defined and/or extended data fields.  See Section 5.9.3.
+    TREs are read as raw bytes and decoded the first time they are accessed.
 
     Parameters
     ----------
@@ -3390,22 +6011,52 @@ class TreSequence(ComponentCollection, collections.abc.MutableSequence):
             return super()._load_impl(fd)
 
         # else need to discover which TREs are in the file
+        start = fd.tell()
+        reader = _PrefetchedFile(fd, start, fd.read(self._length))
         bytes_read = 0
         while bytes_read < self._length:
-            tretag = fd.read(6).decode()
-            fd.seek(-6, os.SEEK_CUR)
-            tre = tre_factory(tretag)
+            prefix = reader.peek(11)
+            tretag = prefix[:6].decode()
+            try:
+                trel = int(prefix[6:])
+            except ValueError:
+                # decode now so that the malformed TRE is reported while loading
+                tre: JbpIOComponent = tre_factory(tretag)
+                tre.load(reader)
+            else:
+                origin = reader.tell()
+                tre = _UndecodedTre(tretag, reader.read(11 + trel), self._decode)
+                tre._origin = origin
             self._append(tre)
-            tre.load(fd)
             bytes_read += tre.get_size()
+        fd.seek(start + bytes_read)
 
         if bytes_read != self._length:
             logger.warning(
                 f"Length of TREs ({bytes_read}) in {self.name} does not match expected length ({self._length})"
             )
 
+    def _decode(self, placeholder):
+        tre = tre_factory(placeholder.name)
+        # decode at the TRE's offset in the file, so that its fields know where they were loaded from
+        tre.load(
+            _PrefetchedFile(io.BytesIO(), placeholder._origin or 0, placeholder.data)
+        )
+        if tre.get_size() != len(placeholder.data):
+            logger.warning(
+                f"{tre.name} in {self.name} decoded to {tre.get_size()} bytes instead of {len(placeholder.data)}"
+            )
+        self._children[self._layout_index_of(placeholder)] = tre
+        tre._parent = self
+        return tre
+
     def __getitem__(self, key):
-        return self._children[key]
+        if isinstance(key, slice):
+            return [self[idx] for idx in range(len(self))[key]]
+        child = self._children[key]
+        if isinstance(child, _UnparsedComponent):
+            child = child.parse()
+        return child
 
     def __setitem__(self, key, value):
         value._parent = self
@@ -3519,6 +6170,15 @@ class UnknownTre(Tre):
         self["TREDATA"].size = field.value
 
 
+def _parse_tre_plugin_name(name: str) -> str:
+    if len(name) != 6:
+        raise ValueError(f"{name=} must be 6 characters")
+    return name.rstrip()
+
+
+_TRE_REGISTRY = _PluginRegistry("jbpy.extensions.tre", _parse_tre_plugin_name)
+
+
 def available_tres() -> dict[str, Callable[[], Tre]]:
     """All discovered and available Tagged Record Extensions (TREs)
 
@@ -3528,15 +6188,35 @@ def available_tres() -> dict[str, Callable[[], Tre]]:
         Mapping of TRETAG name to a function with no required arguments that
         instantiates the appropriate TRE
     """
-    d = {}
-    for plugin in importlib.metadata.entry_points(group="jbpy.extensions.tre"):
-        try:
-            assert len(plugin.name) == 6
-            tretag = plugin.name.rstrip()
-            d[tretag] = plugin.load()
-        except AssertionError:
-            logger.warning(f"Skipping {plugin=}; unable to parse")
-    return d
+    return _TRE_REGISTRY.load_all()
+
+
+def register_tre(tretag: str, creator: Callable[[], Tre]) -> None:
+    """Register a Tagged Record Extension (TRE) without declaring an entry point
+
+    Replaces any TRE already registered for the same TRETAG.
+
+    Parameters
+    ----------
+    tretag : str
+        The 1-6 character name of the TRE
+    creator : callable
+        Function with no required arguments that instantiates the TRE
+    """
+    if not (1 <= len(tretag.rstrip()) <= 6):
+        raise ValueError(f"TRE identifier '{tretag}' must be 1-6 characters")
+    _TRE_REGISTRY.register(tretag.rstrip(), creator)
+
+
+def unregister_tre(tretag: str) -> None:
+    """Remove a Tagged Record Extension (TRE) from the registry
+
+    Parameters
+    ----------
+    tretag : str
+        The 1-6 character name of the TRE
+    """
+    _TRE_REGISTRY.unregister(tretag.rstrip())
 
 
 def tre_factory(tretag: str) -> Tre:
@@ -3552,9 +6232,9 @@ def tre_factory(tretag: str) -> Tre:
     Tre
         TRE object
     """
-    tres = available_tres()
-    if tretag in tres:
-        return tres[tretag]()
+    creator = _TRE_REGISTRY.get(tretag)
+    if creator is not None:
+        return creator()
 
     return UnknownTre(tretag)
 
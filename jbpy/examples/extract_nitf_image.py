@@ -1,5 +1,4 @@
 import logging
-import os
 
 import numpy as np
 import numpy.typing as npt
@@ -38,13 +37,16 @@ def _fetch_block_uncompressed(
             shape=info["shape"],
         )  # type: ignore
     except Exception:
-        logging.debug("memmap failed. Using seek and read")
-        file.seek(offset_to_block, os.SEEK_SET)
-        array = np.frombuffer(
-            file.read(info["nbytes"]),
-            dtype=dtype,
-            count=np.prod(info["shape"]),
-        ).reshape(info["shape"])
+        logging.debug("memmap failed. Reading into a preallocated array")
+        array = np.empty(info["shape"], dtype=dtype)
+        block = jbpy.core.SubFile(file, offset_to_block, info["nbytes"])
+        with array.data.cast("B") as buf:
+            num_read = 0
+            while num_read < len(buf):
+                chunk = block.readinto(buf[num_read:])
+                if not chunk:
+                    raise EOFError("block extends past the end of the file")
+                num_read += chunk
 
     if info["has_pad"]:
         # TODO use numpy masked arrays
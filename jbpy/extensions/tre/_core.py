@@ -81,16 +81,14 @@ class EncodedFixedPoint(core.RangeCheck):
         self.sign = sign
         self.integer_digits = integer_digits
         self.fractional_digits = fractional_digits
-
-    @property
-    def pattern(self):
         sgn = {"required": b"[+-]", "unsigned": b""}[self.sign]
-        return (
+        self.pattern = (
             sgn
             + bytes(f"[0-9]{{{self.integer_digits}}}", encoding="ascii")
             + rb"\."
             + bytes(f"[0-9]{{{self.fractional_digits}}}", encoding="ascii")
         )
+        self._regex = re.compile(self.pattern)
 
     def isvalid(self, value):
-        return bool(re.fullmatch(self.pattern, value))
+        return bool(self._regex.fullmatch(value))
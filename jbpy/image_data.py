@@ -128,11 +128,11 @@ class MaskTable(jbpy.core.Group):
         if "TPXCD" in self:
             after = self["TPXCD"]
 
+        fields = []
         for band_idx in range(self._num_bands):
             for block_idx in range(self._num_blocks):
                 name = self.bmr_name(block_idx, band_idx)
-                after = self._insert_after(
-                    after,
+                fields.append(
                     jbpy.core.Field(
                         name,
                         f"Block {block_idx}, Band {band_idx} Offset",
@@ -141,6 +141,7 @@ class MaskTable(jbpy.core.Group):
                         default=0,
                     ),
                 )
+        self._insert_after(after, *fields)
 
     def _handle_tmrlnth(self, field):
         self._remove_all("TMR\\d+BND\\d+")
@@ -151,15 +152,16 @@ class MaskTable(jbpy.core.Group):
         if "TPXCD" in self:
             after = self["TPXCD"]
 
-        for bmr_field in self.find_all("BMR\\d+BND\\d+"):
-            if bmr_field.get_offset() > after.get_offset():
-                after = bmr_field
+        # the block mask records are contiguous so the last one is furthest along
+        bmr_fields = list(self.find_all("BMR\\d+BND\\d+"))
+        if bmr_fields and bmr_fields[-1].get_offset() > after.get_offset():
+            after = bmr_fields[-1]
 
+        fields = []
         for band_idx in range(self._num_bands):
             for block_idx in range(self._num_blocks):
                 name = self.tmr_name(block_idx, band_idx)
-                after = self._insert_after(
-                    after,
+                fields.append(
                     jbpy.core.Field(
                         name,
                         f"Pad Pixel {block_idx}, Band {band_idx}",
@@ -168,6 +170,7 @@ class MaskTable(jbpy.core.Group):
                         default=0,
                     ),
                 )
+        self._insert_after(after, *fields)
 
     def _handle_tpxcdlnth(self, field):
         self._remove_all("TPXCD")
@@ -0,0 +1,165 @@
+"""File-like adapters for efficient access to JBP files"""
+
+import collections
+import io
+import os
+from typing import Any
+
+
+class CachedRangeReader(io.RawIOBase):
+    """Read-only file-like object which reads another file in aligned blocks and caches them
+
+    Parsing a JBP issues many small reads and seeks.  When each of those becomes a request to a remote
+    store (e.g. a `smart_open` HTTP or S3 file) loading is dominated by latency.  This reader turns them
+    into a few block-sized reads of the underlying file: blocks are kept in a least-recently-used
+    cache and sequential access reads several blocks ahead with a single call.
+
+    Closing the reader does not close `file`.
+
+    Parameters
+    ----------
+    file : file-like
+        Binary file-like object supporting ``seek`` and ``read``
+    block_size : int, optional
+        Size, in bytes, of the aligned blocks read from `file`
+    max_blocks : int, optional
+        Maximum number of blocks to keep in the cache.  Reads larger than the cache bypass it.
+    read_ahead : int, optional
+        Number of additional blocks to read when a block is missed immediately after the previously
+        read blocks
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        block_size: int = 64 * 1024,
+        max_blocks: int = 256,
+        read_ahead: int = 4,
+    ):
+        if block_size <= 0 or max_blocks <= 0 or read_ahead < 0:
+            raise ValueError(
+                f"invalid cache configuration: {block_size=}, {max_blocks=}, {read_ahead=}"
+            )
+        super().__init__()
+        self._file = file
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.read_ahead = read_ahead
+        self._blocks: collections.OrderedDict[int, bytes] = collections.OrderedDict()
+        self._pos = 0
+        self._size: int | None = None
+        self._next_block = -1  # index of the block following the most recent fetch
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._check_open()
+        if whence == os.SEEK_SET:
+            new_pos = int(offset)
+        elif whence == os.SEEK_CUR:
+            new_pos = self._pos + int(offset)
+        elif whence == os.SEEK_END:
+            new_pos = self._get_size() + int(offset)
+        else:
+            raise ValueError(f"whence value {whence} unsupported")
+        if new_pos < 0:
+            raise OSError("Seek before start of file.")
+        self._pos = new_pos
+        return self._pos
+
+    def tell(self) -> int:
+        self._check_open()
+        return self._pos
+
+    def _get_size(self) -> int:
+        if self._size is None:
+            self._size = self._file.seek(0, os.SEEK_END)
+        return self._size
+
+    def _read_file(self, offset: int, size: int) -> bytes:
+        """Read up to `size` bytes of the underlying file, stopping early only at its end"""
+        self._file.seek(offset)
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = self._file.read(remaining)
+            if not chunk:
+                self._size = offset + size - remaining
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def _fetch(self, first: int, count: int) -> None:
+        """Read `count` blocks starting with block `first` with a single read and cache them"""
+        data = self._read_file(first * self.block_size, count * self.block_size)
+        for idx in range(count):
+            block = data[idx * self.block_size : (idx + 1) * self.block_size]
+            if not block:
+                break
+            self._blocks[first + idx] = block
+            self._blocks.move_to_end(first + idx)
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+        self._next_block = first + count
+
+    def _ensure_cached(self, first: int, last: int) -> None:
+        """Make sure blocks ``first`` through ``last`` are cached, reading missing runs"""
+        idx = first
+        while idx <= last:
+            if idx in self._blocks:
+                self._blocks.move_to_end(idx)
+                idx += 1
+                continue
+            run_start = idx
+            while idx <= last and idx not in self._blocks:
+                idx += 1
+            count = idx - run_start
+            if run_start == self._next_block:
+                # sequential access; read ahead without evicting the blocks being read
+                count += min(self.read_ahead, self.max_blocks - (last - first + 1))
+            self._fetch(run_start, count)
+
+    def read(self, size: int | None = -1) -> bytes:
+        self._check_open()
+        end = self._get_size() if size is None or size < 0 else self._pos + size
+        if self._size is not None:
+            end = min(end, self._size)
+        if end <= self._pos:
+            return b""
+
+        first = self._pos // self.block_size
+        last = (end - 1) // self.block_size
+        if last - first + 1 > self.max_blocks:
+            data = self._read_file(self._pos, end - self._pos)
+        else:
+            self._ensure_cached(first, last)
+            chunks = []
+            for idx in range(first, last + 1):
+                block = self._blocks.get(idx, b"")
+                block_start = idx * self.block_size
+                chunks.append(
+                    block[max(self._pos - block_start, 0) : end - block_start]
+                )
+                if len(block) < self.block_size:
+                    break
+            data = b"".join(chunks)
+        self._pos += len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, b) -> int:
+        dest = memoryview(b).cast("B")
+        data = self.read(len(dest))
+        dest[: len(data)] = data
+        return len(data)
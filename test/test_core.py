@@ -1,18 +1,29 @@
+import asyncio
+import concurrent.futures
+import copy
+import dataclasses
 import datetime
+import errno
 import filecmp
 import io
 import json
 import logging
+import mmap
 import os
 import pathlib
+import pickle
 import random
+import re
 import string
 import tempfile
 
+import aiohttp
 import numpy as np
 import pytest
 
+import jbpy
 import jbpy.core
+import test.utils
 
 
 def test_string_ascii_conv():
@@ -605,6 +616,46 @@ def test_field_isvalid_exception(failing_prop, attr_to_set, val, caplog):
         assert getattr(field, attr_to_set) == val
 
 
+def test_field_schema_shared():
+    subheader = jbpy.core.ImageSubheader("subheader")
+    subheader["NBANDS"].value = 3
+    irepbands = [subheader[f"IREPBAND{idx:05d}"] for idx in range(1, 4)]
+    assert len({id(field.schema) for field in irepbands}) == 1
+    assert jbpy.core.MinMax(1, 2) == jbpy.core.MinMax(1, 2)
+    assert jbpy.core.MinMax(1, 2) != jbpy.core.MinMax(1, 3)
+    assert jbpy.core.Enum(["A", "B"]) == jbpy.core.Enum(["A", "B"])
+
+    # checks and converters are immutable values, not shared instances
+    check = jbpy.core.MinMax(1, 2)
+    assert check is not jbpy.core.MinMax(1, 2)
+    with pytest.raises(AttributeError):
+        check.minimum = 0
+    with pytest.raises(AttributeError):
+        jbpy.core.Integer().sign = "+"
+    with pytest.raises(AttributeError):
+        jbpy.core.Enum(["A"]).enumeration.add("B")
+    assert copy.deepcopy(check) is check
+    assert pickle.loads(pickle.dumps(check)) == check
+
+    with pytest.raises(AttributeError):
+        irepbands[0].other = 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        irepbands[0].schema.nullable = True
+
+    irepbands[0].description = "Changed"
+    assert irepbands[0].description == "Changed"
+    assert irepbands[1].description != "Changed"
+    assert irepbands[0].schema.converter is irepbands[1].schema.converter
+
+    irepbands[1].nullable = not irepbands[1].nullable
+    assert irepbands[1].nullable != irepbands[2].nullable
+
+    copied = copy.deepcopy(subheader)
+    assert copied == subheader
+    assert copied["IREPBAND00003"].schema is irepbands[2].schema
+    assert copied["IREPBAND00003"] is not irepbands[2]
+
+
 def test_binaryplaceholder():
     bp = jbpy.core.BinaryPlaceholder("placeholder", 10)
     initial_data = b"0123456789"
@@ -680,6 +731,53 @@ def test_unknown_tre():
     assert unk["TREL"].value == 456
 
 
+def test_tre_sequence_lazy_decode(monkeypatch):
+    tres = jbpy.core.TreSequence("TRES", 0)
+    tres.append(jbpy.core.tre_factory("BLOCKA"))
+    unk = jbpy.core.UnknownTre("UNK00A")
+    unk["TREL"].value = 4
+    unk["TREDATA"].value = b"\xff\x00ab"
+    tres.append(unk)
+    tres.finalize()
+    tres[0]["BLOCK_INSTANCE"].encoded_value = b"XX"  # invalid, but kept verbatim
+    buf = io.BytesIO()
+    tres.dump(buf)
+    data = buf.getvalue()
+
+    created = []
+    tre_factory = jbpy.core.tre_factory
+    monkeypatch.setattr(
+        jbpy.core,
+        "tre_factory",
+        lambda tretag: created.append(tretag) or tre_factory(tretag),
+    )
+    loaded = jbpy.core.TreSequence("TRES", len(data)).load(io.BytesIO(data))
+    assert [child.name for child in loaded._children] == ["BLOCKA", "UNK00A"]
+    assert loaded.get_size() == len(data)
+    assert not created
+
+    copied = copy.deepcopy(loaded)
+    buf = io.BytesIO()
+    loaded.dump(buf)
+    assert buf.getvalue() == data
+    assert not created
+
+    assert loaded[1] is loaded[1]
+    assert loaded[1]["TREDATA"].value == b"\xff\x00ab"
+    assert created == ["UNK00A"]
+    assert isinstance(loaded._children[0], jbpy.core._UndecodedTre)
+    assert loaded == tres
+    assert copied == tres
+    assert created == ["UNK00A", "BLOCKA", "BLOCKA", "UNK00A"]
+    buf = io.BytesIO()
+    loaded.dump(buf)
+    assert buf.getvalue() == data
+
+    # malformed lengths are reported while loading
+    with pytest.raises(ValueError):
+        jbpy.core.TreSequence("TRES", 20).load(io.BytesIO(b"UNK00Axxxxx" + b" " * 9))
+
+
 def add_txtseg(ntf):
     ntf["FileHeader"]["NUMT"].value += 1
     idx = ntf["FileHeader"]["NUMT"].value - 1
@@ -740,6 +838,1223 @@ def test_graphicseg():
     assert "SXSHD" in subheader
 
 
+def brute_force_offsets(component, offset=0):
+    """Yield (component, offset) pairs without using the layout cache"""
+
+    def size(comp):
+        if isinstance(comp, jbpy.core.ComponentCollection):
+            return sum(size(child) for child in comp._children)
+        return comp.size
+
+    yield component, offset
+    if isinstance(component, jbpy.core.ComponentCollection):
+        for child in component._children:
+            yield from brute_force_offsets(child, offset)
+            offset += size(child)
+
+
+def assert_layout_matches(ntf):
+    for component, offset in brute_force_offsets(ntf):
+        assert component.get_offset() == offset, component.name
+    assert ntf.get_size() == sum(
+        comp.size for comp, _ in brute_force_offsets(ntf) if hasattr(comp, "size")
+    )
+
+
+def test_layout_cache():
+    ntf = populated_nitf()
+    assert_layout_matches(ntf)
+
+    # field size change
+    subheader = ntf["ImageSegments"][0]["subheader"]
+    subheader["NBANDS"].value = 2
+    subheader["NLUTS00002"].value = 1
+    subheader["NELUT00002"].value = 7
+    assert_layout_matches(ntf)
+
+    # children added and removed
+    subheader["NICOM"].value = 3
+    ntf["FileHeader"]["NUMT"].value = 2
+    assert_layout_matches(ntf)
+    subheader["NICOM"].value = 1
+    ntf["DataExtensionSegments"][1]["DESDATA"].append(jbpy.core.tre_factory("BLOCKA"))
+    assert_layout_matches(ntf)
+
+    # binary data size change
+    ntf["GraphicSegments"][0]["Data"].size = 12345
+    assert_layout_matches(ntf)
+
+    # subheader replaced
+    ntf["DataExtensionSegments"][0].set_subheader(
+        jbpy.des_subheader_factory("XML_DATA_CONTENT", 1)
+    )
+    ntf["DataExtensionSegments"][0]["subheader"]["DESSHL"].value = 283
+    assert_layout_matches(ntf)
+
+    # direct modification of the list of children
+    del ntf["DataExtensionSegments"][0]["subheader"]._children[-3:]
+    assert_layout_matches(ntf)
+    removed = ntf["FileHeader"]["FTITLE"]
+    ntf["FileHeader"]._children.remove(removed)
+    assert_layout_matches(ntf)
+    with pytest.raises(ValueError, match="Could not find FTITLE"):
+        removed.get_offset()
+
+    copied = copy.deepcopy(ntf)
+    assert copied == ntf
+    assert_layout_matches(copied)
+    copied["FileHeader"]["NUMS"].value = 0
+    assert_layout_matches(copied)
+    assert_layout_matches(ntf)
+
+
+class CountingBytesIO(io.BytesIO):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_reads = 0
+
+    def read(self, size=-1):
+        self.num_reads += 1
+        return super().read(size)
+
+
+class RecordingBytesIO(io.BytesIO):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = []
+        self.backward_seeks = 0
+
+    def read(self, size=-1):
+        self.reads.append((self.tell(), size))
+        return super().read(size)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        previous = self.tell()
+        pos = super().seek(offset, whence)
+        self.backward_seeks += pos < previous
+        return pos
+
+
+def test_load_reads_once():
+    ntf = populated_nitf()
+    file = RecordingBytesIO(dump_to_bytes(ntf))
+    assert jbpy.core.Jbp().load(file) == ntf
+
+    # DES and TRE dispatch peek at the identifying fields instead of re-reading them
+    assert file.backward_seeks == 0
+    ends = [offset + size for offset, size in file.reads]
+    assert all(offset >= end for (offset, _), end in zip(file.reads[1:], ends[:-1]))
+
+
+@pytest.mark.parametrize(
+    "pattern, prefix",
+    [
+        ("LISH\\d+", "LISH"),
+        ("NLUT.*", "NLUT"),
+        ("NELUT00002\\d+", "NELUT00002"),
+        ("UDHD", "UDHD"),
+        ("ICOMS?", "ICOM"),
+        ("AB{2}", "A"),
+        ("N(LEVELS|BANDS)_I", "N"),
+        ("(BITRATE|LAYER_ID)001", ""),
+        ("LI\\d+|LS\\d+", ""),
+        ("L[I|S]\\d+", "L"),
+    ],
+)
+def test_literal_prefix(pattern, prefix):
+    assert jbpy.core._literal_prefix(pattern) == prefix
+
+
+def assert_group_index_matches(group):
+    names = [child.name for child in group._children]
+    for name in set(names):
+        assert group[name] is group._children[names.index(name)]
+        assert name in group
+    assert "NOTAFIELD" not in group
+    for pattern in ("I.*", "ICOM\\d+", "NELUT00001\\d+", "N(BANDS|LUTS)\\d*", "XBANDS"):
+        expected = [
+            child for child in group._children if re.fullmatch(pattern, child.name)
+        ]
+        assert list(group.find_all(pattern)) == expected
+
+
+def test_group_index():
+    ntf = populated_nitf()
+    subheader = ntf["ImageSegments"][0]["subheader"]
+    assert_group_index_matches(subheader)
+
+    subheader["NBANDS"].value = 3
+    subheader["NLUTS00002"].value = 2
+    subheader["NELUT00002"].value = 7
+    subheader["NICOM"].value = 4
+    assert_group_index_matches(subheader)
+
+    subheader._remove_all("ICOM\\d+")
+    assert not list(subheader.find_all("ICOM\\d+"))
+    assert_group_index_matches(subheader)
+
+    subheader["NICOM"].value = 2
+    renamed = subheader["ICOM1"]
+    renamed.name = "RENAMED"
+    assert "ICOM1" not in subheader
+    assert subheader["RENAMED"] is renamed
+    assert_group_index_matches(subheader)
+
+    with pytest.raises(KeyError):
+        subheader["ICOM1"]
+
+
+def test_field_family_order():
+    header = jbpy.core.FileHeader("FileHeader")
+    header["NUMI"].value = 2
+    header["NUMS"].value = 1
+    names = list(header)
+    start = names.index("NUMI")
+    assert names[start : start + 7] == [
+        "NUMI",
+        "LISH001",
+        "LI001",
+        "LISH002",
+        "LI002",
+        "NUMS",
+        "LSSH001",
+    ]
+
+    subheader = jbpy.core.ImageSubheader("subheader")
+    subheader["NBANDS"].value = 0
+    subheader["XBANDS"].value = 12
+    subheader["NLUTS00002"].value = 2
+    subheader["NICOM"].value = 2
+    names = list(subheader)
+    assert names[names.index("NICOM") :][:3] == ["NICOM", "ICOM1", "ICOM2"]
+    start = names.index("XBANDS")
+    assert names[start : start + 14] == [
+        "XBANDS",
+        "IREPBAND00001",
+        "ISUBCAT00001",
+        "IFC00001",
+        "IMFLT00001",
+        "NLUTS00001",
+        "IREPBAND00002",
+        "ISUBCAT00002",
+        "IFC00002",
+        "IMFLT00002",
+        "NLUTS00002",
+        "NELUT00002",
+        "LUTD000021",
+        "LUTD000022",
+    ]
+    assert names[start + 14] == "IREPBAND00003"
+    assert len(list(subheader.find_all("IREPBAND\\d+"))) == 12
+
+    subheader["XBANDS"].value = 10
+    assert len(list(subheader.find_all("IREPBAND\\d+"))) == 10
+    assert not list(subheader.find_all("(NELUT|LUTD)\\d+"))
+
+
+def test_defer_callbacks():
+    eager = jbpy.Jbp()
+    eager["FileHeader"]["NUMI"].value = 3
+    eager["FileHeader"]["LI002"].value = 100
+    eager["ImageSegments"][1]["subheader"]["NICOM"].value = 2
+
+    ntf = jbpy.Jbp()
+    with ntf.defer_callbacks() as deferring:
+        assert deferring is ntf
+        for numi in (1, 4, 3):
+            ntf["FileHeader"]["NUMI"].value = numi
+        assert "LI001" not in ntf["FileHeader"]
+        assert not ntf["ImageSegments"]
+    ntf["FileHeader"]["LI002"].value = 100
+    subheader = ntf["ImageSegments"][1]["subheader"]
+    calls = []
+    nicom_handler = subheader["NICOM"]._setter_callback
+
+    def counting_handler(field):
+        calls.append(field.value)
+        nicom_handler(field)
+
+    subheader["NICOM"]._setter_callback = counting_handler
+    with subheader.defer_callbacks():
+        # a nested block does not run callbacks on exit; they wait for the subheader's block
+        with ntf.defer_callbacks():
+            for nicom in range(5):
+                subheader["NICOM"].value = nicom
+        subheader["NICOM"].value = 2
+        assert calls == []
+    assert calls == [2]
+    assert ntf == eager
+    assert_layout_matches(ntf)
+
+    # callbacks of fields removed by an earlier callback are skipped
+    subheader["NBANDS"].value = 0
+    subheader["XBANDS"].value = 12
+    with pytest.raises(RuntimeError):
+        with subheader.defer_callbacks():
+            subheader["XBANDS"].value = 11
+            subheader["NLUTS00002"].value = 2
+            raise RuntimeError()
+    assert len(list(subheader.find_all("NLUTS\\d+"))) == 11
+    assert subheader["NLUTS00002"].value == 0
+    assert "NELUT00002" not in subheader
+    assert_layout_matches(ntf)
+
+
+def populated_nitf():
+    ntf = empty_nitf()
+    ntf["FileHeader"]["UDHDL"].value = 10
+    ntf["FileHeader"]["UDHD"].append(jbpy.core.tre_factory("SECTGA"))
+    add_imseg(ntf)
+    add_imseg(ntf)
+    ntf["ImageSegments"][1]["subheader"]["IXSHDL"].value = 10
+    ntf["ImageSegments"][1]["subheader"]["IXSHD"].append(
+        jbpy.core.tre_factory("BLOCKA")
+    )
+    add_graphicseg(ntf)
+    add_txtseg(ntf)
+    ntf["FileHeader"]["NUMDES"].value = 2
+    ntf["DataExtensionSegments"][0]["subheader"]["DESID"].value = "mydesid"
+    ntf["DataExtensionSegments"][0]["subheader"]["DESSHL"].value = 4
+    ntf["DataExtensionSegments"][1].set_subheader(
+        jbpy.des_subheader_factory("TRE_OVERFLOW", 1)
+    )
+    ntf["DataExtensionSegments"][1]["DESDATA"].append(jbpy.core.tre_factory("SECTGA"))
+    ntf["FileHeader"]["NUMRES"].value = 1
+    ntf.finalize()
+    return ntf
+
+
+def dump_to_bytes(ntf):
+    buf = io.BytesIO()
+    ntf.dump(buf)
+    # pad data placeholders at the end of the file
+    buf.seek(ntf["FileHeader"]["FL"].value - 1)
+    buf.write(b"\0")
+    return buf.getvalue()
+
+
+def test_load_buffered():
+    ntf = populated_nitf()
+    data = dump_to_bytes(ntf)
+
+    unbuffered_file = CountingBytesIO(data)
+    unbuffered = jbpy.core.Jbp().load(unbuffered_file)
+    buffered_file = CountingBytesIO(data)
+    buffered = jbpy.core.Jbp().load(buffered_file, buffered=True)
+    assert buffered == unbuffered == ntf
+    assert buffered_file.tell() == unbuffered_file.tell() == len(data)
+
+    num_segments = sum(len(ntf[name]) for name in ntf._SEGMENT_LENGTH_FIELDS)
+    # file header (2), each subheader, and the TRE_OVERFLOW DES data
+    assert buffered_file.num_reads == 2 + num_segments + 1
+    assert unbuffered_file.num_reads > 10 * buffered_file.num_reads
+
+
+def test_load_lazy():
+    ntf = populated_nitf()
+    data = dump_to_bytes(ntf)
+
+    lazy_file = CountingBytesIO(data)
+    lazy = jbpy.core.Jbp().load(lazy_file, lazy=True)
+    assert lazy_file.num_reads == 2
+    assert lazy_file.tell() == len(data)
+    assert lazy["FileHeader"] == ntf["FileHeader"]
+    for name in ntf._SEGMENT_LENGTH_FIELDS:
+        assert len(lazy[name]) == len(ntf[name])
+        assert all(
+            isinstance(seg, jbpy.core._UnparsedComponent)
+            for seg in lazy[name]._children
+        )
+    assert (
+        lazy["ReservedExtensionSegments"][0]["RESDATA"].get_offset()
+        == ntf["ReservedExtensionSegments"][0]["RESDATA"].get_offset()
+    )
+    assert lazy_file.num_reads == 3
+
+    imseg = lazy["ImageSegments"][1]
+    assert lazy_file.num_reads == 4
+    assert imseg is lazy["ImageSegments"][1]
+    assert imseg == ntf["ImageSegments"][1]
+    assert imseg["Data"].get_offset() == ntf["ImageSegments"][1]["Data"].get_offset()
+    assert isinstance(lazy["ImageSegments"]._children[0], jbpy.core._UnparsedComponent)
+
+    # segments are parsed from their original location after the header is edited
+    lazy["FileHeader"]["NUMT"].value = 0
+    lazy["FileHeader"]["NUMI"].value = 3
+    assert lazy["ImageSegments"][0] == ntf["ImageSegments"][0]
+    assert lazy["DataExtensionSegments"][1] == ntf["DataExtensionSegments"][1]
+
+    lazy = jbpy.core.Jbp().load(io.BytesIO(data), lazy=True)
+    assert dump_to_bytes(lazy) == data
+    assert lazy == ntf
+
+    copied = copy.deepcopy(jbpy.core.Jbp().load(io.BytesIO(data), lazy=True))
+    assert copied == ntf
+
+
+def test_finalize_lazy():
+    ntf = populated_nitf()
+    ntf.finalize()
+    data = dump_to_bytes(ntf)
+
+    lazy = jbpy.core.Jbp().load(io.BytesIO(data), lazy=True)
+    # only image subheaders, which determine CLEVEL, are parsed
+    lazy["TextSegments"][0]["subheader"]["TXTALVL"].value = 1
+    lazy.finalize()
+    for name in ntf._SEGMENT_LENGTH_FIELDS:
+        if name in ("ImageSegments", "TextSegments"):
+            continue
+        assert all(
+            isinstance(seg, jbpy.core._UnparsedComponent)
+            for seg in lazy[name]._children
+        )
+    for field in ("FL", "HL", "CLEVEL", "LTSH001", "LT001", "LISH002"):
+        assert lazy["FileHeader"][field].value == ntf["FileHeader"][field].value
+
+
+def test_finalize_lazy_count_change():
+    ntf = populated_nitf()
+    ntf.finalize()
+    data = dump_to_bytes(ntf)
+
+    lazy = jbpy.core.Jbp().load(io.BytesIO(data), lazy=True)
+    header = lazy["FileHeader"]
+    # recreate the length fields of unparsed segments with their defaults
+    for count in ("NUMT", "NUMDES", "NUMRES"):
+        header[count].value += 1
+        header[count].value -= 1
+    header["NUMT"].value = header["NUMT"].value
+    lazy.finalize()
+    for name in ("TextSegments", "DataExtensionSegments", "ReservedExtensionSegments"):
+        assert all(
+            isinstance(seg, jbpy.core._UnparsedComponent)
+            for seg in lazy[name]._children
+        )
+    for field in header.find_all("L(T|D|RE)(SH)?\\d+"):
+        assert field.value == ntf["FileHeader"][field.name].value
+
+
+def test_load_buffered_wrong_subheader_length():
+    ntf = populated_nitf()
+    ntf["FileHeader"]["LISH002"]._set_value(
+        ntf["ImageSegments"][1]["subheader"].get_size() - 20
+    )
+    data = dump_to_bytes(ntf)
+
+    buffered = jbpy.core.Jbp().load(io.BytesIO(data), buffered=True)
+    assert buffered == jbpy.core.Jbp().load(io.BytesIO(data)) == ntf
+
+
+@pytest.mark.parametrize(
+    "ranges, expected",
+    [
+        ([], []),
+        ([(0, 10), (10, 5)], [(0, 15)]),
+        ([(0, 10), (20, 5)], [(0, 25)]),
+        ([(0, 10), (21, 5)], [(0, 10), (21, 5)]),
+        ([(0, 10), (5, 2), (12, 1)], [(0, 13)]),
+    ],
+)
+def test_coalesce_ranges(ranges, expected):
+    assert jbpy.core._coalesce_ranges(ranges, 10) == expected
+
+
+class RecordingPositionalReader(jbpy.core.PositionalReader):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.preads = []
+
+    def pread(self, size, offset):
+        self.preads.append((offset, size))
+        return super().pread(size, offset)
+
+
+def test_load_planned(tmp_path):
+    ntf = populated_nitf()
+    data = dump_to_bytes(ntf)
+
+    file = CountingBytesIO(data)
+    planned = jbpy.core.Jbp().load(file, max_workers=4)
+    assert planned == ntf
+    assert file.tell() == len(data)
+    # file header (2), all subheaders coalesced (1), and the TRE_OVERFLOW DES data
+    assert file.num_reads == 4
+
+    # subheaders separated by large data are fetched with separate positional reads
+    ntf = empty_nitf()
+    for idx in range(1, 6):
+        add_imseg(ntf)
+        ntf["FileHeader"][f"LI{idx:03d}"].value = 100_000
+    add_txtseg(ntf)
+    ntf.finalize()
+    filename = tmp_path / "planned.ntf"
+    filename.write_bytes(dump_to_bytes(ntf))
+    with filename.open("rb") as f:
+        reader = RecordingPositionalReader(f)
+        planned = jbpy.core.Jbp().load(reader, max_workers=4)
+    assert planned == ntf
+    segments = [*ntf["ImageSegments"], *ntf["TextSegments"]]
+    subheader_ranges = {
+        (seg["subheader"].get_offset(), seg["subheader"].get_size()) for seg in segments
+    }
+    assert subheader_ranges <= set(reader.preads)
+
+
+@pytest.mark.parametrize("length_field", ("LISH001", "LRESH001"))
+def test_load_planned_zero_length_subheader(length_field):
+    ntf = populated_nitf()
+    data = bytearray(dump_to_bytes(ntf))
+    field = ntf["FileHeader"][length_field]
+    data[field.get_offset() : field.get_offset() + field.size] = b"0" * field.size
+
+    def load(**kwargs):
+        try:
+            jbp = jbpy.core.Jbp().load(io.BytesIO(data), **kwargs)
+            for seglist_name in jbpy.core.Jbp._SEGMENT_LENGTH_FIELDS:
+                list(jbp[seglist_name])
+            return jbp
+        except Exception as exc:
+            return type(exc)
+
+    # segments are located by the length fields, as when loading lazily
+    lazy = load(lazy=True)
+    assert lazy is not IndexError
+    assert load(max_workers=4) == lazy
+
+
+class BytesRangeReader:
+    def __init__(self, data):
+        self.data = data
+        self.requests = []
+
+    async def read_range(self, offset, length):
+        self.requests.append((offset, length))
+        await asyncio.sleep(0)
+        return self.data[offset : offset + length]
+
+
+class HttpRangeReader:
+    def __init__(self, session, url):
+        self.session = session
+        self.url = url
+
+    async def read_range(self, offset, length):
+        headers = {"Range": f"bytes={offset}-{offset + length - 1}"}
+        async with self.session.get(self.url, headers=headers) as response:
+            response.raise_for_status()
+            return await response.read()
+
+
+def test_aload(monkeypatch):
+    ntf = populated_nitf()
+    data = dump_to_bytes(ntf)
+    reader = BytesRangeReader(data)
+
+    loaded = asyncio.run(jbpy.aload(reader))
+    assert loaded == ntf
+    # file header (2) and all subheaders, coalesced with the TRE_OVERFLOW DES data (1)
+    assert len(reader.requests) == 3
+
+    # data outside of the fetched subheaders is fetched when parsing needs it
+    monkeypatch.setattr(jbpy.core, "_COALESCE_GAP", 0)
+    uncoalesced = BytesRangeReader(data)
+    assert asyncio.run(jbpy.aload(uncoalesced, max_concurrency=2)) == ntf
+    (des,) = [
+        seg["DESDATA"]
+        for seg in ntf["DataExtensionSegments"]
+        if seg["subheader"]["DESID"].value == "TRE_OVERFLOW"
+    ]
+    assert (des.get_offset(), des.get_size()) in uncoalesced.requests
+    monkeypatch.undo()
+
+    async def read_data(component):
+        subfile = component.as_async_filelike(reader)
+        assert await subfile.read(3) == data[subfile.offset : subfile.offset + 3]
+        subfile.seek(0)
+        return b"".join([chunk async for chunk in subfile.iter_chunks(7)])
+
+    data_field = loaded["ImageSegments"][1]["Data"]
+    expected = data[data_field.get_offset() :][: data_field.get_size()]
+    assert asyncio.run(read_data(data_field)) == expected
+
+    off = asyncio.run(jbpy.aload(BytesRangeReader(data), validation="off"))
+    assert off == ntf
+
+    with pytest.raises(ValueError):
+        asyncio.run(jbpy.aload(BytesRangeReader(data[:100])))
+
+
+def test_aload_http(tmp_path):
+    ntf = populated_nitf()
+    (tmp_path / "populated.ntf").write_bytes(dump_to_bytes(ntf))
+
+    async def load(url):
+        async with aiohttp.ClientSession() as session:
+            reader = HttpRangeReader(session, url)
+            loaded = await jbpy.aload(reader)
+            data_field = loaded["ImageSegments"][0]["Data"]
+            return loaded, await data_field.as_async_filelike(reader).read()
+
+    request_log = []
+    with test.utils.static_http_server(tmp_path, request_log) as server_url:
+        loaded, image_data = asyncio.run(load(f"{server_url}/populated.ntf"))
+    assert loaded == ntf
+    data_field = ntf["ImageSegments"][0]["Data"]
+    assert len(image_data) == data_field.get_size()
+    assert len(request_log) == 4
+    assert all(range_header is not None for _, _, range_header in request_log)
+
+
+def test_segment_table():
+    ntf = populated_nitf()
+    header = ntf["FileHeader"]
+    kinds = {
+        "image": "ImageSegments",
+        "graphic": "GraphicSegments",
+        "text": "TextSegments",
+        "des": "DataExtensionSegments",
+        "res": "ReservedExtensionSegments",
+    }
+    for kind, seglist_name in kinds.items():
+        table = header.segment_table(kind)
+        segments = ntf[seglist_name]
+        assert len(table) == len(segments)
+        assert list(table.offsets) == [seg.get_offset() for seg in segments]
+        assert list(table.subheader_lengths) == [
+            seg["subheader"].get_size() for seg in segments
+        ]
+        assert list(table.data_lengths) == [
+            seg._children[-1].get_size() for seg in segments
+        ]
+
+    assert len(jbpy.core.Jbp()["FileHeader"].segment_table("image")) == 0
+    with pytest.raises(ValueError, match="unknown segment kind"):
+        header.segment_table("images")
+
+
+def test_probe(tmp_path, monkeypatch):
+    header = jbpy.core.Jbp()["FileHeader"]
+    for name, (offset, size) in jbpy.core._PROBE_FIELDS.items():
+        assert (header[name].get_offset(), header[name].size) == (offset, size)
+    assert header["NUMI"].get_offset() == jbpy.core._PROBE_COUNTS_OFFSET
+
+    small = populated_nitf()
+    many = empty_nitf()
+    for _ in range(100):
+        add_imseg(many)
+    many.finalize()
+    assert many["FileHeader"]["HL"].value > jbpy.core._PROBE_SIZE
+
+    for ntf in (small, many):
+        filename = tmp_path / "probe.ntf"
+        filename.write_bytes(dump_to_bytes(ntf))
+        expected = {
+            name: ntf["FileHeader"][name].value
+            for name in ("FHDR", "FVER", "CLEVEL", "FSCLAS", "FL", "HL")
+        }
+        expected.update(
+            NUMI=len(ntf["ImageSegments"]),
+            NUMS=len(ntf["GraphicSegments"]),
+            NUMT=len(ntf["TextSegments"]),
+            NUMDES=len(ntf["DataExtensionSegments"]),
+            NUMRES=len(ntf["ReservedExtensionSegments"]),
+        )
+
+        with monkeypatch.context() as m:
+            m.setattr(jbpy.core.Field, "__init__", None)
+            result = jbpy.probe(filename)
+            with filename.open("rb") as file:
+                assert jbpy.probe(file) == result
+        assert dataclasses.asdict(result) == expected
+
+    with pytest.raises(ValueError, match="too short"):
+        jbpy.probe(io.BytesIO(b"NITF02.10"))
+    with pytest.raises(ValueError, match="ends before"):
+        jbpy.probe(io.BytesIO(dump_to_bytes(many)[:500]))
+
+
+class StreamReader:
+    """Non-seekable stream returning short reads, like a socket"""
+
+    def __init__(self, data, max_read):
+        self.file = io.BytesIO(data)
+        self.max_read = max_read
+
+    def read(self, size):
+        return self.file.read(min(size, self.max_read))
+
+
+def test_iter_load():
+    ntf = populated_nitf()
+    data = dump_to_bytes(ntf)
+
+    loaded = jbpy.core.Jbp()
+    events = list(loaded.iter_load(StreamReader(data, 100), chunk_size=64))
+    assert loaded == ntf
+
+    assert events[0].kind == "file_header"
+    assert events[0].component is loaded["FileHeader"]
+    segments = [
+        seg
+        for seglist_name in jbpy.core.Jbp._SEGMENT_LENGTH_FIELDS
+        for seg in loaded[seglist_name]
+    ]
+    subheader_events = [event for event in events if event.kind == "subheader"]
+    assert [event.component for event in subheader_events] == [
+        seg["subheader"] for seg in segments
+    ]
+    assert [event.offset for event in subheader_events] == [
+        seg.get_offset() for seg in segments
+    ]
+
+    # data chunks, including those the TRE_OVERFLOW DES subheader had to read, reassemble the data
+    for seg in segments:
+        data_component = seg._children[-1]
+        chunks = [event for event in events if event.component is data_component]
+        assert all(len(event.data) <= 64 for event in chunks)
+        assert [event.offset for event in chunks] == [
+            data_component.get_offset() + 64 * n for n in range(len(chunks))
+        ]
+        start = data_component.get_offset()
+        assert (
+            b"".join(event.data for event in chunks)
+            == data[start : start + data_component.get_size()]
+        )
+
+    with pytest.raises(io.UnsupportedOperation):
+        jbpy.core._ForwardReader(io.BytesIO(data)).read()
+
+
+def test_iter_load_pipe():
+    ntf = populated_nitf()
+    data = dump_to_bytes(ntf)
+
+    read_fd, write_fd = os.pipe()
+
+    def write():
+        with open(write_fd, "wb") as pipe:
+            pipe.write(data)
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        writer = executor.submit(write)
+        with open(read_fd, "rb", buffering=0) as stream:
+            loaded = jbpy.core.Jbp()
+            sizes = [len(event.data) for event in loaded.iter_load(stream)]
+        writer.result()
+    assert loaded == ntf
+    assert sum(sizes) == sum(
+        seg._children[-1].get_size()
+        for seglist_name in jbpy.core.Jbp._SEGMENT_LENGTH_FIELDS
+        for seg in loaded[seglist_name]
+    )
+
+
+def test_load_buffer(tmp_path):
+    ntf = populated_nitf()
+    data = dump_to_bytes(ntf)
+    data_field = ntf["ImageSegments"][1]["Data"]
+    start = data_field.get_offset()
+
+    for buffer in (data, bytearray(data), memoryview(data)):
+        loaded = jbpy.core.Jbp().load_buffer(buffer)
+        assert loaded == ntf
+        view = loaded["ImageSegments"][1]["Data"].as_filelike(buffer).getbuffer()
+        assert view.obj is memoryview(buffer).obj
+        assert view == data[start : start + data_field.size]
+
+    filename = tmp_path / "file.ntf"
+    filename.write_bytes(data)
+    with filename.open("rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            loaded = jbpy.core.Jbp().load_buffer(mm)
+            assert loaded == ntf
+            subfile = loaded["ImageSegments"][1]["Data"].as_filelike(mm)
+            with subfile.getbuffer() as view:
+                assert view == data[start : start + data_field.size]
+            assert subfile.read() == data[start : start + data_field.size]
+        # load_buffer does not keep the mmap exported
+        assert mm.closed
+
+
+def test_subfile_getbuffer():
+    data = bytearray(b"0123456789")
+    subfile = jbpy.core.SubFile(io.BytesIO(data), 2, 5)
+    assert subfile.getbuffer() == b"23456"
+
+    subfile = jbpy.core.SubFile(data, 2, 5)
+    assert subfile.read(2) == b"23"
+    subfile.seek(-1, os.SEEK_END)
+    assert subfile.readline() == b"6"
+    view = subfile.getbuffer()
+    data[2] = ord("x")
+    assert view == b"x3456"
+
+
+@pytest.mark.parametrize("mode", ({}, {"buffered": True}, {"lazy": True}))
+def test_load_validation(mode, caplog):
+    ntf = populated_nitf()
+    ntf["FileHeader"]["FSCLAS"].encoded_value = b"X"
+    ntf["ImageSegments"][1]["subheader"]["ISCLAS"].encoded_value = b"X"
+    data = dump_to_bytes(ntf)
+
+    def invalid_warnings():
+        return sorted(
+            rec.message.split(":")[0]
+            for rec in caplog.records
+            if "Invalid field value" in rec.message
+        )
+
+    def load_and_access(validation):
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="jbpy.core"):
+            loaded = jbpy.core.Jbp().load(
+                io.BytesIO(data), validation=validation, **mode
+            )
+            loaded["ImageSegments"][1]
+        return loaded
+
+    load_and_access("eager")
+    expected = invalid_warnings()
+    assert {"FSCLAS", "ISCLAS"} <= set(expected)
+
+    loaded = load_and_access("deferred")
+    assert invalid_warnings() == expected
+    assert loaded == ntf
+
+    loaded = load_and_access("off")
+    assert not invalid_warnings()
+    with caplog.at_level(logging.WARNING, logger="jbpy.core"):
+        invalid = loaded.validate()
+    assert sorted(field.name for field in invalid) == expected
+    assert invalid_warnings() == expected
+
+    # fields set after loading are validated eagerly
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="jbpy.core"):
+        loaded["FileHeader"]["FSCTLH"].encoded_value = b"\x00\x00"
+    assert invalid_warnings() == ["FSCTLH"]
+
+    with pytest.raises(ValueError, match="invalid validation policy"):
+        jbpy.core.Jbp().load(io.BytesIO(data), validation="sometimes", **mode)
+
+
+def test_dump_validation(caplog):
+    ntf = populated_nitf()
+    ntf["FileHeader"]["FSCLAS"].encoded_value = b"X"
+    for validation, expected in (("off", 0), ("eager", 1), ("deferred", 1)):
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="jbpy.core"):
+            ntf.dump(io.BytesIO(), validation=validation)
+        assert sum("FSCLAS" in rec.message for rec in caplog.records) == expected
+
+
+class WriteCountingBytesIO(io.BytesIO):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_writes = 0
+
+    def write(self, data):
+        self.num_writes += 1
+        return super().write(data)
+
+
+def dump_per_field(component, fd):
+    """Write each field with its own call, as dump did before headers were encoded in one buffer"""
+    if isinstance(component, jbpy.core._UnparsedComponent):
+        component = component.parse()
+    if isinstance(component, jbpy.core.ComponentCollection):
+        for child in component._children:
+            dump_per_field(child, fd)
+    else:
+        component._dump_impl(fd)
+
+
+def iter_fields(component):
+    if isinstance(component, jbpy.core.ComponentCollection):
+        for child in component._children:
+            yield from iter_fields(child)
+    elif isinstance(component, jbpy.core.Field):
+        yield component
+
+
+def test_dump_one_write_per_header():
+    ntf = populated_nitf()
+    expected = io.BytesIO()
+    dump_per_field(ntf, expected)
+
+    file = WriteCountingBytesIO()
+    assert ntf.dump(file) == ntf.get_size()
+    assert file.getvalue() == expected.getvalue()
+    segments = [
+        seg
+        for seglist_name in jbpy.core.Jbp._SEGMENT_LENGTH_FIELDS
+        for seg in ntf[seglist_name]
+    ]
+    # the file header and each subheader; data is sought past
+    assert file.num_writes == 1 + len(segments)
+
+    header = ntf["FileHeader"]
+    assert header.to_bytes() == expected.getvalue()[: header.get_size()]
+    subheader = segments[0]["subheader"]
+    buffer = bytearray(b"x" * (subheader.get_size() + 10))
+    assert subheader.dump_into(buffer, 5) == subheader.get_size()
+    start = subheader.get_offset()
+    assert buffer[5:-5] == expected.getvalue()[start : start + subheader.get_size()]
+    assert buffer[:5] == buffer[-5:] == b"xxxxx"
+
+    # data is left untouched
+    whole = bytearray(b"x" * ntf.get_size())
+    ntf.dump_into(whole)
+    data_field = segments[0]["Data"]
+    data_start = data_field.get_offset()
+    assert whole[data_start : data_start + data_field.get_size()] == b"x" * (
+        data_field.get_size()
+    )
+    assert whole[:data_start] == expected.getvalue()[:data_start]
+
+
+@pytest.mark.parametrize("mode", ({"buffered": True}, {"lazy": True}, "load_buffer"))
+def test_dump_clean_spans_verbatim(monkeypatch, mode):
+    data = dump_to_bytes(populated_nitf())
+    if mode == "load_buffer":
+        loaded = jbpy.core.Jbp().load_buffer(data)
+    else:
+        loaded = jbpy.core.Jbp().load(io.BytesIO(data), **mode)
+
+    encoded = []
+    original_dump_into_impl = jbpy.core.Field._dump_into_impl
+
+    def recording_dump_into_impl(self, buffer, offset):
+        encoded.append(self)
+        return original_dump_into_impl(self, buffer, offset)
+
+    monkeypatch.setattr(jbpy.core.Field, "_dump_into_impl", recording_dump_into_impl)
+
+    # unmodified headers are written as they were read
+    file = io.BytesIO()
+    loaded.dump(file)
+    assert file.getvalue() == data[: len(file.getvalue())]
+    assert not encoded
+
+    # nested collections keep views into the buffer of the outermost one, not copies
+    def check_shared(component):
+        for child in getattr(component, "_children", ()):
+            if isinstance(child, jbpy.core.ComponentCollection):
+                assert child._raw_source is None
+                if component._raw is not None:
+                    assert child._raw[0] is component._raw[0]
+                check_shared(child)
+
+    check_shared(loaded)
+    assert loaded["FileHeader"]["UDHD"]._raw[0] is loaded["FileHeader"]._raw[0]
+
+    # only modified headers are encoded again
+    subheader = loaded["ImageSegments"][1]["subheader"]
+    subheader["ISCLAS"].value = "S"
+    loaded["FileHeader"]["UDHD"][0]["SEC_ID"].value = "modified"
+    expected = io.BytesIO()
+    dump_per_field(loaded, expected)
+    file = io.BytesIO()
+    loaded.dump(file)
+    assert file.getvalue() == expected.getvalue()
+    encoded_ids = {id(fld) for fld in encoded}
+    assert id(subheader["ISCLAS"]) in encoded_ids
+    assert id(loaded["FileHeader"]["UDHD"][0]["SEC_ID"]) in encoded_ids
+    other_subheaders = [
+        loaded[seglist_name][idx]["subheader"]
+        for seglist_name in jbpy.core.Jbp._SEGMENT_LENGTH_FIELDS
+        for idx in range(len(loaded[seglist_name]))
+        if loaded[seglist_name][idx]["subheader"] is not subheader
+    ]
+    assert other_subheaders
+    assert not any(
+        id(fld) in encoded_ids for sub in other_subheaders for fld in iter_fields(sub)
+    )
+    for component in (loaded["FileHeader"], subheader, other_subheaders[0]):
+        start = component.get_offset()
+        end = start + component.get_size()
+        assert component.to_bytes() == expected.getvalue()[start:end]
+
+    # resizing discards the loaded bytes
+    subheader["NICOM"].value = 1
+    subheader["ICOM1"].value = "added"
+    expected = io.BytesIO()
+    dump_per_field(loaded, expected)
+    file = io.BytesIO()
+    loaded.dump(file)
+    assert file.getvalue() == expected.getvalue()
+
+    # finalize leaves unmodified subheaders alone
+    loaded.finalize()
+    assert all(
+        sub._raw is not None
+        for sub in other_subheaders
+        if isinstance(sub, jbpy.core.ComponentCollection)
+    )
+    assert copy.deepcopy(loaded) == loaded
+
+
+def test_stream_writer(tmp_path):
+    jbp = populated_nitf()
+    segments = [
+        seg
+        for seglist_name in jbpy.core.Jbp._SEGMENT_LENGTH_FIELDS
+        for seg in jbp[seglist_name]
+    ]
+    rng = random.Random(1234)
+    payloads = {}
+    filename = tmp_path / "streamed.ntf"
+    with filename.open("wb") as file:
+        file.write(b"prefix")
+        with jbpy.StreamWriter(file, jbp, chunk_size=7) as writer:
+            for idx, seg in enumerate(segments):
+                if not isinstance(seg._children[-1], jbpy.core.BinaryPlaceholder):
+                    assert writer.write_segment(seg) == seg._children[-1].get_size()
+                    continue
+                payload = rng.randbytes(rng.randrange(0, 100))
+                payloads[id(seg._children[-1])] = payload
+                data = [
+                    payload,
+                    io.BytesIO(payload),
+                    io.BufferedReader(io.BytesIO(payload)),
+                    (payload[n : n + 10] for n in range(0, len(payload), 10)),
+                ][idx % 4]
+                assert writer.write_segment(seg, data) == len(payload)
+        assert writer.closed
+        assert file.tell() == len(b"prefix") + jbp.get_size()
+
+    contents = filename.read_bytes()[len(b"prefix") :]
+    assert jbp["FileHeader"]["FL"].value == len(contents)
+    clevel = jbp["FileHeader"]["CLEVEL"].value
+    jbp.update_clevel()
+    assert jbp["FileHeader"]["CLEVEL"].value == clevel
+    loaded = jbpy.core.Jbp().load(io.BytesIO(contents))
+    assert loaded == jbp
+    for seg in segments:
+        data_component = seg._children[-1]
+        if id(data_component) in payloads:
+            start = data_component.get_offset()
+            end = start + data_component.get_size()
+            assert contents[start:end] == payloads[id(data_component)]
+
+
+def test_stream_writer_errors():
+    jbp = empty_nitf()
+    add_imseg(jbp)
+    add_txtseg(jbp)
+    imseg = jbp["ImageSegments"][0]
+    txtseg = jbp["TextSegments"][0]
+
+    with jbpy.StreamWriter(io.BytesIO(), jbp) as writer:
+        with pytest.raises(ValueError, match="not the next segment"):
+            writer.write_segment(txtseg, b"text")
+        writer.write_segment(imseg, b"pixels")
+        with pytest.raises(ValueError, match="not the next segment"):
+            writer.write_segment(imseg, b"pixels")
+        with pytest.raises(ValueError, match="was not written"):
+            writer.close()
+    with pytest.raises(ValueError, match="closed"):
+        writer.write_segment(txtseg, b"text")
+
+    # headers must keep the size they were written with
+    file = io.BytesIO()
+    writer = jbpy.StreamWriter(file, jbp)
+    writer.write_segment(imseg, b"pixels")
+    imseg["subheader"]["NICOM"].value = 1
+    writer.write_segment(txtseg, b"text")
+    with pytest.raises(ValueError, match="changed size"):
+        writer.close()
+
+    # nothing is patched if the block raises
+    file = io.BytesIO()
+    with pytest.raises(RuntimeError):
+        with jbpy.StreamWriter(file, jbp) as writer:
+            header = file.getvalue()
+            raise RuntimeError()
+    assert file.getvalue() == header
+
+
+def copy_file_range_unsupported(*args):
+    raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+
+@pytest.mark.parametrize(
+    "patches",
+    (
+        {},
+        {"copy_file_range": copy_file_range_unsupported},
+        {"copy_file_range": None, "sendfile": None},
+    ),
+)
+@pytest.mark.parametrize("in_memory", (False, True))
+def test_dump_data_source(tmp_path, monkeypatch, patches, in_memory):
+    ntf = populated_nitf()
+    data = bytearray(dump_to_bytes(ntf))
+    data_components = [
+        seg._children[-1]
+        for seglist_name in jbpy.core.Jbp._SEGMENT_LENGTH_FIELDS
+        for seg in ntf[seglist_name]
+    ]
+    rng = random.Random(1234)
+    for component in data_components:
+        if isinstance(component, jbpy.core.BinaryPlaceholder):
+            start = component.get_offset()
+            data[start : start + component.size] = rng.randbytes(component.size)
+    original = tmp_path / "original.ntf"
+    original.write_bytes(data)
+
+    for name, value in patches.items():
+        if value is None:
+            monkeypatch.delattr(os, name, raising=False)
+        else:
+            monkeypatch.setattr(os, name, value)
+
+    output = tmp_path / "output.ntf"
+    with original.open("rb") as source:
+        loaded = jbpy.core.Jbp().load(source)
+        # grow a subheader so that all of the following data moves
+        loaded["ImageSegments"][0]["subheader"]["NICOM"].value += 1
+        loaded.update_lengths()
+        if in_memory:
+            source = io.BytesIO(data)
+        with output.open("wb") as out:
+            loaded.dump(out, data_source=source)
+
+    assert output.stat().st_size == loaded.get_size()
+    with output.open("rb") as out:
+        rewritten = jbpy.core.Jbp().load(out)
+        assert rewritten == loaded
+        for seglist_name in jbpy.core.Jbp._SEGMENT_LENGTH_FIELDS:
+            for before, after in zip(ntf[seglist_name], rewritten[seglist_name]):
+                before_data = before._children[-1]
+                after_data = after._children[-1]
+                start = before_data.get_offset()
+                out.seek(after_data.get_offset())
+                assert out.read(after_data.get_size()) == bytes(
+                    data[start : start + before_data.get_size()]
+                )
+
+
+@pytest.mark.parametrize("mode", ({}, {"lazy": True}))
+def test_patch_in_place(tmp_path, mode):
+    ntf = populated_nitf()
+    data = dump_to_bytes(ntf)
+    filename = tmp_path / "patch.ntf"
+    filename.write_bytes(data)
+
+    with filename.open("r+b") as file:
+        loaded = jbpy.core.Jbp().load(file, **mode)
+        assert loaded.patch_in_place(file) == 0
+
+        loaded["FileHeader"]["FSCLAS"].value = "S"
+        loaded["FileHeader"]["FSCLSY"].value = "US"
+        loaded["FileHeader"]["OSTAID"].value = "Elsewhere"
+        loaded["ImageSegments"][1]["subheader"]["ISCLAS"].value = "S"
+        loaded["FileHeader"]["UDHD"][0]["SEC_ID"].value = "patched"
+        # setting an unchanged value is not a modification
+        loaded["FileHeader"]["FHDR"].value = "NITF"
+        written = loaded.patch_in_place(file)
+        assert loaded.patch_in_place(file) == 0
+        file.flush()
+        assert written == 1 + 2 + 10 + 1 + 12
+
+        patched = filename.read_bytes()
+        assert len(patched) == len(data)
+        assert jbpy.core.Jbp().load(io.BytesIO(patched)) == loaded
+        expected_fields = [
+            loaded["FileHeader"]["FSCLAS"],
+            loaded["FileHeader"]["FSCLSY"],
+            loaded["FileHeader"]["OSTAID"],
+            loaded["ImageSegments"][1]["subheader"]["ISCLAS"],
+            loaded["FileHeader"]["UDHD"][0]["SEC_ID"],
+        ]
+    changed = [idx for idx, (a, b) in enumerate(zip(data, patched)) if a != b]
+    assert all(
+        any(
+            fld.get_offset() <= idx < fld.get_offset() + fld.size
+            for fld in expected_fields
+        )
+        for idx in changed
+    )
+
+
+class TellCountingBytesIO(io.BytesIO):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_tells = 0
+
+    def tell(self):
+        self.num_tells += 1
+        return super().tell()
+
+
+def test_load_tells_per_collection():
+    ntf = populated_nitf()
+    header = ntf["FileHeader"]
+    file = TellCountingBytesIO(header.to_bytes())
+    loaded = jbpy.core.FileHeader("FileHeader").load(file)
+    assert loaded == header
+    # once for the header and each of its TREs, not for every field
+    num_fields = sum(1 for _ in iter_fields(header))
+    assert file.num_tells < num_fields / 10
+
+
+def test_patch_in_place_refuses(tmp_path):
+    ntf = populated_nitf()
+    data = dump_to_bytes(ntf)
+
+    with pytest.raises(ValueError, match="only loaded files"):
+        ntf.patch_in_place(io.BytesIO(data))
+
+    def edits():
+        yield lambda jbp: jbp["FileHeader"]["FTITLE"].__setattr__("size", 81)
+        yield lambda jbp: jbp["ImageSegments"][0]["Data"].__setattr__("size", 1)
+        yield lambda jbp: jbp["ImageSegments"][0]["subheader"]["NICOM"].__setattr__(
+            "value", 1
+        )
+        yield lambda jbp: jbp["FileHeader"]["NUMDES"].__setattr__(
+            "value", len(jbp["DataExtensionSegments"]) - 1
+        )
+        yield lambda jbp: jbp["ImageSegments"][0]["subheader"]._insert_after(
+            jbp["ImageSegments"][0]["subheader"]["IM"],
+            jbpy.core.BinaryPlaceholder("extra", 1),
+        )
+
+    for edit in edits():
+        file = io.BytesIO(data)
+        loaded = jbpy.core.Jbp().load(file)
+        edit(loaded)
+        loaded["FileHeader"]["FSCLAS"].value = "S"
+        with pytest.raises(ValueError, match="since loading"):
+            loaded.patch_in_place(file)
+        assert file.getvalue() == data
+
+
+@pytest.mark.parametrize("load_kwargs", ({}, {"lazy": True}, {"buffered": True}))
+def test_patch_in_place_count_unchanged(load_kwargs):
+    data = dump_to_bytes(populated_nitf())
+    file = io.BytesIO(data)
+    loaded = jbpy.core.Jbp().load(file, **load_kwargs)
+    header = loaded["FileHeader"]
+    lengths = [fld.encoded_value for fld in header.find_all("LI(SH)?\\d+")]
+
+    # setting a count to its current value keeps the dependent fields
+    header["NUMI"].value = header["NUMI"].value
+    assert [fld.encoded_value for fld in header.find_all("LI(SH)?\\d+")] == lengths
+    header["FSCLAS"].value = "S"
+    assert loaded.patch_in_place(file) == 1
+    expected = bytearray(data)
+    expected[header["FSCLAS"].get_offset()] = ord("S")
+    assert file.getvalue() == expected
+
+    # changing the count and back replaces them with defaults of the same size
+    header["NUMI"].value += 1
+    header["NUMI"].value -= 1
+    with pytest.raises(ValueError, match="LISH001 was replaced since loading"):
+        loaded.patch_in_place(file)
+    assert file.getvalue() == expected
+
+
 def test_as_filelike(tmp_path):
     empty = empty_nitf()
     filename = tmp_path / "file.nitf"
@@ -793,6 +2108,93 @@ def test_subfile(tmp_path):
         assert subfile.readable()
 
 
+@pytest.mark.parametrize("fallback", (False, True))
+def test_positional_reader(tmp_path, monkeypatch, fallback):
+    if fallback:
+        monkeypatch.delattr(os, "pread", raising=False)
+        monkeypatch.delattr(os, "preadv", raising=False)
+    ntf = populated_nitf()
+    data = bytearray(dump_to_bytes(ntf))
+    data_fields = [
+        ntf[name][idx]["Data"]
+        for name in ("ImageSegments", "TextSegments")
+        for idx in range(len(ntf[name]))
+    ]
+    for field in data_fields:
+        offset = field.get_offset()
+        data[offset : offset + field.size] = random.randbytes(field.size)
+    filename = tmp_path / "file.ntf"
+    filename.write_bytes(data)
+
+    with filename.open("rb") as file:
+        reader = jbpy.core.PositionalReader(file)
+        assert reader.read(4) == data[:4]
+        assert reader.tell() == 4
+        assert reader.seek(-2, os.SEEK_END) == len(data) - 2
+        assert reader.read() == data[-2:]
+        assert reader.pread(3, 5) == data[5:8]
+        buf = bytearray(10)
+        assert reader.preadinto(buf, len(data) - 4) == 4
+        assert buf[:4] == data[-4:]
+        assert file.tell() == 0
+
+        reader.seek(0)
+        assert jbpy.core.Jbp().load(reader) == ntf
+        reader.seek(0)
+        assert jbpy.core.Jbp().load(reader, buffered=True) == ntf
+
+        def read_all(field):
+            subfile = field.as_filelike(reader)
+            chunks = []
+            while chunk := subfile.read(7):
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(read_all, data_fields * 20))
+        for field, result in zip(data_fields * 20, results):
+            offset = field.get_offset()
+            assert result == data[offset : offset + field.size]
+
+        subfile = jbpy.core.SubFile(reader, 2, 10)
+        buf = bytearray(20)
+        assert subfile.readinto(buf) == 10
+        assert buf[:10] == data[2:12]
+        subfile.seek(0)
+        assert b"".join(subfile.readlines()) == data[2:12]
+
+
+def test_subfile_rawio():
+    data = bytes(range(256)) * 100
+    subfile = jbpy.core.SubFile(io.BytesIO(data), 1000, 20000)
+    assert isinstance(subfile, io.RawIOBase)
+    assert subfile.seekable() and subfile.readable() and not subfile.writable()
+    assert (subfile.offset, subfile.length) == (1000, 20000)
+    with pytest.raises(io.UnsupportedOperation):
+        subfile.fileno()
+
+    buffered = io.BufferedReader(subfile, buffer_size=4096)
+    assert buffered.read(10) == data[1000:1010]
+    assert buffered.peek(1)[:1] == data[1010:1011]
+    buffered.seek(-5, os.SEEK_END)
+    assert buffered.read() == data[20995:21000]
+    buffered.seek(0)
+    assert buffered.read() == data[1000:21000]
+
+    subfile = jbpy.core.SubFile(io.BytesIO(data), 1000, 20000)
+    assert subfile.readall() == data[1000:21000]
+    subfile.seek(0)
+    array = np.empty(5000, dtype=np.uint32)
+    assert subfile.readinto(array) == 20000
+    assert array.tobytes() == data[1000:21000]
+
+    with subfile:
+        pass
+    assert subfile.closed
+    with pytest.raises(ValueError):
+        subfile.read()
+
+
 def test_subfile_readinto():
     all_data = bytearray(
         "".join(random.choices(string.ascii_letters + string.digits, k=1000)).encode()
@@ -0,0 +1,106 @@
+import io
+import os
+
+import pytest
+import smart_open
+
+import jbpy
+import jbpy.io
+import test.utils
+
+
+class RecordingBytesIO(io.BytesIO):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append((self.tell(), size))
+        return super().read(size)
+
+
+def test_cached_range_reader():
+    data = bytes(range(256)) * 40  # 10240 bytes
+    file = RecordingBytesIO(data)
+    reader = jbpy.io.CachedRangeReader(
+        file, block_size=1024, max_blocks=4, read_ahead=2
+    )
+
+    assert reader.read(10) == data[:10]
+    assert file.reads == [(0, 1024)]
+    assert reader.read(10) == data[10:20]
+    reader.seek(1000)
+    assert reader.read(100) == data[1000:1100]
+    # sequential miss reads ahead
+    assert file.reads == [(0, 1024), (1024, 3072)]
+    assert reader.read(2000) == data[1100:3100]
+    assert len(file.reads) == 2
+
+    # blocks are evicted least recently used first
+    reader.seek(8000)
+    assert reader.read(10) == data[8000:8010]
+    reader.seek(0)
+    assert reader.read(10) == data[:10]
+    assert file.reads[-2:] == [(7168, 1024), (0, 1024)]
+
+    # reads larger than the cache bypass it
+    reader.seek(100)
+    assert reader.read(5000) == data[100:5100]
+    assert file.reads[-1] == (100, 5000)
+
+    assert reader.seek(-5, os.SEEK_END) == len(data) - 5
+    assert reader.read() == data[-5:]
+    assert reader.read(10) == b""
+    reader.seek(len(data) + 10)
+    assert reader.read(10) == b""
+
+    buf = bytearray(20)
+    reader.seek(1020)
+    assert reader.readinto(buf) == 20
+    assert buf == data[1020:1040]
+
+    reader.seek(0)
+    assert io.BufferedReader(reader).read() == data
+
+    reader.close()
+    assert not file.closed
+    with pytest.raises(ValueError):
+        reader.read()
+
+    with pytest.raises(ValueError, match="invalid cache configuration"):
+        jbpy.io.CachedRangeReader(file, block_size=0)
+
+
+def many_des_file(path):
+    jbp = jbpy.Jbp()
+    jbp["FileHeader"]["NUMDES"].value = 40
+    for idx in range(1, 41):
+        jbp["FileHeader"][f"LD{idx:03d}"].value = 3000
+    jbp.finalize()
+    with path.open("wb") as file:
+        jbp.dump(file)
+        file.seek(jbp["FileHeader"]["FL"].value - 1)
+        file.write(b"\0")
+    return jbp
+
+
+@pytest.mark.parametrize("mode", ({}, {"buffered": True}, {"lazy": True}))
+def test_cached_range_reader_http(tmp_path, mode):
+    jbp = many_des_file(tmp_path / "many_des.ntf")
+
+    request_log = []
+    with test.utils.static_http_server(tmp_path, request_log) as server_url:
+        url = f"{server_url}/many_des.ntf"
+        with smart_open.open(url, "rb") as file:
+            loaded = jbpy.Jbp().load(file, **mode)
+            assert loaded == jbp
+        uncached_requests = len(request_log)
+
+        request_log.clear()
+        with smart_open.open(url, "rb") as file:
+            loaded = jbpy.Jbp().load(jbpy.io.CachedRangeReader(file), **mode)
+            assert loaded == jbp
+        assert len(request_log) <= 2
+        if not mode:
+            # DES subheaders are parsed without seeking backwards, so smart_open's read-ahead suffices
+            assert uncached_requests == 1
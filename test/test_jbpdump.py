@@ -52,6 +52,24 @@ def test_jitc_quicklook():
     assert proc.stdout[-2:] == b"\x00\x40"  # CGM END METAFILE
 
 
+def test_text_segment(tmp_path):
+    text = b"Text line\n" * 9_000
+    jbp = jbpy.Jbp()
+    jbp["FileHeader"]["NUMT"].value = 1
+    jbp["FileHeader"]["LT001"].value = len(text)
+    jbp.finalize()
+    filename = tmp_path / "text.ntf"
+    with filename.open("wb") as file:
+        jbp.dump(file)
+        file.seek(jbp["TextSegments"][0]["Data"].get_offset())
+        file.write(text)
+
+    proc = subprocess.run(
+        ["jbpdump", filename, "--text-segment", "0"], check=True, capture_output=True
+    )
+    assert proc.stdout == text
+
+
 @pytest.mark.skipif(
     "JBPY_JITC_QUICKLOOK_DIR" not in os.environ,
     reason="requires JITC Quick-Look data",
@@ -0,0 +1,128 @@
+import subprocess
+
+import pytest
+
+import jbpy.core
+
+
+def two_image_nitf():
+    ntf = jbpy.core.Jbp()
+    ntf["FileHeader"]["OSTAID"].value = "Here"
+    ntf["FileHeader"]["FSCLAS"].value = "U"
+    ntf["FileHeader"]["NUMI"].value = 2
+    for imseg in ntf["ImageSegments"]:
+        subheader = imseg["subheader"]
+        subheader["ISCLAS"].value = "U"
+        subheader["PVTYPE"].value = "INT"
+        subheader["IREP"].value = "MONO"
+        subheader["ICAT"].value = "SAR"
+        subheader["ABPP"].value = 8
+        subheader["IC"].value = "NC"
+        subheader["NBANDS"].value = 1
+        subheader["IREPBAND00001"].value = "M"
+        subheader["IMODE"].value = "B"
+        subheader["NBPR"].value = 1
+        subheader["NBPC"].value = 1
+        subheader["NPPBH"].value = 4
+        subheader["NPPBV"].value = 4
+        subheader["NROWS"].value = 4
+        subheader["NCOLS"].value = 4
+        subheader["NBPP"].value = 8
+        imseg["Data"].size = 16
+    ntf.finalize()
+    return ntf
+
+
+@pytest.mark.parametrize("jobs", ("1", "2"))
+def test_jbppatch(tmp_path, jobs):
+    filenames = []
+    for idx in range(3):
+        filename = tmp_path / f"file{idx}.ntf"
+        with filename.open("wb") as file:
+            two_image_nitf().dump(file)
+        filenames.append(filename)
+    original = filenames[0].read_bytes()
+
+    subprocess.run(
+        [
+            "jbppatch",
+            *filenames,
+            "--set",
+            "FileHeader/FSCLAS=R",
+            "--set",
+            "ImageSegments/*/subheader/ISCLAS=R",
+            "--set",
+            "FileHeader/OSTAID=There",
+            "--jobs",
+            jobs,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    for filename in filenames:
+        patched = filename.read_bytes()
+        assert len(patched) == len(original)
+        assert sum(a != b for a, b in zip(original, patched)) == 1 + 2 + 5
+        with filename.open("rb") as file:
+            jbp = jbpy.core.Jbp().load(file)
+        assert jbp["FileHeader"]["FSCLAS"].value == "R"
+        assert jbp["FileHeader"]["OSTAID"].value == "There"
+        for imseg in jbp["ImageSegments"]:
+            assert imseg["subheader"]["ISCLAS"].value == "R"
+
+
+def test_jbppatch_values(tmp_path):
+    filename = tmp_path / "file.ntf"
+    with filename.open("wb") as file:
+        two_image_nitf().dump(file)
+
+    subprocess.run(
+        [
+            "jbppatch",
+            filename,
+            "--set",
+            "FileHeader/FTITLE=Café Zürich",
+            "--set",
+            "FileHeader/FSCOP=3",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    with filename.open("rb") as file:
+        jbp = jbpy.core.Jbp().load(file)
+    assert jbp["FileHeader"]["FTITLE"].value == "Café Zürich"
+    assert jbp["FileHeader"]["FSCOP"].value == 3
+
+    original = filename.read_bytes()
+    for assignment, message in (
+        ("FileHeader/FBKGC=1,2,3", "FBKGC holds RGB values"),
+        ("FileHeader/FSCOP=three", "FSCOP requires an integer"),
+    ):
+        proc = subprocess.run(
+            ["jbppatch", filename, "--set", assignment], capture_output=True
+        )
+        assert proc.returncode == 1
+        assert message in proc.stderr.decode()
+    assert filename.read_bytes() == original
+
+
+def test_jbppatch_failure(tmp_path):
+    good = tmp_path / "good.ntf"
+    with good.open("wb") as file:
+        two_image_nitf().dump(file)
+    original = good.read_bytes()
+    missing = tmp_path / "missing.ntf"
+
+    proc = subprocess.run(
+        ["jbppatch", good, missing, "--set", "FileHeader/FSCLAS=R"],
+        capture_output=True,
+    )
+    assert proc.returncode == 1
+    assert str(missing) in proc.stderr.decode()
+    assert good.read_bytes() != original
+
+    proc = subprocess.run(
+        ["jbppatch", good, "--set", "FileHeader/NUMI=1"], capture_output=True
+    )
+    assert proc.returncode == 1
+    assert "since loading" in proc.stderr.decode()
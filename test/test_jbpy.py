@@ -1,3 +1,4 @@
+import importlib.metadata
 import io
 import json
 import os
@@ -5,6 +6,7 @@ import os
 import pytest
 
 import jbpy
+import jbpy.core
 import test.utils
 
 
@@ -118,3 +120,64 @@ def test_des_subheader_factory(desidver):
     des_subhdr2 = jbpy.des_subheader_factory(*desidver)
     des_subhdr2.load(buf)
     assert des_subhdr == des_subhdr2
+
+
+def test_plugin_registry_is_cached_and_lazy(monkeypatch):
+    registry = jbpy.core._TRE_REGISTRY
+    registry.reset()
+    num_scans = 0
+    real_entry_points = importlib.metadata.entry_points
+
+    def counting_entry_points(**kwargs):
+        nonlocal num_scans
+        num_scans += 1
+        return real_entry_points(**kwargs)
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", counting_entry_points)
+    for _ in range(3):
+        jbpy.tre_factory("SECTGA")
+        jbpy.tre_factory("NOTTRE")
+    assert num_scans == 1
+    # only the requested plugin has been imported
+    assert not isinstance(
+        registry._discovered()["SECTGA"], importlib.metadata.EntryPoint
+    )
+    assert isinstance(registry._discovered()["USE00A"], importlib.metadata.EntryPoint)
+
+
+def test_register_tre():
+    class MyTre(jbpy.core.Tre):
+        def __init__(self):
+            super().__init__("MYTRE")
+
+    assert isinstance(jbpy.tre_factory("MYTRE"), jbpy.core.UnknownTre)
+    jbpy.register_tre("MYTRE", MyTre)
+    try:
+        assert isinstance(jbpy.tre_factory("MYTRE"), MyTre)
+        assert jbpy.available_tres()["MYTRE"] is MyTre
+    finally:
+        jbpy.unregister_tre("MYTRE")
+    assert isinstance(jbpy.tre_factory("MYTRE"), jbpy.core.UnknownTre)
+    assert "MYTRE" not in jbpy.available_tres()
+
+    with pytest.raises(ValueError, match="must be 1-6 characters"):
+        jbpy.register_tre("TOOLONG", MyTre)
+    with pytest.raises(KeyError):
+        jbpy.unregister_tre("MYTRE")
+
+
+def test_register_des_subheader():
+    class MySubheader(jbpy.core.DataExtensionSubheader):
+        pass
+
+    jbpy.register_des_subheader("MY DES", 2, MySubheader)
+    try:
+        subhdr = jbpy.des_subheader_factory("MY DES", 2)
+        assert type(subhdr) is MySubheader
+        assert subhdr["DESID"].value == "MY DES"
+        assert ("MY DES", 2) in jbpy.available_des_subheaders()
+    finally:
+        jbpy.unregister_des_subheader("MY DES", 2)
+    assert type(jbpy.des_subheader_factory("MY DES", 2)) is (
+        jbpy.core.DataExtensionSubheader
+    )
@@ -38,12 +38,21 @@ def _run_aiohttp_server(app, loop, ready_event, stop_event, msg_queue):
 
 
 @contextlib.contextmanager
-def static_http_server(static_dir):
+def static_http_server(static_dir, request_log=None):
+    """Serve static_dir over HTTP, appending (method, path, Range header) of each request to request_log"""
     ready_event = threading.Event()
     stop_event = asyncio.Event()
     msg_queue = queue.Queue()
 
-    app = web.Application()
+    @web.middleware
+    async def log_requests(request, handler):
+        if request_log is not None:
+            request_log.append(
+                (request.method, request.path, request.headers.get("Range"))
+            )
+        return await handler(request)
+
+    app = web.Application(middlewares=[log_requests])
     app.add_routes([web.static("/", static_dir)])
 
     loop = asyncio.new_event_loop()